@@ -3,18 +3,77 @@ from ._version import VERSION
 __version__ = VERSION
 
 
-def prettify(toml_text):
+def prettify(toml_text, cache=None, stats=None, engine=None):
     """
     Prettifies and returns the TOML file content provided.
+
+    If a cache.PrettifyCache is given, the prettified content is looked up there first and stored there otherwise.
+
+    If a stats callable is given, the time and counters of every stage are reported to it (see prettytoml.stats).
+
+    The engine is one of the prettifier.ENGINE_* constants, ENGINE_FUSED by default. Both prettify the same, but
+    ENGINE_SEQUENTIAL, while slower, applies the prettifiers one after the other and so reports every one of them
+    as a stage of its own.
+    """
+    from .parser import parse_tokens
+    from .lexer import tokenize
+    from .prettifier import prettify as element_prettify, ALL, ENGINE_FUSED
+
+    if engine is None:
+        engine = ENGINE_FUSED
+    if stats is not None:
+        from .stats import clock
+
+    if cache is not None:
+        if stats is not None:
+            start = clock()
+        key = cache.key(toml_text, ALL)
+        cached = cache.get(key)
+        if stats is not None:
+            stats('cache', clock() - start, {'hits': int(cached is not None)})
+        if cached is not None:
+            return cached
+
+    if stats is not None:
+        start = clock()
+    tokens = tuple(tokenize(toml_text, is_top_level=True))     # As parse_tokens() would do anyway
+    if stats is not None:
+        stats('tokenize', clock() - start, {'tokens': len(tokens)})
+
+    elements = parse_tokens(tokens, stats=stats)
+    prettified = element_prettify(elements, engine=engine, stats=stats)
+
+    if stats is not None:
+        start = clock()
+    pieces = []
+    for pretty_element in prettified:
+        pretty_element.serialize_to(pieces.append)
+    prettified_text = ''.join(pieces)
+    if stats is not None:
+        stats('serialize', clock() - start, {'characters': len(prettified_text)})
+
+    if cache is not None:
+        cache.put(key, prettified_text)
+    return prettified_text
+
+
+def prettify_to(text_or_file_obj, out_file_obj):
+    """
+    Prettifies the given TOML text or the TOML content of the given file object, writing the prettified content
+    straight to out_file_obj without building it as a whole in memory.
+
+    Writes exactly what prettify() would return. A file object is read table by table, see prettify_stream().
     """
     from .parser import parse_tokens
     from .lexer import tokenize
     from .prettifier import prettify as element_prettify
 
-    tokens = tokenize(toml_text, is_top_level=True)
-    elements = parse_tokens(tokens)
-    prettified = element_prettify(elements)
-    return ''.join(pretty_element.serialized() for pretty_element in prettified)
+    if hasattr(text_or_file_obj, 'read'):
+        return prettify_stream(text_or_file_obj, out_file_obj)
+
+    write = out_file_obj.write
+    for pretty_element in element_prettify(parse_tokens(tokenize(text_or_file_obj, is_top_level=True))):
+        pretty_element.serialize_to(write)
 
 
 def prettify_from_file(file_path):
@@ -23,3 +82,59 @@ def prettify_from_file(file_path):
     """
     with open(file_path, 'r') as fp:
         return prettify(fp.read())
+
+
+def loads(toml_text):
+    """
+    Loads the given TOML text into a dict of primitive Python values, without building any element.
+
+    Returns the same value as the primitive_value of the parsed document.
+    """
+    from .loader import loads as loader_loads
+    return loader_loads(toml_text)
+
+
+def load(file_obj):
+    """
+    Loads the TOML content of the given file object into a dict of primitive Python values, see loads().
+    """
+    return loads(file_obj.read())
+
+
+def prettify_many(paths, workers=None, ordered=True, write=False, cache_directory=None):
+    """
+    Prettifies the TOML files at the given paths over a pool of worker processes, yielding a report for every file
+    in the order of the given paths, or in order of completion if ordered is False.
+
+    See batch.prettify_many().
+    """
+    from .batch import prettify_many as batch_prettify_many
+    return batch_prettify_many(paths, workers, ordered, write, cache_directory)
+
+
+def prettify_stream(file_obj, out_file_obj, chunk_size=64 * 1024):
+    """
+    Prettifies the TOML content of the given file object table by table, writing the prettified content of every
+    table to out_file_obj as soon as it has been read.
+
+    Writes exactly what prettify() would return for the whole content, while only holding one table in memory.
+    """
+    from .prettifier import iter_prettified
+
+    write = out_file_obj.write
+    for pretty_element in iter_prettified(iterparse(file_obj, chunk_size)):
+        pretty_element.serialize_to(write)
+
+
+def iterparse(file_obj, chunk_size=64 * 1024):
+    """
+    Reads, tokenizes and parses the TOML content of the given file object chunk by chunk, yielding every top-level
+    element (TableHeaderElement and TableElement instances) as soon as it is complete.
+
+    Only the text and tokens of the element being parsed are held in memory at any given moment.
+    """
+    from .lexer import tokenize_chunks
+    from .parser import iter_parse_tokens
+
+    chunks = iter(lambda: file_obj.read(chunk_size), '')
+    return iter_parse_tokens(tokenize_chunks(chunks, is_top_level=True))
@@ -0,0 +1,50 @@
+"""
+    Prettifies TOML files from the command line:
+
+        python -m prettytoml [--check | --in-place] [-j N] [--cache-dir DIR] FILE...
+
+    By default, the prettified content of every file is written to the standard output. With --check, nothing is
+    written and the files that are not pretty are listed, while --in-place overwrites them with their prettified
+    content. Exits with status 1 if any file could not be prettified, or if any file is not pretty with --check.
+"""
+
+import argparse
+import sys
+
+from prettytoml.batch import prettify_many
+
+
+def main(argv=None, out=None, err=None):
+    out = out or sys.stdout
+    err = err or sys.stderr
+
+    parser = argparse.ArgumentParser(prog='python -m prettytoml', description='Prettifies TOML files.')
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument('--check', action='store_true', help='only list the files that are not pretty')
+    mode.add_argument('-i', '--in-place', action='store_true', help='overwrite the files that are not pretty')
+    parser.add_argument('-j', '--jobs', type=int, default=None, metavar='N',
+                        help='number of worker processes (defaults to the number of CPUs)')
+    parser.add_argument('--cache-dir', default=None, metavar='DIR',
+                        help='directory caching the prettified content of the files across runs')
+    parser.add_argument('paths', nargs='+', metavar='FILE')
+    args = parser.parse_args(argv)
+
+    status = 0
+    for report in prettify_many(args.paths, workers=args.jobs, write=args.in_place, cache_directory=args.cache_dir):
+        if not report.ok:
+            err.write('{}: {}\n'.format(report.path, report.error))
+            status = 1
+        elif args.check:
+            if report.changed:
+                out.write('{}\n'.format(report.path))
+                status = 1
+        elif args.in_place:
+            if report.written:
+                out.write('prettified {}\n'.format(report.path))
+        else:
+            out.write(report.prettified)
+    return status
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,109 @@
+"""
+    Prettifying many TOML files at once over a pool of worker processes.
+"""
+
+import multiprocessing
+
+from prettytoml.cache import PrettifyCache
+
+
+class FileReport(object):
+    """
+    The outcome of prettifying a single file.
+
+    The prettified text is None if the file could not be prettified, in which case error holds a description of
+    the failure. cached is True if the prettified text was found in the cache.
+    """
+
+    __slots__ = ('path', 'prettified', 'changed', 'written', 'cached', 'error')
+
+    def __init__(self, path, prettified=None, changed=False, written=False, cached=False, error=None):
+        self.path = path
+        self.prettified = prettified
+        self.changed = changed
+        self.written = written
+        self.cached = cached
+        self.error = error
+
+    @property
+    def ok(self):
+        return self.error is None
+
+    def __repr__(self):
+        return 'FileReport({!r}, changed={!r}, written={!r}, cached={!r}, error={!r})'.format(
+            self.path, self.changed, self.written, self.cached, self.error)
+
+
+# The PrettifyCache of every cache directory used in this process
+_caches = {}
+
+
+def prettify_many(paths, workers=None, ordered=True, write=False, cache_directory=None):
+    """
+    Prettifies the TOML files at the given paths over the given number of worker processes, yielding a FileReport
+    for every file as soon as it is done.
+
+    Reports are yielded in the order of the given paths if ordered is True, or in order of completion otherwise.
+    A file that fails to be read, prettified or written is reported with an error instead of stopping the batch.
+
+    If write is True, every file is overwritten with its prettified content unless it is already pretty.
+
+    If a cache directory is given, the prettified content of every file is cached on disk there (see
+    cache.PrettifyCache), to be reused by any process prettifying the same content again.
+
+    The number of workers defaults to the number of CPUs. A single worker prettifies all the files in the calling
+    process.
+    """
+    workers = workers or multiprocessing.cpu_count()
+    tasks = ((path, write, cache_directory) for path in paths)
+
+    if workers == 1:
+        for task in tasks:
+            yield _prettify_file(task)
+        return
+
+    pool = multiprocessing.Pool(workers)
+    try:
+        results = pool.imap(_prettify_file, tasks) if ordered else pool.imap_unordered(_prettify_file, tasks)
+        for report in results:
+            yield report
+        pool.close()
+    finally:
+        pool.terminate()
+        pool.join()
+
+
+def _prettify_file(task):
+    """
+    Prettifies the file of the given (path, write, cache_directory) task and returns its FileReport.
+    """
+    from prettytoml import prettify
+
+    path, write, cache_directory = task
+    report = FileReport(path)
+    try:
+        cache = _cache(cache_directory)
+        with open(path, 'r') as fp:
+            source = fp.read()
+        hits = cache.hits if cache is not None else 0
+        report.prettified = prettify(source, cache)
+        report.cached = cache is not None and cache.hits > hits
+        report.changed = report.prettified != source
+        if write and report.changed:
+            with open(path, 'w') as fp:
+                fp.write(report.prettified)
+            report.written = True
+    except Exception as e:
+        report.error = '{}: {}'.format(type(e).__name__, e)
+    return report
+
+
+def _cache(directory):
+    """
+    Returns the PrettifyCache of the given directory for this process, or None if no directory is given.
+    """
+    if directory is None:
+        return None
+    if directory not in _caches:
+        _caches[directory] = PrettifyCache(directory)
+    return _caches[directory]
@@ -0,0 +1,6 @@
+"""
+    Performance benchmarks for the prettytoml pipeline stages.
+
+    `python -m prettytoml.benchmarks` times every stage on sample inputs and writes the results as JSON (see suite).
+    Every other benchmark module is runnable on its own, e.g. `python -m prettytoml.benchmarks.tokenmemory`.
+"""
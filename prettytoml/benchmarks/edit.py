@@ -0,0 +1,44 @@
+"""
+    Compares editing a large document in place with Document.edit() against parsing the edited text again.
+"""
+
+import sys
+import timeit
+
+from prettytoml.benchmarks.loads import synthetic_source
+from prettytoml.document import parse_document
+
+
+def timings(size=1000000, number=5):
+    """
+    Returns a dict mapping every way of applying a one-character edit to a document of about the given size in
+    characters to the best time it took, in seconds.
+    """
+    source = synthetic_source(table_count=max(1, size // 1700))
+    document = parse_document(source)
+
+    # Flipping a digit of a value in the middle of the document, back and forth
+    offset = source.index('key1 = ', len(source) // 2) + len('key1 = ')
+    digits = iter(('2', '1') * number)
+
+    def edit():
+        document.edit(offset, 1, next(digits))
+
+    def reparse():
+        parse_document(source[:offset] + '2' + source[offset+1:])
+
+    return {
+        'characters': len(source),
+        'Document.edit': min(timeit.repeat(edit, number=1, repeat=number)),
+        'parse_document': min(timeit.repeat(reparse, number=1, repeat=1)),
+    }
+
+
+def main(size='1000000'):
+    results = timings(int(size))
+    for way in ('Document.edit', 'parse_document'):
+        print('{} on {} characters: {:.4f}s'.format(way, results['characters'], results[way]))
+
+
+if __name__ == '__main__':
+    main(*sys.argv[1:2])
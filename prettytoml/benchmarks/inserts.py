@@ -0,0 +1,31 @@
+"""
+    Times inserting new entries one by one into a table, at doubling entry counts, to show the time per insertion
+    stays the same as the table grows.
+"""
+
+import sys
+import timeit
+
+from prettytoml.document import parse_document
+
+
+def timings(entry_counts=(4000, 8000, 16000), number=3):
+    """
+    Returns a dict mapping every entry count to the best time it took to insert that many entries, in seconds.
+    """
+    def insert(entry_count):
+        table = parse_document('[table]\nfirst = 1\n').elements[1]
+        keys = ['key{}'.format(i) for i in range(entry_count)]
+        return timeit.timeit(lambda: [table.__setitem__(key, i) for (i, key) in enumerate(keys)], number=1)
+
+    return {entry_count: min(insert(entry_count) for _ in range(number)) for entry_count in entry_counts}
+
+
+def main(*entry_counts):
+    results = timings(tuple(int(count) for count in entry_counts) or (4000, 8000, 16000))
+    for entry_count, seconds in sorted(results.items()):
+        print('{}: {:.4f}s, {:.2f}us/insert'.format(entry_count, seconds, seconds / entry_count * 1e6))
+
+
+if __name__ == '__main__':
+    main(*sys.argv[1:])
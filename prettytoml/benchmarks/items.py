@@ -0,0 +1,47 @@
+"""
+    Times reading all the entries of a large table through items(), the first time and once their values are cached.
+"""
+
+import sys
+import timeit
+
+from prettytoml.document import parse_document
+
+
+def synthetic_table(entry_count=10000):
+    """
+    Returns the parsed TOML table of the given number of entries of every kind of atomic value.
+    """
+    source = ''.join('key{} = {}\n'.format(i, ('"value {}"'.format(i), str(i), '{}.5'.format(i), 'true')[i % 4])
+                     for i in range(entry_count))
+    return parse_document(source).elements[0]
+
+
+def timings(entry_count=10000, number=5):
+    """
+    Returns a dict mapping every way of reading the entries to the best time it took, in seconds.
+    """
+    def read(table):
+        for _ in table.items():
+            pass
+
+    def first_read():
+        table = synthetic_table(entry_count)
+        return timeit.timeit(lambda: read(table), number=1)
+
+    table = synthetic_table(entry_count)
+    read(table)
+
+    return {
+        'items-first': min(first_read() for _ in range(number)),
+        'items-cached': min(timeit.repeat(lambda: read(table), number=1, repeat=number)),
+    }
+
+
+def main(entry_count='10000'):
+    for way, seconds in sorted(timings(int(entry_count)).items()):
+        print('{}: {:.4f}s'.format(way, seconds))
+
+
+if __name__ == '__main__':
+    main(*sys.argv[1:2])
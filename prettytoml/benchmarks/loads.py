@@ -0,0 +1,59 @@
+"""
+    Compares loading TOML text with loads() against parsing it and taking the primitive_value of the document.
+"""
+
+import sys
+import timeit
+
+from prettytoml import loads
+from prettytoml.document import parse_document
+
+
+def synthetic_source(table_count=200, entry_count=50):
+    """
+    Returns TOML text of the given number of tables, arrays of tables and subtables with the given number of
+    entries of every kind of value each.
+    """
+    lines = []
+    for i in range(table_count):
+        lines.append('[[array{}]]\n'.format(i % 10) if i % 3 else '[table{}.sub{}]\n'.format(i % 7, i))
+        for j in range(entry_count):
+            lines.append('  key{} = {}    # A comment\n'.format(j, [
+                '"a string {}"'.format(j),
+                str(j),
+                '{}.5'.format(j),
+                'true',
+                '[1, 2, 3]',
+                '{{ x = {}, y = "z" }}'.format(j),
+                '1979-05-27T07:32:00Z',
+            ][j % 7]))
+        lines.append('\n')
+    return ''.join(lines)
+
+
+def timings(source, number=3):
+    """
+    Returns a dict mapping every way of loading the given source to the best time it took, in seconds.
+    """
+    def best(function):
+        return min(timeit.repeat(lambda: function(source), number=1, repeat=number))
+
+    return {
+        'loads': best(loads),
+        'parse_document.primitive_value': best(lambda text: parse_document(text).primitive_value),
+    }
+
+
+def main(path='sample.toml'):
+    for name, source in (
+            (path, open(path).read()),
+            ('synthetic', synthetic_source()),
+    ):
+        results = timings(source)
+        for way, seconds in sorted(results.items()):
+            print('{} {}: {:.4f}s'.format(name, way, seconds))
+        print('{} speedup: {:.1f}x'.format(name, results['parse_document.primitive_value'] / results['loads']))
+
+
+if __name__ == '__main__':
+    main(*sys.argv[1:2])
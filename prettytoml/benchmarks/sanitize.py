@@ -0,0 +1,50 @@
+"""
+    Times sanitizing and validating the top-level elements of a file with a large number of table headers.
+"""
+
+import sys
+import timeit
+
+from prettytoml import lexer
+from prettytoml.elements.tableheader import TableHeaderElement
+from prettytoml.parser import parse_tokens
+from prettytoml.parser.elementsanitizer import sanitize, validate_sanitized
+
+
+def synthetic_elements(header_count=100000):
+    """
+    Returns top-level elements made of the given number of table headers, every other one missing its table.
+    """
+    table = parse_tokens(lexer.tokenize('key = "value"\n', is_top_level=True))[0]
+    elements = []
+    for i in range(header_count):
+        elements.append(TableHeaderElement(tuple(lexer.tokenize('[host{}]\n'.format(i)))))
+        if i % 2:
+            elements.append(table)
+    return elements
+
+
+def timings(header_count=100000, number=3):
+    """
+    Returns a dict mapping every sanitizer stage to the best time it took, in seconds.
+    """
+    elements = synthetic_elements(header_count)
+    sanitized = sanitize(elements)
+
+    def best(function):
+        return min(timeit.repeat(function, number=1, repeat=number))
+
+    return {
+        'sanitize': best(lambda: sanitize(elements)),
+        'validate_sanitized': best(lambda: validate_sanitized(sanitized)),
+        'sanitize+validate': best(lambda: sanitize(elements, validate=True)),
+    }
+
+
+def main(header_count='100000'):
+    for stage, seconds in sorted(timings(int(header_count)).items()):
+        print('{}: {:.4f}s'.format(stage, seconds))
+
+
+if __name__ == '__main__':
+    main(*sys.argv[1:2])
@@ -0,0 +1,54 @@
+"""
+    Compares the memory allocated on top of the element tree by serializing it with serialized() against writing it
+    out with serialize_to().
+"""
+
+import os
+import sys
+import tracemalloc
+
+from prettytoml.benchmarks.loads import synthetic_source
+from prettytoml.lexer import tokenize
+from prettytoml.parser import parse_tokens
+
+
+def _peak_bytes(function):
+    """
+    Returns the peak of the memory allocated while calling the given function, in bytes.
+    """
+    tracemalloc.start()
+    try:
+        function()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def peak_bytes(source):
+    """
+    Returns a dict mapping every way of writing out the elements of the given source to a file to its peak memory
+    allocation, in bytes.
+    """
+    def elements():
+        return parse_tokens(tokenize(source, is_top_level=True))
+
+    with open(os.devnull, 'w') as out_file_obj:
+        joined_elements = elements()
+        streamed_elements = elements()
+        return {
+            'serialized': _peak_bytes(
+                lambda: out_file_obj.write(''.join(e.serialized() for e in joined_elements))),
+            'serialize_to': _peak_bytes(
+                lambda: [e.serialize_to(out_file_obj.write) for e in streamed_elements]),
+        }
+
+
+def main(table_count='2000'):
+    source = synthetic_source(int(table_count))
+    print('source: {} characters'.format(len(source)))
+    for way, size in sorted(peak_bytes(source).items()):
+        print('{}: {:.1f} KiB peak'.format(way, size / 1024.0))
+
+
+if __name__ == '__main__':
+    main(*sys.argv[1:2])
@@ -0,0 +1,47 @@
+"""
+    Times wrapping large string values: chunking, breaking long text and enforcing the line length on a file.
+"""
+
+import sys
+import timeit
+
+import prettytoml
+from prettytoml.tokens import py2toml
+from prettytoml.util import chunkate_string
+
+
+def synthetic_text(size=100000):
+    """
+    Returns text of about the given size made of words, with a newline every few hundred characters like in an
+    embedded SQL query.
+    """
+    line = ' '.join('word{}'.format(i) for i in range(60)) + '\n'
+    return (line * (size // len(line) + 1))[:size]
+
+
+def timings(size=100000, number=3):
+    """
+    Returns a dict mapping every wrapping stage to the best time it took on text of the given size, in seconds.
+    """
+    text = synthetic_text(size)
+    certificate = ('MIIFazCCA1OgAwIBAgIRAIIQz7DSQONZRGPgu2OCiwAwDQYJKoZIhvcNAQELBQAw ' * (size // 65 + 1))[:size]
+    source = 'query = "{}"\ncertificate = "{}"\n'.format(text.replace('\n', ' '), certificate)
+
+    def best(function):
+        return min(timeit.repeat(function, number=1, repeat=number))
+
+    return {
+        'chunkate_string': best(lambda: list(chunkate_string(text, 120))),
+        'break_long_text': best(lambda: py2toml._break_long_text(text)),
+        'create_multiline_string': best(lambda: py2toml.create_multiline_string(text)),
+        'prettify': best(lambda: prettytoml.prettify(source)),
+    }
+
+
+def main(size='100000'):
+    for stage, seconds in sorted(timings(int(size)).items()):
+        print('{}: {:.4f}s'.format(stage, seconds))
+
+
+if __name__ == '__main__':
+    main(*sys.argv[1:2])
@@ -0,0 +1,188 @@
+"""
+    Times every stage of the pipeline on sample.toml and on synthetic inputs stressing one dimension each, writing the
+    results as JSON:
+
+        python -m prettytoml.benchmarks [--repeat N] [--scale FACTOR] [--output FILE] [TOML_FILE...]
+
+    Every stage is timed on its own, from the output of the previous stages prepared beforehand, and the best time
+    of the repeated runs is reported in seconds. A stage failing on an input is reported with its error instead.
+
+    The recursive descent parser only runs on the given files, as it exceeds the recursion limit on large synthetic
+    inputs and takes exponential time on nested inline tables.
+"""
+
+import argparse
+import json
+import platform
+import sys
+import timeit
+
+import pytoml
+
+from prettytoml import loads, VERSION
+from prettytoml.document import Document
+from prettytoml.lexer import tokenize
+from prettytoml.parser import parse_tokens, ENGINE_ITERATIVE, ENGINE_RECURSIVE_DESCENT
+from prettytoml.parser.elementsanitizer import sanitize
+from prettytoml.prettifier import ALL, prettify, ENGINE_FUSED, ENGINE_SEQUENTIAL
+
+
+def wide_table(entry_count=5000):
+    """
+    Returns TOML text of a single table of the given number of entries.
+    """
+    return ''.join('key{} = {}\n'.format(i, ('"value {}"'.format(i), str(i), 'true')[i % 3])
+                   for i in range(entry_count))
+
+
+def many_headers(header_count=5000):
+    """
+    Returns TOML text of the given number of tables of a single entry each.
+    """
+    return ''.join('[host{0}]\naddress = "10.0.{1}.{2}"\n\n'.format(i, i // 256 % 256, i % 256)
+                   for i in range(header_count))
+
+
+def long_arrays(value_count=5000, array_count=4):
+    """
+    Returns TOML text of the given number of arrays of the given number of values each.
+    """
+    return ''.join('array{} = [{}]\n'.format(i, ', '.join(str(j) for j in range(value_count)))
+                   for i in range(array_count))
+
+
+def long_strings(length=20000, string_count=4):
+    """
+    Returns TOML text of the given number of string values of about the given length each.
+    """
+    words = ' '.join('word{}'.format(i) for i in range(length // 6))
+    return ''.join('string{} = "{}"\n'.format(i, words[:length]) for i in range(string_count))
+
+
+def deep_inline_tables(depth=50, entry_count=50):
+    """
+    Returns TOML text of the given number of entries of inline tables nested to the given depth.
+    """
+    value = '1'
+    for i in range(depth):
+        value = '{{ level{} = {} }}'.format(i, value)
+    return ''.join('nested{} = {}\n'.format(i, value) for i in range(entry_count))
+
+
+SYNTHETIC_INPUTS = (
+    ('wide-table', wide_table, 5000),
+    ('many-headers', many_headers, 5000),
+    ('long-arrays', long_arrays, 5000),
+    ('long-strings', long_strings, 20000),
+    ('deep-inline-tables', deep_inline_tables, 50),
+)
+
+
+def _best(run, setup=None, repeat=3):
+    """
+    Returns the best time in seconds of calling run with the value returned by setup, which is not timed.
+    """
+    times = []
+    for _ in range(repeat):
+        argument = setup() if setup is not None else None
+        start = timeit.default_timer()
+        run(argument)
+        times.append(timeit.default_timer() - start)
+    return min(times)
+
+
+def stages(source, recursive_descent=True):
+    """
+    Returns a list of (stage name, run, setup) for every stage of the pipeline to time on the given source,
+    including the recursive descent parser if recursive_descent is True.
+    """
+    def tokens():
+        return list(tokenize(source, is_top_level=True))
+
+    def elements():
+        return parse_tokens(tokens())
+
+    result = [
+        ('tokenize', lambda _: list(tokenize(source, is_top_level=True)), None),
+        ('parse_tokens.iterative', lambda t: parse_tokens(t, engine=ENGINE_ITERATIVE), tokens),
+    ]
+    if recursive_descent:
+        result.append(
+            ('parse_tokens.recursive-descent', lambda t: parse_tokens(t, engine=ENGINE_RECURSIVE_DESCENT), tokens))
+    result.append(('sanitize', sanitize, elements))
+
+    for rule in ALL:
+        result.append(('prettifier.' + rule.__name__, rule, elements))
+
+    result += [
+        ('prettify.sequential', lambda e: prettify(e, engine=ENGINE_SEQUENTIAL), elements),
+        ('prettify.fused', lambda e: prettify(e, engine=ENGINE_FUSED), elements),
+        ('primitive_value', lambda e: Document(e).primitive_value, elements),
+        ('serialized', lambda e: ''.join(element.serialized() for element in e), elements),
+        ('serialize_to', lambda e: [element.serialize_to([].append) for element in e], elements),
+        ('loads', lambda _: loads(source), None),
+        ('pytoml.loads', lambda _: pytoml.loads(source), None),
+    ]
+    return result
+
+
+def timings(source, repeat=3, recursive_descent=True):
+    """
+    Returns a dict mapping the name of every stage to its best time in seconds on the given source, or to a dict
+    with the error it failed with.
+    """
+    results = {}
+    for name, run, setup in stages(source, recursive_descent):
+        try:
+            results[name] = _best(run, setup, repeat)
+        except Exception as e:
+            results[name] = {'error': '{}: {}'.format(type(e).__name__, e)}
+    return results
+
+
+def inputs(paths=('sample.toml',), scale=1.0):
+    """
+    Returns a list of (input name, TOML text, is_synthetic) for the given files and the synthetic inputs scaled by
+    the given factor.
+    """
+    result = []
+    for path in paths:
+        with open(path) as fp:
+            result.append((path, fp.read(), False))
+    for name, generate, size in SYNTHETIC_INPUTS:
+        result.append((name, generate(max(1, int(size * scale))), True))
+    return result
+
+
+def main(argv=None, out=None):
+    out = out or sys.stdout
+
+    parser = argparse.ArgumentParser(prog='python -m prettytoml.benchmarks',
+                                     description='Times every stage of the prettytoml pipeline.')
+    parser.add_argument('--repeat', type=int, default=3, metavar='N', help='runs of every stage, the best is kept')
+    parser.add_argument('--scale', type=float, default=1.0, metavar='FACTOR',
+                        help='factor of the default size of the synthetic inputs')
+    parser.add_argument('--output', default=None, metavar='FILE', help='JSON file to write instead of the output')
+    parser.add_argument('paths', nargs='*', default=['sample.toml'], metavar='TOML_FILE')
+    args = parser.parse_args(argv)
+
+    report = {
+        'prettytoml': VERSION,
+        'python': platform.python_version(),
+        'repeat': args.repeat,
+        'scale': args.scale,
+        'inputs': {},
+    }
+    for name, source, is_synthetic in inputs(args.paths, args.scale):
+        report['inputs'][name] = {
+            'characters': len(source),
+            'seconds': timings(source, args.repeat, recursive_descent=not is_synthetic),
+        }
+
+    if args.output:
+        with open(args.output, 'w') as fp:
+            json.dump(report, fp, indent=2, sort_keys=True)
+    else:
+        json.dump(report, out, indent=2, sort_keys=True)
+        out.write('\n')
+    return 0
@@ -0,0 +1,20 @@
+import json
+
+import six
+
+from prettytoml.benchmarks import suite
+from prettytoml.prettifier import ALL
+
+
+def test_suite_report():
+    out = six.StringIO()
+    assert suite.main(['--repeat', '1', '--scale', '0.01', 'sample.toml'], out=out) == 0
+
+    report = json.loads(out.getvalue())
+    assert sorted(report['inputs']) == sorted(['sample.toml'] + [name for name, _, _ in suite.SYNTHETIC_INPUTS])
+
+    sample_seconds = report['inputs']['sample.toml']['seconds']
+    for stage in ['tokenize', 'parse_tokens.recursive-descent', 'sanitize', 'primitive_value', 'serialized',
+                  'pytoml.loads'] + ['prettifier.' + rule.__name__ for rule in ALL]:
+        assert sample_seconds[stage] >= 0
+    assert all(isinstance(seconds, float) for i in report['inputs'].values() for seconds in i['seconds'].values())
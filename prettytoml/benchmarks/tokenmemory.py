@@ -0,0 +1,65 @@
+"""
+    Reports the memory used per token by the different token representations.
+
+    Relies on tracemalloc, so it only runs on Python 3.
+"""
+
+import sys
+import tracemalloc
+from prettytoml.lexer import tokenize, tokenize_offsets
+
+
+class _DictToken(object):
+    """
+    A token storing its attributes in an instance dict, like Token did before it had __slots__.
+    """
+
+    def __init__(self, _type, source_substring, col=None, row=None):
+        self._source_substring = source_substring
+        self._type = _type
+        self._col = col
+        self._row = row
+
+
+def _traced_bytes(producer):
+    """
+    Returns (result, bytes allocated and still held while producing the result).
+    """
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        result = producer()
+        return result, tracemalloc.get_traced_memory()[0] - before
+    finally:
+        tracemalloc.stop()
+
+
+def bytes_per_token(source):
+    """
+    Returns a dict mapping the name of every token representation to the bytes it uses per token of the source.
+    """
+
+    token_list, token_list_bytes = _traced_bytes(lambda: list(tokenize(source, is_top_level=True)))
+    dict_token_list, dict_token_list_bytes = _traced_bytes(
+        lambda: [_DictToken(t.type, t.source_substring, t.col, t.row) for t in tokenize(source, is_top_level=True)])
+    token_buffer, token_buffer_bytes = _traced_bytes(lambda: tokenize_offsets(source, is_top_level=True))
+
+    # The source text has to be kept in memory in both cases anyway, don't account for a normalized copy of it.
+    if token_buffer.source is not source:
+        token_buffer_bytes -= sys.getsizeof(token_buffer.source)
+
+    return {
+        'token-objects': float(token_list_bytes) / len(token_list),
+        'dict-token-objects': float(dict_token_list_bytes) / len(dict_token_list),
+        'token-buffer': float(token_buffer_bytes) / len(token_buffer),
+    }
+
+
+def main(path='sample.toml', repeat=200):
+    source = open(path).read() * repeat
+    for name, size in sorted(bytes_per_token(source).items()):
+        print('{}: {:.1f} bytes/token'.format(name, size))
+
+
+if __name__ == '__main__':
+    main(*sys.argv[1:2])
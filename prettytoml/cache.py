@@ -0,0 +1,183 @@
+"""
+    Caching prettified TOML text by the content it was prettified from.
+"""
+
+import collections
+import hashlib
+import io
+import os
+import tempfile
+
+import six
+
+from prettytoml._version import VERSION
+
+if hasattr(os, 'replace'):
+    _replace = os.replace
+else:
+    def _replace(source, destination):
+        # os.rename() does not overwrite an existing destination on Windows
+        try:
+            os.rename(source, destination)
+        except OSError:
+            if not os.path.exists(destination):
+                raise
+            os.remove(destination)
+            os.rename(source, destination)
+
+
+class PrettifyCache(object):
+    """
+    A cache of prettified TOML text keyed by a hash of the source text, the prettifiers used and the library
+    version, with an in-memory tier holding the most recently used entries and an optional on-disk tier.
+
+    The on-disk tier is a directory of files, one per entry, that can be shared between processes and runs. When it
+    grows beyond its size cap, the least recently used files are evicted. Any failure to read or write it is
+    treated as a miss.
+
+    The hits, misses and evictions counters count the lookups answered by either tier, the lookups answered by
+    none, and the entries evicted from either tier respectively.
+    """
+
+    def __init__(self, directory=None, max_memory_entries=1024, max_disk_size=64 * 1024 * 1024):
+        self._memory = collections.OrderedDict()
+        self._max_memory_entries = max_memory_entries
+        self._directory = directory
+        self._max_disk_size = max_disk_size
+        self._disk_size = None
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        if directory is not None and not os.path.isdir(directory):
+            os.makedirs(directory)
+
+    @property
+    def directory(self):
+        return self._directory
+
+    @staticmethod
+    def key(toml_text, prettifiers):
+        """
+        Returns the key of the text prettified from the given TOML text by the given prettifiers.
+        """
+        digest = hashlib.sha256()
+        digest.update(VERSION.encode('utf-8'))
+        for prettifier in prettifiers:
+            digest.update('\0{}.{}'.format(prettifier.__module__, prettifier.__name__).encode('utf-8'))
+        digest.update(b'\0\0')
+        digest.update(toml_text.encode('utf-8'))
+        return digest.hexdigest()
+
+    def get(self, key):
+        """
+        Returns the prettified text cached for the given key, or None.
+        """
+        if key in self._memory:
+            self._memory[key] = self._memory.pop(key)
+            self.hits += 1
+            return self._memory[key]
+
+        value = self._read(key)
+        if value is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        self._remember(key, value)
+        return value
+
+    def put(self, key, value):
+        """
+        Caches the given prettified text for the given key.
+        """
+        self._remember(key, value)
+        self._write(key, value)
+
+    def _remember(self, key, value):
+        self._memory.pop(key, None)
+        self._memory[key] = value
+        while len(self._memory) > self._max_memory_entries:
+            self._memory.popitem(last=False)
+            self.evictions += 1
+
+    def _path(self, key):
+        return os.path.join(self._directory, key)
+
+    def _read(self, key):
+        if self._directory is None:
+            return None
+        try:
+            with io.open(self._path(key), 'r', encoding='utf-8', newline='') as fp:
+                value = fp.read()
+            os.utime(self._path(key), None)    # Marking as recently used
+            return value
+        except (IOError, OSError):
+            return None
+
+    def _write(self, key, value):
+        if self._directory is None:
+            return
+        path = self._path(key)
+        data = value.encode('utf-8') if isinstance(value, six.text_type) else value
+        try:
+            previous_size = os.path.getsize(path)
+        except OSError:
+            previous_size = 0
+
+        temp_path = None
+        try:
+            fd, temp_path = tempfile.mkstemp(dir=self._directory, prefix='.')
+            with io.open(fd, 'wb') as fp:
+                fp.write(data)
+            _replace(temp_path, path)
+        except (IOError, OSError):
+            if temp_path is not None:
+                try:
+                    os.remove(temp_path)
+                except OSError:
+                    pass
+            return
+
+        if self._disk_size is not None:
+            self._disk_size += len(data) - previous_size
+        if self._measured_disk_size() > self._max_disk_size:
+            self._evict_from_disk()
+
+    def _entries_on_disk(self):
+        """
+        Returns a list of (modification time, size, path) of the entries on disk.
+        """
+        entries = []
+        for name in os.listdir(self._directory):
+            if name.startswith('.'):
+                continue
+            path = os.path.join(self._directory, name)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        return entries
+
+    def _measured_disk_size(self):
+        if self._disk_size is None:
+            self._disk_size = sum(size for _, size, _ in self._entries_on_disk())
+        return self._disk_size
+
+    def _evict_from_disk(self):
+        """
+        Removes the least recently used entries on disk until they take no more than 3/4 of the size cap.
+        """
+        entries = sorted(self._entries_on_disk())
+        self._disk_size = sum(size for _, size, _ in entries)
+        for _, size, path in entries:
+            if self._disk_size <= self._max_disk_size * 3 // 4:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            self._disk_size -= size
+            self.evictions += 1
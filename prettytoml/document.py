@@ -0,0 +1,472 @@
+"""
+    A TOML document as a sequence of top-level elements, with its tables indexed by name.
+"""
+
+import bisect
+
+from prettytoml.elements.common import NotifyingList
+from prettytoml.elements.table import TableElement
+from prettytoml.elements.tableheader import TableHeaderElement
+from prettytoml.errors import InvalidTOMLFileError
+from prettytoml.parser.elementsanitizer import iter_sanitized
+
+
+class _Entry(object):
+    """
+    A table in the document: the positions of its header and body elements and its path in the index.
+    """
+
+    __slots__ = ('header_i', 'body_i', 'path')
+
+    def __init__(self, header_i, body_i, path):
+        self.header_i = header_i
+        self.body_i = body_i
+        self.path = path
+
+
+class _Node(object):
+    """
+    A node in the table name trie.
+    """
+
+    __slots__ = ('children', 'entries', 'array')
+
+    def __init__(self):
+        self.children = {}  # Name -> _Node
+        self.entries = []   # The tables named after this node in document order, more than one being a duplicate
+        self.array = []     # A _Node for every table in the array of tables named after this node
+
+
+class _Index(object):
+    """
+    A trie of the tables by their path, with the entries of all the tables in document order.
+
+    A table path is the sequence of names in its header, where every name of an array of tables is followed by
+    the ordinal of the table it refers to in that array. Given:
+
+        [[fruit]]
+        [[fruit]]
+        [fruit.variety]
+
+    the paths are ('fruit', 0), ('fruit', 1) and ('fruit', 1, 'variety').
+    """
+
+    def __init__(self):
+        self.root = _Node()
+        self.entries = []
+
+    def node(self, path):
+        """
+        Returns the node at the given path, or raises KeyError.
+        """
+        node = self.root
+        for name in path:
+            if isinstance(name, int):
+                if not 0 <= name < len(node.array):
+                    raise KeyError(path)
+                node = node.array[name]
+            else:
+                node = node.children[name]
+        return node
+
+    def add(self, header, header_i, body_i, appending):
+        """
+        Adds the table with the given header and element positions, returning the new entry, or None if the index
+        cannot be updated to account for it.
+
+        The positions of the entries following the added table must have been shifted already. Tables of arrays
+        of tables can only be added to the end of the document, as they can change the path of any following table.
+        """
+        node = self.root
+        path = ()
+
+        for name in header.names[:-1]:
+            node = node.children.setdefault(name, _Node())
+            path += (name,)
+            ordinal = _last_table_preceding(node.array, header_i)
+            if ordinal >= 0:
+                node = node.array[ordinal]
+                path += (ordinal,)
+
+        node = node.children.setdefault(header.names[-1], _Node())
+        path += (header.names[-1],)
+
+        if header.is_array_of_tables:
+            if not appending:
+                return None
+            path += (len(node.array),)
+            node.array.append(_Node())
+            node = node.array[-1]
+
+        entry = _Entry(header_i, body_i, path)
+        node.entries.insert(_entries_preceding(node.entries, header_i), entry)
+        self.entries.insert(_entries_preceding(self.entries, header_i), entry)
+        return entry
+
+    def shift(self, from_position, offset):
+        """
+        Shifts the positions of all the entries at or following the given element position by the given offset.
+        """
+        for entry in self.entries[_entries_preceding(self.entries, from_position):]:
+            if entry.header_i is not None:
+                entry.header_i += offset
+            entry.body_i += offset
+
+
+def _entries_preceding(entries, position):
+    """
+    Returns the number of the given entries (sorted by position) preceding the given element position.
+    """
+    low, high = 0, len(entries)
+    while low < high:
+        middle = (low + high) // 2
+        if entries[middle].body_i < position:
+            low = middle + 1
+        else:
+            high = middle
+    return low
+
+
+def _last_table_preceding(array, position):
+    """
+    Returns the ordinal of the last table in the given array of tables preceding the given element position,
+    or -1.
+    """
+    low, high = 0, len(array)
+    while low < high:
+        middle = (low + high) // 2
+        if array[middle].entries[0].header_i < position:
+            low = middle + 1
+        else:
+            high = middle
+    return low - 1
+
+
+class Document(object):
+    """
+    A TOML document made of an optional anonymous TableElement followed by (TableHeaderElement, TableElement) pairs.
+
+    Tables can be looked up by their path (see _Index) in O(depth). The anonymous table has the empty path.
+
+    The index is maintained as tables are inserted and removed through this class, and rebuilt on its next use
+    after the elements are modified in any other way.
+
+    The document can also be edited as text (see edit()), only parsing again the tables touched by every edit.
+    """
+
+    # Taking part in the invalidation of cached primitive values and serialized text like a ContainerElement, see
+    # Element._parent
+    _parent = None
+    _cached_primitive_value = None
+    _cached_serialized = None
+
+    # The serialized length of every element, valid along with the cached serialized text
+    _lengths = None
+
+    def __init__(self, _elements):
+        self._elements = NotifyingList(iter_sanitized(_elements), self._elements_changed)
+        self._index = None
+
+    def _elements_changed(self):
+        self._index = None
+        self._cached_primitive_value = None
+        self._cached_serialized = None
+        self._lengths = None
+
+    @property
+    def elements(self):
+        return self._elements
+
+    def _indexed(self):
+        if self._index is None:
+            index = _Index()
+            for i, element in enumerate(self._elements):
+                if isinstance(element, TableHeaderElement):
+                    index.add(element, i, i+1, appending=True)
+                elif i == 0 and isinstance(element, TableElement):
+                    index.root.entries.append(_Entry(None, 0, ()))
+                    index.entries.append(index.root.entries[0])
+            self._index = index
+        return self._index
+
+    def _entry(self, path):
+        entries = self._indexed().node(tuple(path)).entries
+        if not entries:
+            raise KeyError(path)
+        return entries[0]
+
+    def positions(self, path):
+        """
+        Returns the (header_index, body_index) positions of the table with the given path among the elements, with
+        a header_index of None for the anonymous table.
+
+        Raises KeyError if not found.
+        """
+        entry = self._entry(path)
+        return entry.header_i, entry.body_i
+
+    def table(self, path):
+        """
+        Returns the TableElement of the table with the given path, or raises KeyError.
+        """
+        return self._elements[self._entry(path).body_i]
+
+    def header(self, path):
+        """
+        Returns the TableHeaderElement of the table with the given path, or raises KeyError.
+        """
+        header_i = self._entry(path).header_i
+        if header_i is None:
+            raise KeyError(path)
+        return self._elements[header_i]
+
+    def __contains__(self, path):
+        try:
+            self._entry(path)
+            return True
+        except KeyError:
+            return False
+
+    def array_length(self, path):
+        """
+        Returns the number of tables in the array of tables with the given path, which is zero if there's none.
+        """
+        try:
+            return len(self._indexed().node(tuple(path)).array)
+        except KeyError:
+            return 0
+
+    def subtable_paths(self, prefix):
+        """
+        Returns the paths of all the tables under the given path prefix, excluding the table at the prefix itself,
+        in document order.
+        """
+        try:
+            node = self._indexed().node(tuple(prefix))
+        except KeyError:
+            return ()
+
+        found = []
+        pending = [node]
+        while pending:
+            node = pending.pop()
+            for child in list(node.children.values()) + node.array:
+                found += child.entries[:1]
+                pending.append(child)
+
+        return tuple(entry.path for entry in sorted(found, key=lambda e: e.body_i))
+
+    def insert_table(self, position, header, table=None):
+        """
+        Inserts a table with the given TableHeaderElement and TableElement at the given element position, which
+        must be the position of a table header or the end of the elements.
+        """
+        table = table if table is not None else TableElement(tuple())
+
+        if not (position == len(self._elements) or isinstance(self._elements[position], TableHeaderElement)):
+            raise InvalidTOMLFileError('Tables can only be inserted before a table header or at the end')
+
+        index = self._indexed()
+        self._elements[position:position] = [header, table]
+
+        index.shift(position, 2)
+        if index.add(header, position, position+1, appending=position == len(self._elements)-2):
+            self._index = index
+
+    def append_table(self, header, table=None):
+        """
+        Appends a table with the given TableHeaderElement and TableElement to the end of the document.
+        """
+        self.insert_table(len(self._elements), header, table)
+
+    def remove_table(self, path):
+        """
+        Removes the header and body of the table with the given path, keeping its subtables. Tables in an array of
+        tables following the removed one get their ordinals decremented.
+
+        Raises KeyError if not found.
+        """
+        index = self._indexed()
+        entry = self._entry(path)
+        begin = entry.header_i if entry.header_i is not None else entry.body_i
+        del self._elements[begin:entry.body_i+1]
+
+        if path and isinstance(path[-1], int):
+            return  # Let the ordinals be reassigned on rebuilding
+
+        node = index.node(tuple(path))
+        node.entries.remove(entry)
+        index.entries.remove(entry)
+        index.shift(begin, begin - entry.body_i - 1)
+        self._index = index
+
+    @property
+    def primitive_value(self):
+        """
+        Returns the whole document as a dict of primitive Python values, with an array of tables as a list of dicts.
+
+        Built once and kept until the elements or any of the tables change, so it must not be modified.
+        """
+        if self._cached_primitive_value is None:
+            self._cached_primitive_value = self._build_primitive_value()
+        return self._cached_primitive_value
+
+    def _build_primitive_value(self):
+        primitive_value = {}
+        built = {id(primitive_value)}   # The dicts and lists built here, the others belonging to a table element
+
+        def container_at(target, name, kind, path):
+            # Returns the container of the given kind at the given key or index of the target, which is copied first
+            # when it belongs to a table element as the primitive values of elements must not be modified
+            if isinstance(name, int):
+                while len(target) <= name:
+                    target.append({})
+                    built.add(id(target[-1]))
+            elif name not in target:
+                target[name] = kind()
+                built.add(id(target[name]))
+
+            value = target[name]
+            if not isinstance(value, kind):
+                names = '.'.join(n for n in path if not isinstance(n, int))
+                raise InvalidTOMLFileError(
+                    '{}: {}'.format('Not an array of tables' if kind is list else 'Not a table', names))
+            if id(value) not in built:
+                value = target[name] = kind(value)
+                built.add(id(value))
+            return value
+
+        for entry in self._indexed().entries:
+            table = self._elements[entry.body_i]
+            table._parent = self
+
+            target = primitive_value
+            for i, name in enumerate(entry.path):
+                next_name = entry.path[i+1] if i + 1 < len(entry.path) else None
+                target = container_at(target, name, list if isinstance(next_name, int) else dict, entry.path[:i+1])
+            target.update(table.primitive_value)
+
+        return primitive_value
+
+    def serialized(self):
+        return self._serialized_lengths()[0]
+
+    def serialize_to(self, write):
+        """
+        Writes the serialized document piece by piece by calling the given write callable, see
+        Element.serialize_to().
+        """
+        if self._cached_serialized is not None:
+            write(self._cached_serialized)
+        else:
+            for element in self._elements:
+                element.serialize_to(write)
+
+    def _serialized_lengths(self):
+        """
+        Returns (the serialized document, the list of the serialized length of every element), cached until the
+        elements or any of the tables change.
+        """
+        if self._cached_serialized is None:
+            serialized = []
+            for element in self._elements:
+                element._parent = self
+                serialized.append(element.serialized())
+            self._cached_serialized = ''.join(serialized)
+            self._lengths = [len(text) for text in serialized]
+        return self._cached_serialized, self._lengths
+
+    def _table_start(self, i):
+        """
+        Returns the position of the first element of the table with an element at the given position.
+        """
+        if i > 0 and not isinstance(self._elements[i], TableHeaderElement):
+            return i - 1
+        return i
+
+    def edit(self, offset, removed_length, inserted_text):
+        """
+        Replaces the removed_length characters at the given offset of the serialized document with the inserted
+        text, lexing and parsing again only the tables touched by the edit and splicing them into the elements.
+
+        Lexing restarts at the start of the first touched table, and stops at the first table header following
+        the edit that starts right where it used to, as the text following it is left as it was.
+
+        Offsets are into the document serialized with UNIX newlines and a trailing newline, like parse_document()
+        normalizes the text it's given. Tokens following the edited tables keep the positions they were read at.
+
+        Only the lexing and parsing are incremental: splicing the edit into the text of the document, counting the
+        rows preceding the touched tables and locating them from the lengths of the elements still take time linear
+        in the size of the document, though a small fraction of what lexing and parsing all of it does.
+
+        Raises LexerError or ParsingError on invalid TOML, leaving the document unchanged.
+        """
+        from prettytoml.lexer import tokenize_from
+        from prettytoml.parser import parse_tokens
+
+        text, lengths = self._serialized_lengths()
+        if offset < 0 or removed_length < 0 or offset + removed_length > len(text):
+            raise ValueError('Edit out of the bounds of the document')
+
+        inserted_text = inserted_text.replace('\r\n', '\n')
+        edited_text = text[:offset] + inserted_text + text[offset+removed_length:]
+        if edited_text and edited_text[-1] != '\n':
+            edited_text += '\n'
+
+        edit_end = offset + len(inserted_text)
+        shift = len(edited_text) - len(text)
+        starts = [0]
+        for length in lengths:
+            starts.append(starts[-1] + length)
+        element_count = len(self._elements)
+
+        # The first element following the removed text, all of them starting where they used to after the shift
+        first_unchanged = bisect.bisect_left(starts, offset + removed_length, 0, element_count)
+
+        # An insertion right at the start of a table could as well extend the preceding one
+        first = self._table_start(max(bisect.bisect_right(starts, max(offset-1, 0), 0, element_count) - 1, 0))
+
+        while True:
+            begin = starts[first]
+            region_tokens = []
+            position = begin
+            following = max(first_unchanged, first+1)
+
+            for token in tokenize_from(edited_text, begin, row=edited_text.count('\n', 0, begin) + 1):
+                region_tokens.append(token)
+                position += len(token.source_substring)
+                if position < edit_end:
+                    continue
+                while following < element_count and starts[following] + shift < position:
+                    following += 1
+                if following < element_count and starts[following] + shift == position and \
+                        isinstance(self._elements[following], TableHeaderElement) and \
+                        edited_text[position-1] == '\n':
+                    break
+            else:
+                following = element_count
+
+            parsed = parse_tokens(region_tokens)
+
+            # Lost its header, the first table now belongs to the preceding one
+            if first > 0 and parsed and not isinstance(parsed[0], TableHeaderElement):
+                first = self._table_start(first - 1)
+                continue
+
+            break
+
+        self._elements[first:following] = parsed
+        for element in parsed:
+            element._parent = self
+        lengths[first:following] = [len(element.serialized()) for element in parsed]
+        self._cached_serialized, self._lengths = edited_text, lengths
+
+
+def parse_document(toml_text):
+    """
+    Tokenizes and parses the given TOML text into a Document.
+    """
+    from prettytoml.lexer import tokenize
+    from prettytoml.parser import parse_tokens
+
+    return Document(parse_tokens(tokenize(toml_text, is_top_level=True)))
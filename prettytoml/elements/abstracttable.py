@@ -1,5 +1,5 @@
 from prettytoml.elements.common import ContainerElement
-from prettytoml.elements import traversal
+from prettytoml.elements import common, traversal
 
 
 class AbstractTable(ContainerElement, traversal.TraversalMixin):
@@ -13,6 +13,10 @@ class AbstractTable(ContainerElement, traversal.TraversalMixin):
         ContainerElement.__init__(self, sub_elements)
         self._fallback = None
 
+    def _sub_elements_changed(self):
+        # Lazily computed facts about where things are in the sub-elements, see _indexed_keys()
+        self._layout = {}
+
     def _enumerate_items(self):
         """
         Returns ((key_index, key_element), (value_index, value_element)) for all the element key-value pairs.
@@ -24,6 +28,50 @@ class AbstractTable(ContainerElement, traversal.TraversalMixin):
             except StopIteration:
                 return
 
+    def _indexed_keys(self):
+        """
+        Returns (key_positions, ordered_keys) where key_positions maps every key to the (key_index, value_index) of
+        its first occurrence, and ordered_keys is the sequence of all the keys in order (duplicates included).
+
+        Built once and kept until the sub-elements change.
+        """
+        if 'keys' not in self._layout:
+            key_positions = {}
+            ordered_keys = []
+            for (key_i, key_element), (value_i, _) in self._enumerate_items():
+                key = key_element.value
+                ordered_keys.append(key)
+                key_positions.setdefault(key, (key_i, value_i))
+            self._layout['keys'] = key_positions, ordered_keys
+        return self._layout['keys']
+
+    def _replace_value_element(self, value_i, value_element):
+        """
+        Replaces the value element at the given sub-element index, which leaves every key where it was.
+        """
+        layout = self._layout
+        self._sub_elements[value_i] = value_element
+        self._layout = layout
+
+    def _insert_entry(self, index, entry_elements, key):
+        """
+        Inserts the sub-elements making up a new key-value entry in place at the given sub-element index, which must
+        follow all the existing entries, and adds the new key to the already indexed ones.
+
+        Returns the layout as it was before the insertion, with the new key added.
+        """
+        layout = self._layout
+        self._sub_elements[index:index] = entry_elements
+
+        if 'keys' in layout:
+            key_positions, ordered_keys = layout['keys']
+            key_i, value_i = (index + i for (i, e) in enumerate(entry_elements) if e.type != common.TYPE_METADATA)
+            key_positions.setdefault(key, (key_i, value_i))
+            ordered_keys.append(key)
+
+        self._layout = layout
+        return layout
+
     def items(self):
         for (key_i, key), (value_i, value) in self._enumerate_items():
             yield key.value, value.value
@@ -32,16 +80,19 @@ class AbstractTable(ContainerElement, traversal.TraversalMixin):
                 yield key, value
 
     def keys(self):
-        return tuple(key for (key, _) in self.items())
+        keys = tuple(self._indexed_keys()[1])
+        if self._fallback:
+            keys += tuple(key for (key, _) in self._fallback.items())
+        return keys
 
     def values(self):
         return tuple(value for (_, value) in self.items())
 
     def __len__(self):
-        return len(tuple(self._enumerate_items()))
+        return len(self._indexed_keys()[1])
 
     def __contains__(self, item):
-        return item in self.keys()
+        return item in self._indexed_keys()[0] or (bool(self._fallback) and item in self._fallback.keys())
 
     def _find_key_and_value(self, key):
         """
@@ -49,16 +100,15 @@ class AbstractTable(ContainerElement, traversal.TraversalMixin):
 
         Raises KeyError if no matching key found.
         """
-        for (key_i, key_element), (value_i, value_element) in self._enumerate_items():
-            if key_element.value == key:
-                return key_i, value_i
-        raise KeyError
+        return self._indexed_keys()[0][key]
 
     def __getitem__(self, item):
-        for key, value in self.items():
-            if key == item:
-                return value
-        raise KeyError
+        key_positions = self._indexed_keys()[0]
+        if item in key_positions:
+            return self.sub_elements[key_positions[item][1]].value
+        if self._fallback:
+            return self._fallback[item]
+        raise KeyError(item)
 
     def get(self, key, default=None):
         try:
@@ -77,8 +127,22 @@ class AbstractTable(ContainerElement, traversal.TraversalMixin):
     def primitive_value(self):
         """
         Returns a primitive Python value without any formatting or markup metadata.
+
+        Built once and kept until this element or any of the elements it is made of changes, so it must not be
+        modified. A new one is returned every time if there is a fallback, which can change at any time.
         """
-        return {
-            key:
-                value.primitive_value if hasattr(value, 'primitive_value') else value for key, value in self.items()
-            }
+        primitive_value = ContainerElement.primitive_value.fget(self)
+        if self._fallback:
+            primitive_value = dict(primitive_value)
+            primitive_value.update(
+                (key, value.primitive_value if hasattr(value, 'primitive_value') else value)
+                for key, value in self._fallback.items()
+            )
+        return primitive_value
+
+    def _build_primitive_value(self):
+        primitive_value = {}
+        for (_, key), (_, value) in self._enumerate_items():
+            value._parent = self
+            primitive_value[key.value] = value.primitive_value
+        return primitive_value
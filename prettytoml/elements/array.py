@@ -3,6 +3,7 @@ from prettytoml.elements.common import Element, ContainerElement
 from prettytoml.elements.factory import create_element
 from prettytoml.elements.metadata import NewlineElement
 from prettytoml.elements.errors import InvalidElementError
+from prettytoml.elements.traversal import predicates
 
 
 class ArrayElement(ContainerElement, traversal.TraversalMixin):
@@ -20,12 +21,25 @@ class ArrayElement(ContainerElement, traversal.TraversalMixin):
         common.ContainerElement.__init__(self, sub_elements)
         self._check_homogeneity()
 
+    def _sub_elements_changed(self):
+        self._value_positions = None
+
+    def _indexed_values(self):
+        """
+        Returns the list of the sub-element indices of all the values in order.
+
+        Built once and kept until the sub-elements change.
+        """
+        if self._value_positions is None:
+            self._value_positions = [i for (i, _) in self._enumerate_non_metadata_sub_elements()]
+        return self._value_positions
+
     def _check_homogeneity(self):
         if len(set(type(v) for v in self.primitive_value)) > 1:
             raise InvalidElementError('Array should be homogeneous')
 
     def __len__(self):
-        return len(tuple(self._enumerate_non_metadata_sub_elements()))
+        return len(self._indexed_values())
 
     def __getitem__(self, i):
         """
@@ -36,21 +50,21 @@ class ArrayElement(ContainerElement, traversal.TraversalMixin):
     def __setitem__(self, i, value):
         value_i, _ = self._find_value(i)
         new_element = value if isinstance(value, Element) else factory.create_element(value)
-        self._sub_elements = self.sub_elements[:value_i] + [new_element] + self.sub_elements[value_i+1:]
+        value_positions = self._value_positions
+        self._sub_elements[value_i] = new_element
+        self._value_positions = value_positions
 
     @property
     def value(self):
         return self     # self is a sequence-like value
 
-    @property
-    def primitive_value(self):
-        """
-        Returns a primitive Python value without any formatting or markup metadata.
-        """
-        return list(
-            self[i].primitive_value if hasattr(self[i], 'primitive_value')
-            else self[i]
-            for i in range(len(self)))
+    def _build_primitive_value(self):
+        primitive_value = []
+        for i in self._indexed_values():
+            element = self.sub_elements[i]
+            element._parent = self
+            primitive_value.append(element.primitive_value)
+        return primitive_value
 
     def __str__(self):
         return "Array{}".format(self.primitive_value)
@@ -64,9 +78,12 @@ class ArrayElement(ContainerElement, traversal.TraversalMixin):
                 factory.create_whitespace_element(),
             ] + new_entry
 
+        value_positions = self._indexed_values()
         insertion_index = self._find_closing_square_bracket()
-        self._sub_elements = self._sub_elements[:insertion_index] + new_entry + \
-                             self._sub_elements[insertion_index:]
+        self._sub_elements[insertion_index:insertion_index] = new_entry
+
+        value_positions.append(insertion_index + len(new_entry) - 1)
+        self._value_positions = value_positions
 
     def _find_value(self, i):
         """
@@ -74,7 +91,8 @@ class ArrayElement(ContainerElement, traversal.TraversalMixin):
 
         Raises IndexError if not found.
         """
-        return tuple(self._enumerate_non_metadata_sub_elements())[i]
+        value_i = self._indexed_values()[i]
+        return value_i, self.sub_elements[value_i]
 
     def __delitem__(self, i):
         value_i, value = self._find_value(i)
@@ -84,7 +102,8 @@ class ArrayElement(ContainerElement, traversal.TraversalMixin):
         # Rules:
         #   1. begin should be index to the preceding comma to the value
         #   2. end should be index to the following comma, or the closing bracket
-        #   3. If no preceding comma found but following comma found then end should be the index of the following value
+        #   3. If no preceding comma found but following comma found then end should be the index of the following
+        #      value, or the closing bracket when the comma is a trailing one
 
         preceding_comma = self._find_preceding_comma(value_i)
         found_preceding_comma = preceding_comma >= 0
@@ -95,12 +114,20 @@ class ArrayElement(ContainerElement, traversal.TraversalMixin):
         if following_comma >= 0:
             if not found_preceding_comma:
                 end = self._find_following_non_metadata(following_comma)
+                if end < 0:
+                    end = self._find_following_closing_square_bracket(following_comma)
             else:
                 end = following_comma
         else:
-            end = self._find_following_closing_square_bracket()
+            end = self._find_following_closing_square_bracket(value_i)
+
+        # Exactly one value lies between begin and end, the ones following it move back by the removed count
+        value_positions = self._indexed_values()
+        i = i % len(value_positions)
+        value_positions = value_positions[:i] + [p - (end - begin) for p in value_positions[i+1:]]
 
-        self._sub_elements = self.sub_elements[:begin] + self._sub_elements[end:]
+        del self._sub_elements[begin:end]
+        self._value_positions = value_positions
 
     @property
     def is_multiline(self):
@@ -113,24 +140,15 @@ class ArrayElement(ContainerElement, traversal.TraversalMixin):
         if self.is_multiline:
             return
 
-        i = self._find_following_comma(-1)
-
-        def next_entry_i():
-            return self._find_following_non_metadata(i)
-
-        def next_newline_i():
-            return self._find_following_newline(i)
-
-        def next_closing_bracket_i():
-            return self._find_following_closing_square_bracket(i)
-
-        def next_comma_i():
-            return self._find_following_comma(i)
-
-        while i < len(self.elements)-1:
-            if next_newline_i() < next_entry_i():
-                self.elements.insert(i+1, factory.create_newline_element())
-                if float('-inf') < next_comma_i() < next_closing_bracket_i():
-                    i = next_comma_i()
-                else:
-                    i = next_closing_bracket_i()
+        # A newline goes right after every comma
+        sub_elements = []
+        value_positions = []
+        for element in self.sub_elements:
+            if element.type != common.TYPE_METADATA:
+                value_positions.append(len(sub_elements))
+            sub_elements.append(element)
+            if predicates.op_comma(element):
+                sub_elements.append(factory.create_newline_element())
+
+        self._sub_elements = sub_elements
+        self._value_positions = value_positions
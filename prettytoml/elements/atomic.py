@@ -12,23 +12,33 @@ class AtomicElement(common.TokenElement):
         InvalidElementError: when passed an invalid sequence of tokens.
     """
 
+    # Derived from the tokens and dropped whenever they change
+    _cached_value_token_index = None
+    _cached_value = None
+    _has_cached_value = False
+
     def __init__(self, _tokens):
         common.TokenElement.__init__(self, _tokens, common.TYPE_ATOMIC)
 
+    def _tokens_changed(self):
+        self._cached_value_token_index = None
+        self._cached_value = None
+        self._has_cached_value = False
+        self._primitive_value_changed()
+
     def _validate_tokens(self, _tokens):
         if len([token for token in _tokens if not token.type.is_metadata]) != 1:
             raise InvalidElementError('Tokens making up an AtomicElement must contain only one non-metadata token')
 
-    def serialized(self):
-        return ''.join(token.source_substring for token in self.tokens)
-
     def _value_token_index(self):
         """
         Finds the token where the value is stored.
         """
-        # TODO: memoize this value
-        for i, token in enumerate(self.tokens):
+        if self._cached_value_token_index is not None:
+            return self._cached_value_token_index
+        for i, token in enumerate(self._tokens):
             if not token.type.is_metadata:
+                self._cached_value_token_index = i
                 return i
         raise RuntimeError('could not find a value token')
 
@@ -37,7 +47,10 @@ class AtomicElement(common.TokenElement):
         """
         Returns a Python value contained in this atomic element.
         """
-        return toml2py.deserialize(self._tokens[self._value_token_index()])
+        if not self._has_cached_value:
+            self._cached_value = toml2py.deserialize(self._tokens[self._value_token_index()])
+            self._has_cached_value = True
+        return self._cached_value
 
     @property
     def primitive_value(self):
@@ -5,7 +5,48 @@ TYPE_ATOMIC = 'element-atomic'
 TYPE_CONTAINER = 'element-container'
 TYPE_MARKUP = 'element-markup'
 
-class Element:
+def _notifying(method):
+    def mutator(self, *args, **kwargs):
+        result = method(self, *args, **kwargs)
+        self.changes += 1
+        self._on_change()
+        return result
+    return mutator
+
+
+class NotifyingList(list):
+    """
+    A list that calls the given on_change callback after every in-place mutation, and counts them in changes.
+    """
+
+    __slots__ = ('_on_change', 'changes')
+
+    def __init__(self, iterable, on_change):
+        list.__init__(self, iterable)
+        self._on_change = on_change
+        self.changes = 0
+
+    __setitem__ = _notifying(list.__setitem__)
+    __delitem__ = _notifying(list.__delitem__)
+    __iadd__ = _notifying(list.__iadd__)
+    __imul__ = _notifying(list.__imul__)
+    append = _notifying(list.append)
+    extend = _notifying(list.extend)
+    insert = _notifying(list.insert)
+    pop = _notifying(list.pop)
+    remove = _notifying(list.remove)
+    reverse = _notifying(list.reverse)
+    sort = _notifying(list.sort)
+
+    if hasattr(list, 'clear'):
+        clear = _notifying(list.clear)
+
+    if hasattr(list, '__setslice__'):   # Python 2 slice assignment and deletion
+        __setslice__ = _notifying(list.__setslice__)
+        __delslice__ = _notifying(list.__delslice__)
+
+
+class Element(object):
     """
     An Element:
         - is one or more Token instances, or one or more other Element instances. Not both.
@@ -17,6 +58,15 @@ class Element:
             while maintaining its formatting.
     """
 
+    # The container whose cached primitive value or serialized text is made from this element, if any. An element
+    # belongs to a single container at a time: a container caching anything made from an element takes it over,
+    # after which the changes of the element are no longer seen by any container it was taken from. The prettifier
+    # and the sanitizer only ever build a new container from elements whose old container they discard.
+    _parent = None
+
+    # The serialized text of this element, cached until it changes
+    _cached_serialized = None
+
     def __init__(self, _type):
         self._type = _type
 
@@ -24,6 +74,29 @@ class Element:
     def type(self):
         return self._type
 
+    def _primitive_value_changed(self):
+        """
+        Called whenever the primitive value of this element changes, to drop the primitive values cached by the
+        containers it belongs to.
+        """
+        parent = self._parent
+        while parent is not None:
+            parent._cached_primitive_value = None
+            parent = parent._parent
+
+    def _serialized_changed(self):
+        """
+        Called whenever the serialized text of this element changes, to drop the text cached by this element and
+        the containers it belongs to.
+
+        A container only caches its text once its sub-elements did, so the first element found without a cached
+        text ends the walk.
+        """
+        element = self
+        while element is not None and element._cached_serialized is not None:
+            element._cached_serialized = None
+            element = element._parent
+
     @abstractmethod
     def serialized(self):
         """
@@ -31,6 +104,13 @@ class Element:
         """
         raise NotImplementedError
 
+    def serialize_to(self, write):
+        """
+        Writes the TOML serialization of this element piece by piece by calling the given write callable with
+        every piece of str, e.g. the write method of a file object.
+        """
+        write(self.serialized())
+
 
 class TokenElement(Element):
     """
@@ -40,7 +120,16 @@ class TokenElement(Element):
     def __init__(self, _tokens, _type):
         Element.__init__(self, _type)
         self._validate_tokens(_tokens)
-        self._tokens = list(_tokens)
+        self._tokens = NotifyingList(_tokens, self.__changed)
+
+    def __changed(self):
+        self._serialized_changed()
+        self._tokens_changed()
+
+    def _tokens_changed(self):
+        """
+        Called whenever the tokens are mutated in place. Override to drop anything derived from the tokens.
+        """
 
     @property
     def tokens(self):
@@ -55,7 +144,16 @@ class TokenElement(Element):
         raise NotImplementedError
 
     def serialized(self):
-        return ''.join(token.source_substring for token in self._tokens)
+        if self._cached_serialized is None:
+            self._cached_serialized = ''.join(token.source_substring for token in self._tokens)
+        return self._cached_serialized
+
+    def serialize_to(self, write):
+        if self._cached_serialized is not None:
+            write(self._cached_serialized)
+        else:
+            for token in self._tokens:
+                write(token.source_substring)
 
     def __repr__(self):
         return repr(self.tokens)
@@ -73,9 +171,32 @@ class ContainerElement(Element):
     An Element containing exclusively other elements.
     """
 
+    _cached_primitive_value = None
+
     def __init__(self, sub_elements):
         Element.__init__(self, TYPE_CONTAINER)
-        self._sub_elements = list(sub_elements)
+        self._sub_elements = sub_elements
+
+    @property
+    def _sub_elements(self):
+        return self.__sub_elements
+
+    @_sub_elements.setter
+    def _sub_elements(self, sub_elements):
+        self.__sub_elements = NotifyingList(sub_elements, self.__changed)
+        self.__changed()
+
+    def __changed(self):
+        self._cached_primitive_value = None
+        self._primitive_value_changed()
+        self._serialized_changed()
+        self._sub_elements_changed()
+
+    def _sub_elements_changed(self):
+        """
+        Called whenever the sub-elements are replaced or mutated in place. Override to drop anything derived from
+        the sub-elements.
+        """
 
     @property
     def sub_elements(self):
@@ -86,7 +207,26 @@ class ContainerElement(Element):
         return self.sub_elements
 
     def serialized(self):
-        return ''.join(element.serialized() for element in self.sub_elements)
+        """
+        TOML serialization of this element as str, cached until this element or any of the elements it is made of
+        changes.
+        """
+        if self._cached_serialized is None:
+            for element in self._sub_elements:
+                element._parent = self
+            self._cached_serialized = ''.join(element.serialized() for element in self._sub_elements)
+        return self._cached_serialized
+
+    def serialize_to(self, write):
+        """
+        Writes the serialization of every sub-element in turn, see Element.serialize_to(). Unlike serialized(),
+        builds no intermediate str for the sub-elements and caches nothing.
+        """
+        if self._cached_serialized is not None:
+            write(self._cached_serialized)
+        else:
+            for element in self._sub_elements:
+                element.serialize_to(write)
 
     def __repr__(self):
         return repr(self.primitive_value)
@@ -95,6 +235,17 @@ class ContainerElement(Element):
     def primitive_value(self):
         """
         Returns a primitive Python value without any formatting or markup metadata.
+
+        Built once and kept until this element or any of the elements it is made of changes, so it must not be
+        modified.
+        """
+        if self._cached_primitive_value is None:
+            self._cached_primitive_value = self._build_primitive_value()
+        return self._cached_primitive_value
+
+    def _build_primitive_value(self):
+        """
+        Returns a new primitive value, becoming the parent of every sub-element it is made from.
         """
         raise NotImplementedError
 
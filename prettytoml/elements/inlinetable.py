@@ -22,7 +22,7 @@ class InlineTableElement(abstracttable.AbstractTable):
 
             key_i, value_i = self._find_key_and_value(key)
             # Found, then replace the value element with a new one
-            self._sub_elements = self.sub_elements[:value_i] + [new_element] + self.sub_elements[value_i+1:]
+            self._replace_value_element(value_i, new_element)
 
         except KeyError:    # Key does not exist, adding anew!
 
@@ -41,7 +41,7 @@ class InlineTableElement(abstracttable.AbstractTable):
                 ] + new_entry
 
             insertion_index = self._find_closing_curly_bracket()
-            self._sub_elements = self.sub_elements[:insertion_index] + new_entry + self.sub_elements[insertion_index:]
+            self._insert_entry(insertion_index, new_entry, key)
 
     def __delitem__(self, key):
 
@@ -22,7 +22,8 @@ class TableElement(abstracttable.AbstractTable):
         self._check_for_duplicate_keys()
 
     def _check_for_duplicate_keys(self):
-        if len(set(self.keys())) < len(self.keys()):
+        key_positions, ordered_keys = self._indexed_keys()
+        if len(key_positions) < len(ordered_keys):
             raise InvalidElementError('Duplicate keys found')
 
     def __setitem__(self, key, value):
@@ -33,13 +34,19 @@ class TableElement(abstracttable.AbstractTable):
 
     def _update(self, key, value):
         _, value_i = self._find_key_and_value(key)
-        self._sub_elements[value_i] = value if isinstance(value, Element) else factory.create_element(value)
+        self._replace_value_element(value_i, value if isinstance(value, Element) else factory.create_element(value))
 
     def _find_insertion_index(self):
         """
         Returns the self.sub_elements index in which new entries should be inserted.
         """
 
+        if 'insertion_index' not in self._layout:
+            self._layout['insertion_index'] = self._locate_insertion_index()
+        return self._layout['insertion_index']
+
+    def _locate_insertion_index(self):
+
         non_metadata_elements = tuple(self._enumerate_non_metadata_sub_elements())
 
         if not non_metadata_elements:
@@ -55,6 +62,12 @@ class TableElement(abstracttable.AbstractTable):
         Detects the level of indentation used in this table.
         """
 
+        if 'indentation_size' not in self._layout:
+            self._layout['indentation_size'] = self._measure_indentation_size()
+        return self._layout['indentation_size']
+
+    def _measure_indentation_size(self):
+
         def lines():
             # Returns a sequence of sequences of elements belonging to each line
             start = 0
@@ -84,7 +97,7 @@ class TableElement(abstracttable.AbstractTable):
         value_element = value if isinstance(value, Element) else factory.create_element(value)
 
         indentation_size = self._detect_indentation_size()
-        indentation = [factory.create_whitespace_element(self._detect_indentation_size())] if indentation_size else []
+        indentation = [factory.create_whitespace_element(indentation_size)] if indentation_size else []
 
         inserted_elements = indentation + [
             factory.create_string_element(key, bare_allowed=True),
@@ -94,11 +107,12 @@ class TableElement(abstracttable.AbstractTable):
             value_element,
             factory.create_newline_element(),
         ]
-        
+
         insertion_index = self._find_insertion_index()
-        
-        self._sub_elements = \
-            self.sub_elements[:insertion_index] + inserted_elements + self.sub_elements[insertion_index:]
+        layout = self._insert_entry(insertion_index, inserted_elements, key)
+
+        # The new entry ends with its own newline so it keeps the indentation, and the next one goes right after it
+        layout['insertion_index'] = insertion_index + len(inserted_elements)
 
     def __delitem__(self, key):
         begin, _ = self._find_key_and_value(key)
@@ -21,20 +21,31 @@ class TableHeaderElement(TokenElement):
     Raises InvalidElementError.
     """
     
+    # Derived from the tokens and dropped whenever they change
+    _names = None
+    _is_array_of_tables = None
+
     def __init__(self, _tokens):
         TokenElement.__init__(self, _tokens, common.TYPE_MARKUP)
-        self._names = tuple(toml2py.deserialize(token) for token in self._tokens if token.type in _name_types)
+
+    def _tokens_changed(self):
+        self._names = None
+        self._is_array_of_tables = None
 
     @property
     def is_array_of_tables(self):
-        opening_bracket = next(token for i, token in enumerate(self._tokens) if token.type in _opening_bracket_types)
-        return opening_bracket.type == tokens.TYPE_OP_DOUBLE_SQUARE_LEFT_BRACKET
+        if self._is_array_of_tables is None:
+            opening_bracket = next(token for token in self._tokens if token.type in _opening_bracket_types)
+            self._is_array_of_tables = opening_bracket.type == tokens.TYPE_OP_DOUBLE_SQUARE_LEFT_BRACKET
+        return self._is_array_of_tables
 
     @property
     def names(self):
         """
         Returns a sequence of string names making up this table header name.
         """
+        if self._names is None:
+            self._names = tuple(toml2py.deserialize(token) for token in self._tokens if token.type in _name_types)
         return self._names
 
     def has_name_prefix(self, names):
@@ -46,9 +57,6 @@ class TableHeaderElement(TokenElement):
                 return False
         return True
 
-    def serialized(self):
-        return ''.join(token.source_substring for token in self._tokens)
-
     def is_named(self, names):
         """
         Returns True if the given name sequence matches the full name of this header.
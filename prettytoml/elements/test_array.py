@@ -65,3 +65,39 @@ def test_array_element():
 
     # Test primitive_value
     assert [4, 8, 42, 12, 77] == array_element.primitive_value
+
+
+def test_array_element_keeps_its_values_indexed():
+    from prettytoml import parser
+
+    array_element = parser.parse_tokens(lexer.tokenize('a = [1, 2, 3]\n'))[0]['a']
+
+    for v in range(4, 1001):
+        array_element.append(v)
+    del array_element[0]
+    del array_element[-1]
+    array_element[0] = 42
+    array_element.turn_into_multiline()
+
+    assert len(array_element) == 998
+    assert array_element[0] == 42 and array_element[1] == 3 and array_element[-1] == 999
+    assert array_element.primitive_value == [42] + list(range(3, 1000))
+    assert array_element.serialized().startswith('[42,\n 3,\n 4,\n')
+
+    # Mutating the sub-elements directly drops the index
+    array_element.sub_elements[1:3] = []
+    assert array_element[0] == 3
+    assert len(array_element) == 997
+
+
+def test_deleting_from_an_array_with_a_trailing_comma():
+    from prettytoml import parser
+
+    table = parser.parse_tokens(lexer.tokenize('a = [1, 2,]\nm = [\n  1,\n]\n'))[0]
+
+    del table['a'][1]
+    assert table['a'].primitive_value == [1] and len(table['a']) == 1
+
+    del table['m'][0]
+    assert table['m'].primitive_value == [] and len(table['m']) == 0
+    assert table.serialized() == 'a = [1,]\nm = [\n  ]\n'
@@ -7,3 +7,15 @@ def test_atomic_element():
     assert element.value == 42
     element.set(23)
     assert element.serialized() == ' \t 23 '
+
+
+def test_atomic_element_value_is_cached_until_its_tokens_change():
+    element = AtomicElement(tuple(lexer.tokenize(' "a string" ')))
+    value = element.value
+    assert element.value is value
+
+    element.tokens[element._value_token_index()] = tuple(lexer.tokenize('42'))[0]
+    assert element.value == 42
+
+    element.set(23)
+    assert element.value == 23
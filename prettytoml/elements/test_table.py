@@ -57,3 +57,102 @@ relation = "another"
     assert table.serialized() == expected_toml
 
 
+
+
+def test_table_keeps_its_keys_indexed_across_mutations():
+    from prettytoml import parser
+
+    table = parser.parse_tokens(lexer.tokenize('  a = 1\n  b = 2\n\n'))[0]
+
+    for i in range(100):
+        table['k{}'.format(i)] = i
+    table['a'] = 'first'
+    del table['k50']
+
+    assert len(table) == 101
+    assert 'k50' not in table and 'k99' in table
+    assert table.keys()[:3] == ('a', 'b', 'k0')
+    assert table['a'] == 'first'
+
+    reparsed = parser.parse_tokens(lexer.tokenize(table.serialized()))[0]
+    assert reparsed.serialized() == table.serialized()
+    assert reparsed.primitive_value == table.primitive_value
+    assert '  k99 = 99\n' in table.serialized()
+
+    # Mutating the sub-elements directly drops the index
+    del table.sub_elements[:6]
+    assert 'a' not in table
+    assert table['b'] == 2
+
+
+def test_table_caches_its_primitive_value_until_changed():
+    from prettytoml import parser
+
+    table = parser.parse_tokens(lexer.tokenize('a = 1\nb = [{ c = [1, 2] }, { c = [3] }]\n'))[0]
+
+    value = table.primitive_value
+    assert value == {'a': 1, 'b': [{'c': [1, 2]}, {'c': [3]}]}
+    assert table.primitive_value is value
+
+    table['b'][1]['c'].append(4)
+    assert table.primitive_value == {'a': 1, 'b': [{'c': [1, 2]}, {'c': [3, 4]}]}
+    assert table.primitive_value['b'][0] is value['b'][0]
+
+    next(e for e in table['b'][0]['c'].sub_elements if isinstance(e, AtomicElement)).set(20)
+    assert table.primitive_value['b'][0]['c'] == [20, 2]
+
+    table['d'] = 'new'
+    del table['a']
+    assert table.primitive_value == {'b': [{'c': [20, 2]}, {'c': [3, 4]}], 'd': 'new'}
+
+    table.set_fallback({'e': 5})
+    assert table.primitive_value['e'] == 5
+
+
+def test_table_caches_its_serialized_text_until_changed():
+    from prettytoml import parser
+
+    table = parser.parse_tokens(lexer.tokenize('a = 1\nb = [{ c = [1, 2] }, { c = [3] }]\n'))[0]
+
+    text = table.serialized()
+    assert table.serialized() is text
+
+    next(e for e in table['b'][0]['c'].sub_elements if isinstance(e, AtomicElement)).set(20)
+    assert table.serialized() == 'a = 1\nb = [{ c = [20, 2] }, { c = [3] }]\n'
+
+    whitespace = next(e for e in table.sub_elements if isinstance(e, WhitespaceElement) and e.tokens)
+    whitespace.tokens[0] = next(lexer.tokenize('\t'))
+    assert table.serialized() == 'a\t= 1\nb = [{ c = [20, 2] }, { c = [3] }]\n'
+
+    table['b'][1]['c'].append(4)
+    assert table.serialized() == 'a\t= 1\nb = [{ c = [20, 2] }, { c = [3, 4] }]\n'
+
+
+def test_table_inserts_new_entries_in_place():
+    from prettytoml import parser
+
+    table = parser.parse_tokens(lexer.tokenize('a = 1\n'))[0]
+    sub_elements = table.sub_elements
+
+    for i in range(100):
+        table['k{}'.format(i)] = i
+
+    # Every insertion is a single slice assignment into the same list, not a copy of all the sub-elements
+    assert table.sub_elements is sub_elements
+    assert sub_elements.changes == 100
+    assert table.keys()[-1] == 'k99'
+
+
+def test_table_built_from_the_elements_of_another_takes_them_over():
+    from prettytoml import parser
+
+    old_table = parser.parse_tokens(lexer.tokenize('a = 1\nb = [2]\n'))[0]
+    assert old_table.serialized() == 'a = 1\nb = [2]\n'
+
+    table = TableElement(old_table.sub_elements[:])
+    assert table.serialized() == 'a = 1\nb = [2]\n'
+    assert table.primitive_value == {'a': 1, 'b': [2]}
+
+    table['b'].append(3)
+    assert table.serialized() == 'a = 1\nb = [2, 3]\n'
+    assert table.primitive_value == {'a': 1, 'b': [2, 3]}
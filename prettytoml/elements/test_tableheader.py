@@ -10,3 +10,13 @@ def test_tableheader():
     assert ('personal', 'information', 'details') == element.names
 
     assert element.has_name_prefix(('personal', 'information'))
+
+
+def test_tableheader_properties_follow_its_tokens():
+    element = TableHeaderElement(tuple(lexer.tokenize('[a.b]\n')))
+    assert element.names == ('a', 'b')
+    assert not element.is_array_of_tables
+
+    element.tokens[:] = tuple(lexer.tokenize('[[c]]\n'))
+    assert element.names == ('c',)
+    assert element.is_array_of_tables
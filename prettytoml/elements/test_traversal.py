@@ -16,3 +16,21 @@ def test_traversal():
     assert dummy_file._find_preceding_table(4) == 2
     assert dummy_file._find_preceding_table(2) == 0
     assert dummy_file._find_preceding_table(0) < 0
+
+
+def test_scanner():
+    from prettytoml.elements import traversal as t
+    from prettytoml.elements.test_common import dummy_file_elements
+
+    elements = dummy_file_elements()
+    scanner = t.Scanner(elements)
+
+    for i in range(-1, len(elements)+1):
+        for predicate in (t.predicates.table, t.predicates.table_header):
+            assert scanner.following(predicate, i) == t.find_following(elements, predicate, i)
+            assert scanner.preceding(predicate, i) == t.find_previous(elements, predicate, i)
+
+    assert scanner.positions(t.predicates.table_header) == [1, 3, 5, 7]
+    assert scanner.following(t.predicates.table_header) == 1
+    assert scanner.preceding(t.predicates.table) == 8
+    assert scanner.is_current(elements)
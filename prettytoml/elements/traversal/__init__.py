@@ -1,28 +1,39 @@
-from prettytoml import tokens
-from prettytoml.elements import common
-from prettytoml.elements.metadata import PunctuationElement, NewlineElement
 from prettytoml.elements.traversal import predicates
+from prettytoml.elements.traversal.scanner import Scanner
 
 
 class TraversalMixin:
     """
     A mix-in that provides convenient sub-element traversal to any class with
     an `elements` member that is a sequence of Element instances
+
+    The elements must either be immutable or a NotifyingList.
     """
 
+    _traversal_scanner = None
+
+    def _scanner(self):
+        """
+        Returns a Scanner of the current self.elements.
+        """
+        elements = self.elements
+        if not (self._traversal_scanner and self._traversal_scanner.is_current(elements)):
+            self._traversal_scanner = Scanner(elements)
+        return self._traversal_scanner
+
     def __find_following_element(self, index, predicate):
         """
         Finds and returns the index of element in self.elements that evaluates the given predicate to True
         and whose index is higher than the given index, or returns -Infinity on failure.
         """
-        return find_following(self.elements, predicate, index)
+        return self._scanner().following(predicate, index)
 
     def __find_preceding_element(self, index, predicate):
         """
         Finds and returns the index of the element in self.elements that evaluates the given predicate to True
         and whose index is lower than the given index.
         """
-        i = find_previous(self.elements, predicate, index)
+        i = self._scanner().preceding(predicate, index)
         if i == float('inf'):
             return float('-inf')
         return i
@@ -41,7 +52,8 @@ class TraversalMixin:
         """
         Returns a sequence of of (index, sub_element) of the non-metadata sub-elements.
         """
-        return ((i, element) for i, element in enumerate(self.elements) if element.type != common.TYPE_METADATA)
+        elements = self.elements
+        return ((i, elements[i]) for i in self._scanner().positions(predicates.non_metadata))
 
     def _find_preceding_comma(self, index):
         """
@@ -53,15 +65,13 @@ class TraversalMixin:
         """
         Returns the index of the following comma element after the given index, or -Infinity.
         """
-        def predicate(element):
-            return isinstance(element, PunctuationElement) and element.token.type == tokens.TYPE_OP_COMMA
-        return self.__find_following_element(index, predicate)
+        return self.__find_following_element(index, predicates.op_comma)
 
     def _find_following_newline(self, index):
         """
         Returns the index of the following newline element after the given index, or -Infinity.
         """
-        return self.__find_following_element(index, lambda e: isinstance(e, NewlineElement))
+        return self.__find_following_element(index, predicates.newline)
 
     def _find_following_comment(self, index):
         """
@@ -133,9 +143,7 @@ class TraversalMixin:
         """
         Returns the index to the closing curly bracket, or raises an Error.
         """
-        def predicate(element):
-            return isinstance(element, PunctuationElement) and element.token.type == tokens.TYPE_OP_CURLY_RIGHT_BRACKET
-        return self.__must_find_following_element(predicate)
+        return self.__must_find_following_element(predicates.closing_curly_bracket)
 
     def _find_following_table_header(self, index):
         """
@@ -149,14 +157,13 @@ def find_following(element_seq, predicate, index=None):
     Finds and returns the index of the next element fulfilling the specified predicate after the specified
     index, or -Infinity.
 
-    Starts searching linearly from the start_from index.
+    Starts searching linearly from the start_from index, without copying the sequence.
     """
 
-    if isinstance(index, (int, float)) and index < 0:
-        index = None
+    start = int(index) + 1 if (index is not None and index >= 0) else 0
 
-    for i, element in tuple(enumerate(element_seq))[index+1 if index is not None else index:]:
-        if predicate(element):
+    for i in range(start, len(element_seq)):
+        if predicate(element_seq[i]):
             return i
     return float('-inf')
 
@@ -165,11 +172,16 @@ def find_previous(element_seq, predicate, index=None):
     """
     Finds and returns the index of the previous element fulfilling the specified predicate preceding to the specified
     index, or Infinity.
+
+    Searches linearly backwards from the specified index, without copying the sequence. A negative index counts from
+    the end.
     """
-    if isinstance(index, (int, float)) and index >= len(element_seq):
-        index = None
+    if index is None or index >= len(element_seq):
+        index = len(element_seq)
+    elif index < 0:
+        index = max(index + len(element_seq), 0)
 
-    for i, element in reversed(tuple(enumerate(element_seq))[:index]):
-        if predicate(element):
+    for i in range(int(index)-1, -1, -1):
+        if predicate(element_seq[i]):
             return i
     return float('inf')
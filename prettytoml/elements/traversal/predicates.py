@@ -35,6 +35,10 @@ opening_square_bracket = \
     lambda e: isinstance(e, PunctuationElement) and e.token.type == tokens.TYPE_OP_SQUARE_LEFT_BRACKET
 
 
+closing_curly_bracket = \
+    lambda e: isinstance(e, PunctuationElement) and e.token.type == tokens.TYPE_OP_CURLY_RIGHT_BRACKET
+
+
 def table(e):
     from ..table import TableElement
     return isinstance(e, TableElement)
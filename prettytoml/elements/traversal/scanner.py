@@ -0,0 +1,64 @@
+"""
+    Seeking elements matching predicates in a sequence of elements without scanning it over and over.
+"""
+
+import bisect
+
+
+class Scanner(object):
+    """
+    Answers seeks for the elements matching given predicates forward and backward from any position in a sequence
+    of elements, in O(log n) each.
+
+    The positions of the elements matching each predicate are collected in a single pass the first time the
+    predicate is sought, so the sequence must not be modified while scanned. A NotifyingList can be modified
+    as long as is_current() is checked before reusing the Scanner.
+    """
+
+    def __init__(self, elements):
+        self._elements = elements
+        self._changes = getattr(elements, 'changes', None)
+        self._positions = {}
+
+    @property
+    def elements(self):
+        return self._elements
+
+    def is_current(self, elements):
+        """
+        Returns True if this Scanner is scanning the given sequence as it currently is.
+        """
+        return elements is self._elements and getattr(elements, 'changes', None) == self._changes
+
+    def positions(self, predicate):
+        """
+        Returns the sorted list of the positions of the elements fulfilling the given predicate.
+        """
+        positions = self._positions.get(predicate)
+        if positions is None:
+            positions = self._positions[predicate] = [i for i, e in enumerate(self._elements) if predicate(e)]
+        return positions
+
+    def following(self, predicate, index=None):
+        """
+        Returns the position of the first element fulfilling the predicate after the given position, or -Infinity.
+        Starts from the first element if no position or a negative one is given.
+        """
+        positions = self.positions(predicate)
+        k = bisect.bisect_right(positions, index) if (index is not None and index >= 0) else 0
+        return positions[k] if k < len(positions) else float('-inf')
+
+    def preceding(self, predicate, index=None):
+        """
+        Returns the position of the last element fulfilling the predicate before the given position, or Infinity.
+        Starts from the last element if no position or one past the end is given, and a negative position counts
+        from the end.
+        """
+        if index is None or index >= len(self._elements):
+            index = len(self._elements)
+        elif index < 0:
+            index = max(index + len(self._elements), 0)
+
+        positions = self.positions(predicate)
+        k = bisect.bisect_left(positions, index)
+        return positions[k-1] if k > 0 else float('inf')
@@ -7,6 +7,8 @@ from collections import namedtuple
 import re
 from prettytoml import tokens
 from prettytoml.errors import TOMLError
+from prettytoml.lexer import dispatch
+from prettytoml.tokens.buffer import LineIndex, TokenBuffer
 
 TokenSpec = namedtuple('TokenSpec', ('type', 're'))
 
@@ -67,6 +69,26 @@ def _munch_a_token(source):
     return _choose_from_next_token_candidates(candidates)
 
 
+def _candidates_munch(source, index):
+    """
+    Returns (token_type, end_index) of the token recognized at the given index of the source by running all the
+    lexical specs against the remainder of the source, or None if no token type could be recognized.
+    """
+    token = _munch_a_token(source[index:])
+    if token:
+        return token.type, index + len(token.source_substring)
+
+
+# Available lexer engines. Both recognize exactly the same tokens.
+ENGINE_CANDIDATES = 'candidates'
+ENGINE_DISPATCH = 'dispatch'
+
+_munchers = {
+    ENGINE_CANDIDATES: _candidates_munch,
+    ENGINE_DISPATCH: dispatch.build_munch(_LEXICAL_SPECS),
+}
+
+
 class LexerError(TOMLError):
 
     def __init__(self, message):
@@ -79,45 +101,195 @@ class LexerError(TOMLError):
         return self._message
 
 
-def tokenize(source, is_top_level=False):
+def _normalized_source(source, is_top_level):
+    # Newlines are going to be normalized to UNIX newlines.
+    source = source.replace('\r\n', '\n')
+
+    if is_top_level and source and source[-1] != '\n':
+        source += '\n'
+
+    return source
+
+
+def _spans(source, engine):
+    """
+    Yields (token_type, start, end) for every token in the given normalized source.
+    """
+
+    if engine not in _munchers:
+        raise ValueError('Unknown lexer engine: {}'.format(engine))
+    munch = _munchers[engine]
+
+    next_index = 0
+    while next_index < len(source):
+
+        munched = munch(source, next_index)
+
+        if not munched:
+            row, col = LineIndex(source).row_col(next_index)
+            raise LexerError("failed to read the next token at ({}, {}): {}".format(row, col, source[next_index:]))
+
+        token_type, token_end = munched
+        yield token_type, next_index, token_end
+        next_index = token_end
+
+
+def tokenize(source, is_top_level=False, engine=ENGINE_DISPATCH):
     """
     Tokenizes the input TOML source into a stream of tokens.
 
     If is_top_level is set to True, will make sure that the input source has a trailing newline character
     before it is tokenized.
 
+    The engine is one of the ENGINE_* constants: ENGINE_DISPATCH only attempts the lexical specs that can start
+    with the character at hand, while ENGINE_CANDIDATES runs all the specs against the remainder of the source
+    for every token.
+
     Raises a LexerError when it fails recognize another token while not at the end of the source.
     """
 
-    # Newlines are going to be normalized to UNIX newlines.
-    source = source.replace('\r\n', '\n')
+    source = _normalized_source(source, is_top_level)
 
-    if is_top_level and source and source[-1] != '\n':
-        source += '\n'
+    next_row = 1
+    next_col = 1
+
+    for token_type, start, end in _spans(source, engine):
+        yield tokens.Token(token_type, source[start:end], next_col, next_row)
+        next_row, next_col = _advanced_position(next_row, next_col, source, start, end)
+
+
+def tokenize_from(source, index, row=1, col=1, engine=ENGINE_DISPATCH):
+    """
+    Tokenizes the given normalized source from the given index on, which must be the start of a token at the given
+    (row, col) position, such as the start of a line outside of any multiline string.
+
+    Yields the same tokens as tokenize() does on the whole source from that index on, leaving it to the consumer
+    to stop once it has read enough of them.
+
+    Raises a LexerError when it fails recognize another token while not at the end of the source.
+    """
+    if engine not in _munchers:
+        raise ValueError('Unknown lexer engine: {}'.format(engine))
+    munch = _munchers[engine]
+
+    while index < len(source):
+
+        munched = munch(source, index)
+
+        if not munched:
+            raise LexerError("failed to read the next token at ({}, {}): {}".format(row, col, source[index:]))
+
+        token_type, token_end = munched
+        yield tokens.Token(token_type, source[index:token_end], col, row)
+        row, col = _advanced_position(row, col, source, index, token_end)
+        index = token_end
+
+
+def _advanced_position(row, col, source, start, end):
+    """
+    Returns the (row, col) position following source[start:end] given the position it starts at.
+    """
+    newline_count = source.count('\n', start, end)
+    if newline_count:
+        return row + newline_count, end - source.rfind('\n', start, end)
+    return row, col + end - start
+
+
+_MULTILINE_QUOTES = ('"""', "'''")
+_MULTILINE_STRING_TYPES = (tokens.TYPE_MULTILINE_STRING, tokens.TYPE_MULTILINE_LITERAL_STRING)
+
+
+def tokenize_chunks(chunks, is_top_level=False, engine=ENGINE_DISPATCH):
+    """
+    Tokenizes TOML source text arriving as an iterable of str chunks into a stream of tokens.
+
+    Yields exactly the same tokens as tokenize() would on the concatenation of the chunks, but a token is yielded
+    as soon as the chunks read so far are enough to recognize it, and only the text not tokenized yet is kept.
+
+    Raises a LexerError when it fails recognize another token while not at the end of the source.
+    """
+
+    if engine not in _munchers:
+        raise ValueError('Unknown lexer engine: {}'.format(engine))
+    munch = _munchers[engine]
+
+    chunks = iter(chunks)
+    source = ''
+    index = 0
+    held_back = ''      # A trailing carriage return that may turn out to be the first half of a '\r\n'
+    last_char = ''
+    at_end = False
 
     next_row = 1
     next_col = 1
-    next_index = 0
 
-    while next_index < len(source):
+    while True:
+
+        # Only tokens ending on a complete line can be told apart from the prefix of a longer token
+        safe_end = len(source) if at_end else source.rfind('\n', index) + 1
+
+        while index < safe_end:
+
+            munched = munch(source, index)
+
+            if not at_end and (not munched or munched[1] > safe_end or
+                               (source.startswith(_MULTILINE_QUOTES, index) and
+                                munched[0] not in _MULTILINE_STRING_TYPES)):
+                break   # Could be an incomplete token, wait for more text
+
+            if not munched:
+                raise LexerError("failed to read the next token at ({}, {}): {}".format(
+                    next_row, next_col, source[index:]))
+
+            token_type, token_end = munched
+            yield tokens.Token(token_type, source[index:token_end], next_col, next_row)
+            next_row, next_col = _advanced_position(next_row, next_col, source, index, token_end)
+            index = token_end
+
+        if at_end:
+            return
+
+        chunk = next(chunks, None)
 
-        new_token = _munch_a_token(source[next_index:])
+        if chunk is None:
+            at_end = True
+            chunk = held_back
+            if is_top_level and (chunk or last_char) and (chunk or last_char)[-1] != '\n':
+                chunk += '\n'
+        else:
+            chunk = held_back + chunk
+            held_back = '\r' if chunk.endswith('\r') else ''
+            chunk = chunk[:len(chunk)-len(held_back)].replace('\r\n', '\n')
+            last_char = chunk[-1:] or last_char
 
-        if not new_token:
-            raise LexerError("failed to read the next token at ({}, {}): {}".format(
-                next_row, next_col, source[next_index:]))
+        source = source[index:] + chunk
+        index = 0
 
-        # Set the col and row on the new token
-        new_token = tokens.Token(new_token.type, new_token.source_substring, next_col, next_row)
 
-        # Advance the index, row and col count
-        next_index += len(new_token.source_substring)
-        for c in new_token.source_substring:
-            if c == '\n':
-                next_row += 1
-                next_col = 1
-            else:
-                next_col += 1
+def tokenize_spans(source, is_top_level=False, engine=ENGINE_DISPATCH):
+    """
+    Tokenizes the input TOML source into (normalized_source, spans) where spans is the list of the
+    (token_type, start, end) of every token of the normalized source, for consumers that need no Token at all.
+
+    Arguments are the same as in tokenize().
+
+    Raises a LexerError when it fails recognize another token while not at the end of the source.
+    """
+    source = _normalized_source(source, is_top_level)
+    return source, list(_spans(source, engine))
 
-        yield new_token
 
+def tokenize_offsets(source, is_top_level=False, engine=ENGINE_DISPATCH):
+    """
+    Tokenizes the input TOML source into a compact TokenBuffer that stores every token as offsets into the
+    normalized source, materializing token text and positions only when accessed.
+
+    Arguments are the same as in tokenize().
+
+    Raises a LexerError when it fails recognize another token while not at the end of the source.
+    """
+    source = _normalized_source(source, is_top_level)
+    token_buffer = TokenBuffer(source)
+    for token_type, start, end in _spans(source, engine):
+        token_buffer.append(token_type, start, end)
+    return token_buffer
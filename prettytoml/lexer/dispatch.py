@@ -0,0 +1,94 @@
+"""
+A first-character dispatching lexer engine.
+
+Instead of running every lexical spec against the remainder of the source for every token, the specs are
+pre-grouped by the characters a token of their type can start with. Munching a token then only attempts the
+handful of specs registered for the character at the current position, using anchored
+`pattern.match(source, pos)` calls that never copy the source.
+
+The maximal-munch and priority tie-breaking semantics are exactly those of the candidate scanning engine.
+"""
+
+import re
+import string
+from prettytoml import tokens
+
+_DIGITS = string.digits
+_BARE_CHARS = string.ascii_letters + string.digits + '_-'
+
+# The set of characters a token of each type can possibly start with. A superset is harmless (it only costs a
+# failed match attempt) but a missing character would make the engine diverge from the candidate scanning engine.
+_FIRST_CHARS = {
+    tokens.TYPE_COMMENT: '#',
+    tokens.TYPE_STRING: '"',
+    tokens.TYPE_MULTILINE_STRING: '"',
+    tokens.TYPE_LITERAL_STRING: "'",
+    tokens.TYPE_MULTILINE_LITERAL_STRING: "'",
+    tokens.TYPE_BARE_STRING: _BARE_CHARS,
+    tokens.TYPE_DATE: _DIGITS,
+    tokens.TYPE_WHITESPACE: ' \t',
+    tokens.TYPE_INTEGER: _DIGITS + '+-',
+    tokens.TYPE_FLOAT: _DIGITS + '+-',
+    tokens.TYPE_BOOLEAN: 'tf',
+    tokens.TYPE_OP_SQUARE_LEFT_BRACKET: '[',
+    tokens.TYPE_OP_SQUARE_RIGHT_BRACKET: ']',
+    tokens.TYPE_OP_CURLY_LEFT_BRACKET: '{',
+    tokens.TYPE_OP_CURLY_RIGHT_BRACKET: '}',
+    tokens.TYPE_OP_ASSIGNMENT: '=',
+    tokens.TYPE_OP_COMMA: ',',
+    tokens.TYPE_OP_DOUBLE_SQUARE_LEFT_BRACKET: '[',
+    tokens.TYPE_OP_DOUBLE_SQUARE_RIGHT_BRACKET: ']',
+    tokens.TYPE_OPT_DOT: '.',
+    tokens.TYPE_NEWLINE: '\n\r',
+}
+
+
+def _unanchored(pattern):
+    """
+    Returns an equivalent of the given '^'-anchored compiled pattern that can be used with pattern.match(s, pos).
+    """
+    assert pattern.pattern.startswith('^'), 'lexical specs are expected to be anchored'
+    return re.compile(pattern.pattern[1:], pattern.flags)
+
+
+def build_munch(lexical_specs):
+    """
+    Builds and returns a munch(source, index) function for the given sequence of lexer.TokenSpec instances.
+
+    munch(source, index) returns a (token_type, end_index) pair for the token recognized at the given index
+    of the source, or None if no token type could be recognized there.
+    """
+
+    # Candidates for each first character, ordered by priority with ties broken by their order in the specs.
+    dispatch = {}
+    for spec_order, spec in enumerate(lexical_specs):
+        if spec.type not in _FIRST_CHARS:
+            raise ValueError('No first characters known for token type {}'.format(spec.type))
+        pattern = _unanchored(spec.re)
+        for c in _FIRST_CHARS[spec.type]:
+            dispatch.setdefault(c, []).append((spec.type.priority, spec_order, spec.type, pattern))
+
+    dispatch = {
+        c: tuple((token_type, pattern) for (_, _, token_type, pattern) in sorted(candidates, key=lambda x: x[:2]))
+        for c, candidates in dispatch.items()
+    }
+
+    def munch(source, index):
+        candidates = dispatch.get(source[index])
+        if not candidates:
+            return None
+
+        if len(candidates) == 1:
+            token_type, pattern = candidates[0]
+            match = pattern.match(source, index)
+            return (token_type, match.end(1)) if match else None
+
+        # Maximal munch: the first candidate in priority order wins among those of the longest length
+        chosen = None
+        for token_type, pattern in candidates:
+            match = pattern.match(source, index)
+            if match and (not chosen or match.end(1) > chosen[1]):
+                chosen = (token_type, match.end(1))
+        return chosen
+
+    return munch
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 
-from prettytoml.lexer import _munch_a_token
+import random
+from prettytoml.lexer import _munch_a_token, _munchers
 from prettytoml.lexer import *
 
 # A mapping from token types to a sequence of pairs of (source_text, expected_matched_text)
@@ -151,3 +152,80 @@ def test_token_type_order():
 
     assert type_b < type_c < type_a
     assert type_a > type_c > type_b
+
+
+def test_dispatching_engine_munches_like_the_candidates_engine():
+    munch = _munchers[ENGINE_DISPATCH]
+    for token_type in valid_tokens:
+        for (source, expected_match) in valid_tokens[token_type]:
+            assert munch(source, 0) == (token_type, len(expected_match))
+
+
+def test_engines_produce_identical_tokens():
+    sources = [open(path).read() for path in ('sample.toml', 'dateless_sample.toml', 'sample-prettified.toml')]
+    sources += [source for pairs in valid_tokens.values() for (source, _) in pairs]
+
+    random.seed(42)
+    alphabet = 'ab1_-+.=,#"\'[]{} \t\ntrue5e:TZ'
+    sources += [''.join(random.choice(alphabet) for _ in range(30)) for _ in range(500)]
+
+    def lexed(source, engine):
+        try:
+            return [(t.type, t.source_substring, t.row, t.col) for t in tokenize(source, engine=engine)]
+        except LexerError as e:
+            return str(e)
+
+    for source in sources:
+        assert lexed(source, ENGINE_DISPATCH) == lexed(source, ENGINE_CANDIDATES), source
+
+
+def test_offset_tokens_match_tokenized_tokens():
+    source = open('sample.toml').read()
+
+    token_buffer = tokenize_offsets(source, is_top_level=True)
+    expected = tuple(tokenize(source, is_top_level=True))
+
+    assert len(token_buffer) == len(expected)
+    assert token_buffer.byte_size() < 10 * len(token_buffer)
+    assert [(t.type, t.source_substring, t.row, t.col) for t in token_buffer] == \
+           [(t.type, t.source_substring, t.row, t.col) for t in expected]
+    assert token_buffer[3] == expected[3]
+    assert token_buffer[-2:] == expected[-2:]
+
+
+def test_offset_tokens_memoize_their_values():
+    from prettytoml.tokens import toml2py
+
+    token_buffer = tokenize_offsets('a = "some text"\n', is_top_level=True)
+    string_i = next(i for (i, t) in enumerate(token_buffer) if t.type == tokens.TYPE_STRING)
+
+    value = toml2py.deserialize(token_buffer[string_i])
+    assert value == 'some text'
+    assert token_buffer[string_i]._value is value
+
+
+def test_tokenizing_chunks():
+
+    def chunked(text, size):
+        return [text[i:i+size] for i in range(0, len(text), size)]
+
+    def lexed(tokens_):
+        try:
+            return [(t.type, t.source_substring, t.row, t.col) for t in tokens_]
+        except LexerError as e:
+            return str(e)
+
+    sources = [open(path).read() for path in ('sample.toml', 'dateless_sample.toml')]
+    sources += [
+        'a = """\r\nmulti\r\n\r\nline"""\r\nb = \'\'\'x\n\'\'\'',
+        "k = '''\n''' # c\r",
+        '"string\nspanning lines" \r\r\n',
+        'k = 1 ?\n',
+        '',
+    ]
+
+    for source in sources:
+        for is_top_level in (True, False):
+            expected = lexed(tokenize(source, is_top_level=is_top_level))
+            for size in (1, 2, 3, 5, 64, 4096):
+                assert lexed(tokenize_chunks(chunked(source, size), is_top_level=is_top_level)) == expected
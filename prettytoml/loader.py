@@ -0,0 +1,253 @@
+"""
+    Loading TOML text straight into Python dicts and lists.
+
+    Recognizes the same grammar as the parser (see prettytoml.parser.iterative) and produces the same value as the
+    primitive_value of the parsed Document, but no element is ever built: values are deserialized from the tokens
+    as they are met and stored right away in the dict of the table they belong to.
+"""
+
+from prettytoml import tokens
+from prettytoml.errors import DuplicateKeysError
+from prettytoml.lexer import tokenize_spans
+from prettytoml.parser.errors import ParsingError
+from prettytoml.tokens import toml2py
+from prettytoml.tokens.buffer import LineIndex
+
+_STRING_TYPES = frozenset((
+    tokens.TYPE_BARE_STRING,
+    tokens.TYPE_STRING,
+    tokens.TYPE_LITERAL_STRING,
+    tokens.TYPE_MULTILINE_STRING,
+    tokens.TYPE_MULTILINE_LITERAL_STRING,
+))
+
+_ATOMIC_TYPES = _STRING_TYPES | frozenset((
+    tokens.TYPE_INTEGER,
+    tokens.TYPE_FLOAT,
+    tokens.TYPE_DATE,
+    tokens.TYPE_BOOLEAN,
+))
+
+_ARRAY_METADATA_TYPES = frozenset((
+    tokens.TYPE_WHITESPACE,
+    tokens.TYPE_NEWLINE,
+    tokens.TYPE_COMMENT,
+))
+
+_CLOSING_HEADER_BRACKETS = {
+    tokens.TYPE_OP_SQUARE_LEFT_BRACKET: tokens.TYPE_OP_SQUARE_RIGHT_BRACKET,
+    tokens.TYPE_OP_DOUBLE_SQUARE_LEFT_BRACKET: tokens.TYPE_OP_DOUBLE_SQUARE_RIGHT_BRACKET,
+}
+
+
+def loads(toml_text):
+    """
+    Loads the given TOML text into a dict of primitive Python values, with an array of tables as a list of dicts.
+
+    Raises ParsingError on invalid TOML input, DuplicateKeysError on a key repeated in the same table section.
+    """
+    return _Loader(*tokenize_spans(toml_text, is_top_level=True)).document()
+
+
+class _Loader:
+    """
+    Loads values out of the token spans of a source (see lexer.tokenize_spans()). Every loading method accepts a
+    token index and returns (VALUE, next_index), or raises ParsingError.
+
+    Tokens are only materialized for the values to deserialize.
+    """
+
+    def __init__(self, source, spans):
+        self._source = source
+        self._types = [token_type for (token_type, _, _) in spans]
+        self._types.append(None)    # Marking the end of the tokens
+        self._spans = spans
+
+    def _token(self, i):
+        """
+        Returns the token at the given index, with its position in the source.
+        """
+        token_type, start, end = self._spans[i]
+        row, col = LineIndex(self._source).row_col(start)
+        return tokens.Token(token_type, self._source[start:end], col, row)
+
+    def _deserialized(self, i):
+        token_type, start, end = self._spans[i]
+        return toml2py.deserialize(tokens.Token(token_type, self._source[start:end]))
+
+    def _error(self, message, i):
+        return ParsingError(message, self._token(min(i, len(self._spans)-1)))
+
+    def _skip_whitespace(self, i):
+        types = self._types
+        while types[i] == tokens.TYPE_WHITESPACE:
+            i += 1
+        return i
+
+    def _expect(self, token_type, i, message):
+        if self._types[i] != token_type:
+            raise self._error(message, i)
+        return i + 1
+
+    def _line_terminator_end(self, i):
+        """
+        Returns the index following the line terminator tokens at the given index.
+        """
+        token_type = self._types[i]
+        if token_type == tokens.TYPE_COMMENT and self._types[i+1] == tokens.TYPE_NEWLINE:
+            return i + 2
+        elif token_type == tokens.TYPE_NEWLINE:
+            return i + 1
+        raise self._error('Expected the end of the line', i)
+
+    def _string(self, i):
+        if self._types[i] not in _STRING_TYPES:
+            raise self._error('Expected a name', i)
+        return self._deserialized(i), i+1
+
+    def document(self):
+        """
+        TOMLFileElements -> FileEntry TOMLFileElements | FileEntry | EmptyLine | EMPTY
+        """
+        root = {}
+        table, section_keys = root, set()
+        end = len(self._spans)
+
+        i = 0
+        while True:
+            i = self._skip_whitespace(i)
+            if i >= end:
+                return root
+
+            token_type = self._types[i]
+            if token_type in _CLOSING_HEADER_BRACKETS:
+                table, i = self._table_header(i, root)
+                section_keys = set()
+            elif token_type in _STRING_TYPES:
+                i = self._key_value_pair(i, table, section_keys)
+            else:
+                i = self._line_terminator_end(i)
+
+    def _table_header(self, i, root):
+        """
+        TableHeader -> [ Space TableHeaderName Space ] Space LineTerminator |
+            [[ Space TableHeaderName Space ]] Space LineTerminator
+
+        Returns the dict of the table named by the header instead of a value.
+        """
+        opening_bracket_type = self._types[i]
+
+        names = []
+        j = self._skip_whitespace(i+1)
+        while True:
+            name, j = self._string(j)
+            names.append(name)
+            j = self._skip_whitespace(j)
+            if self._types[j] != tokens.TYPE_OPT_DOT:
+                break
+            j = self._skip_whitespace(j+1)
+
+        j = self._expect(_CLOSING_HEADER_BRACKETS[opening_bracket_type], j, 'Expected the end of the table header')
+        j = self._line_terminator_end(self._skip_whitespace(j))
+
+        # Every name but the last one may refer to the last table of an array of tables
+        target = root
+        for name in names[:-1]:
+            target = target.setdefault(name, {})
+            if isinstance(target, list) and target:
+                target = target[-1]
+            if not isinstance(target, dict):
+                raise self._error('Not a table: {}'.format(name), i)
+
+        if opening_bracket_type == tokens.TYPE_OP_DOUBLE_SQUARE_LEFT_BRACKET:
+            array = target.setdefault(names[-1], [])
+            if not isinstance(array, list):
+                raise self._error('Not an array of tables: {}'.format(names[-1]), i)
+            array.append({})
+            return array[-1], j
+
+        table = target.setdefault(names[-1], {})
+        if not isinstance(table, dict):
+            raise self._error('Not a table: {}'.format(names[-1]), i)
+        return table, j
+
+    def _key_value_pair(self, i, table, section_keys):
+        """
+        KeyValuePair -> STRING Space '=' Space Value Space LineTerminator
+
+        Stores the pair in the given table instead of returning it, and returns the next index.
+        """
+        key, j = self._string(i)
+        j = self._expect(tokens.TYPE_OP_ASSIGNMENT, self._skip_whitespace(j), 'Expected =')
+        value, j = self._value(self._skip_whitespace(j))
+
+        if key in section_keys:
+            token = self._token(i)
+            raise DuplicateKeysError('Duplicate key {!r} at row {} and col {}'.format(key, token.row, token.col))
+        section_keys.add(key)
+        table[key] = value
+
+        return self._line_terminator_end(self._skip_whitespace(j))
+
+    def _value(self, i):
+        """
+        Value -> Atomic | InlineTable | Array
+        """
+        token_type = self._types[i]
+        if token_type in _ATOMIC_TYPES:
+            return self._deserialized(i), i+1
+        elif token_type == tokens.TYPE_OP_SQUARE_LEFT_BRACKET:
+            return self._array(i)
+        elif token_type == tokens.TYPE_OP_CURLY_LEFT_BRACKET:
+            return self._inline_table(i)
+        raise self._error('Expected a value', i)
+
+    def _skip_array_metadata(self, i):
+        types = self._types
+        while types[i] in _ARRAY_METADATA_TYPES:
+            i += 1
+        return i
+
+    def _array(self, i):
+        """
+        Array -> '[' ArrayInternal ']', where values are separated by commas with an optional trailing one, and
+        whitespace, comments and newlines can be found anywhere but between a value and its following comma.
+        """
+        values = []
+        j = self._skip_array_metadata(i+1)
+        while self._types[j] != tokens.TYPE_OP_SQUARE_RIGHT_BRACKET:
+            value, j = self._value(j)
+            values.append(value)
+            j = self._skip_whitespace(j)
+            if self._types[j] == tokens.TYPE_OP_COMMA:
+                j = self._skip_array_metadata(j+1)
+            else:
+                j = self._skip_array_metadata(j)
+                if self._types[j] != tokens.TYPE_OP_SQUARE_RIGHT_BRACKET:
+                    raise self._error('Expected , or ]', j)
+
+        if len(set(type(value) for value in values)) > 1:
+            raise self._error('Array should be homogeneous', i)
+
+        return values, j+1
+
+    def _inline_table(self, i):
+        """
+        InlineTable -> '{' Space InlineTableInternal Space '}'
+        InlineTableInternal -> InlineTableKeyValuePair Space ',' Space InlineTableInternal |
+            InlineTableKeyValuePair | Empty
+        """
+        table = {}
+        j = self._skip_whitespace(i+1)
+        while self._types[j] in _STRING_TYPES:
+            key, j = self._string(j)
+            j = self._expect(tokens.TYPE_OP_ASSIGNMENT, self._skip_whitespace(j), 'Expected =')
+            table[key], j = self._value(self._skip_whitespace(j))
+
+            j = self._skip_whitespace(j)
+            if self._types[j] != tokens.TYPE_OP_COMMA:
+                break
+            j = self._skip_whitespace(j+1)
+
+        j = self._expect(tokens.TYPE_OP_CURLY_RIGHT_BRACKET, j, 'Expected , or }')
+        return table, j
@@ -7,28 +7,69 @@
 from prettytoml.parser.errors import ParsingError
 
 
-def parse_tokens(tokens):
+# Available parser engines. Both produce exactly the same elements.
+ENGINE_RECURSIVE_DESCENT = 'recursive-descent'
+ENGINE_ITERATIVE = 'iterative'
+
+
+def parse_tokens(tokens, engine=ENGINE_ITERATIVE, stats=None):
     """
     Parses the given token sequence into a sequence of top-level TOML elements.
 
+    The engine is one of the ENGINE_* constants: ENGINE_ITERATIVE parses with loops and lookahead, while
+    ENGINE_RECURSIVE_DESCENT uses the Capturer-based recursive descent parser.
+
+    The parse and sanitize stages are reported to the given stats callable, if any (see prettytoml.stats).
+
     Raises ParserError on invalid TOML input.
     """
     from .tokenstream import TokenStream
-    return _parse_token_stream(TokenStream(tokens))
+    return _parse_token_stream(TokenStream(tokens), engine, stats)
 
 
-def _parse_token_stream(token_stream):
+def _parse_token_stream(token_stream, engine=ENGINE_ITERATIVE, stats=None):
     """
     Parses the given token_stream into a sequence of top-level TOML elements.
 
     Raises ParserError on invalid input TOML.
     """
-    from .parser import toml_file_elements
     from .elementsanitizer import sanitize
 
+    if engine == ENGINE_ITERATIVE:
+        from .iterative import toml_file_elements
+    elif engine == ENGINE_RECURSIVE_DESCENT:
+        from .parser import toml_file_elements
+    else:
+        raise ValueError('Unknown parser engine: {}'.format(engine))
+
+    if stats is not None:
+        from prettytoml.stats import clock, element_count
+        start = clock()
+
     elements, pending = toml_file_elements(token_stream)
 
     if not pending.at_end:
         raise ParsingError('Failed to parse line {}'.format(pending.head.row))
 
-    return sanitize(elements)
+    if stats is None:
+        return sanitize(elements)
+
+    stats('parse', clock() - start, {'elements': element_count(elements)})
+    start = clock()
+    sanitized = sanitize(elements)
+    stats('sanitize', clock() - start, {'elements': len(sanitized), 'inserted': len(sanitized) - len(elements)})
+    return sanitized
+
+
+def iter_parse_tokens(tokens):
+    """
+    Parses the given token iterable into top-level TOML elements, yielding every element as soon as it is complete.
+
+    Yields the same elements as parse_tokens() does while only holding the tokens of the element being parsed.
+
+    Raises ParserError on invalid TOML input, after yielding the elements preceding the invalid input.
+    """
+    from .iterative import iter_toml_file_elements
+    from .elementsanitizer import iter_sanitized
+
+    return iter_sanitized(iter_toml_file_elements(tokens))
@@ -2,57 +2,92 @@ from prettytoml import elements
 from prettytoml.elements.table import TableElement
 from prettytoml.elements.tableheader import TableHeaderElement
 from prettytoml.errors import InvalidTOMLFileError
-from prettytoml.util import PeekableIterator
 
 
-def sanitize(_elements):
+def sanitize(_elements, validate=False):
     """
     Finds TableHeader elements that are not followed by TableBody elements and inserts empty TableElement
     right after those.
-    """
-
-    output = list(_elements)
-
-    def find_next_table_header(after=-1):
-        return next((i for (i, element) in enumerate(output)
-                     if i > after and isinstance(element, TableHeaderElement)), float('-inf'))
-
-    def find_next_table_body(after=-1):
-        return next((i for (i, element) in enumerate(output)
-                     if i > after and isinstance(element, TableElement)), float('-inf'))
-
-    next_table_header_i = find_next_table_header()
-    while next_table_header_i >= 0:
 
-        following_table_header_i = find_next_table_header(next_table_header_i)
-        following_table_body_i = find_next_table_body(next_table_header_i)
+    Also validates the result as validate_sanitized() does in the same pass when validate is True.
+    """
+    sanitized = iter_sanitized(_elements)
+    if validate:
+        sanitized = iter_validated(sanitized)
+    return list(sanitized)
 
-        if (following_table_body_i < 0) or \
-                (following_table_header_i >= 0 and (following_table_header_i < following_table_body_i)):
-            output.insert(next_table_header_i+1, TableElement(tuple()))
 
-        next_table_header_i = find_next_table_header(next_table_header_i)
+def iter_sanitized(_elements):
+    """
+    Yields the given top-level elements while inserting an empty TableElement right after every TableHeader
+    element that is not followed by a TableBody element, producing the same elements as sanitize() in a single
+    pass over an iterable of elements.
+    """
 
-    return output
+    # The elements following a TableHeader are held back until it is known whether its TableElement comes before
+    # the next TableHeader or the end, so that a missing one is inserted right after the header.
+    header = None
+    held = []
+
+    for element in _elements:
+        if header is None:
+            if isinstance(element, TableHeaderElement):
+                header = element
+            else:
+                yield element
+        elif isinstance(element, TableElement):
+            yield header
+            for e in held:
+                yield e
+            yield element
+            header = None
+            del held[:]
+        elif isinstance(element, TableHeaderElement):
+            yield header
+            yield TableElement(tuple())
+            for e in held:
+                yield e
+            header = element
+            del held[:]
+        else:
+            held.append(element)
+
+    if header is not None:
+        yield header
+        yield TableElement(tuple())
+        for e in held:
+            yield e
+
+
+def iter_validated(_elements):
+    """
+    Yields the given elements after checking each one against the order validate_sanitized() expects, raising
+    InvalidTOMLFileError as soon as one breaks it.
+    """
+    expecting_table = False
+    at_start = True
+
+    for element in _elements:
+        if element.type != elements.TYPE_METADATA:
+            if expecting_table:
+                if not isinstance(element, TableElement):
+                    raise InvalidTOMLFileError
+                expecting_table = False
+            elif isinstance(element, TableHeaderElement):
+                expecting_table = True
+            elif not (at_start and isinstance(element, TableElement)):
+                raise InvalidTOMLFileError
+            at_start = False
+        yield element
+
+    if expecting_table:
+        raise InvalidTOMLFileError
 
 
 def validate_sanitized(_elements):
-
-    # Non-metadata elements must start with an optional TableElement, followed by
-    # zero or more (TableHeaderElement, TableElement) pairs.
-
-    if not _elements:
-        return
-
-    it = PeekableIterator(e for e in _elements if e.type != elements.TYPE_METADATA)
-
-    if isinstance(it.peek(), TableElement):
-        it.next()
-
-    while it.peek():
-        if not isinstance(it.peek(), TableHeaderElement):
-            raise InvalidTOMLFileError
-        it.next()
-        if not isinstance(it.peek(), TableElement):
-            raise InvalidTOMLFileError
-        it.next()
+    """
+    Raises InvalidTOMLFileError unless the non-metadata elements are an optional TableElement followed by zero or
+    more (TableHeaderElement, TableElement) pairs.
+    """
+    for _ in iter_validated(_elements):
+        pass
@@ -0,0 +1,387 @@
+"""
+    An iterative parser for TOML tokens.
+
+    It recognizes the grammar documented in prettytoml.parser.parser and produces exactly the same elements, but
+    every repetition in the grammar is a loop and every choice is decided by looking ahead at the upcoming tokens
+    instead of attempting alternatives and catching errors. Parsing a table body or an array therefore neither
+    recurses nor backtracks per entry; only nested values (arrays and inline tables) recurse, once per nesting level.
+
+    Non-terminals are represented as methods accepting a token index and returning (RESULT, next_index), or None
+    when the tokens at the given index do not match.
+"""
+
+from prettytoml import tokens
+from prettytoml.elements.array import ArrayElement
+from prettytoml.elements.atomic import AtomicElement
+from prettytoml.elements.inlinetable import InlineTableElement
+from prettytoml.elements.metadata import NewlineElement, CommentElement, WhitespaceElement, PunctuationElement
+from prettytoml.elements.table import TableElement
+from prettytoml.elements.tableheader import TableHeaderElement
+from prettytoml.parser.errors import ParsingError
+from prettytoml.parser.tokenstream import TokenStream
+
+_STRING_TYPES = (
+    tokens.TYPE_BARE_STRING,
+    tokens.TYPE_STRING,
+    tokens.TYPE_LITERAL_STRING,
+    tokens.TYPE_MULTILINE_STRING,
+    tokens.TYPE_MULTILINE_LITERAL_STRING,
+)
+
+_ATOMIC_TYPES = _STRING_TYPES + (
+    tokens.TYPE_INTEGER,
+    tokens.TYPE_FLOAT,
+    tokens.TYPE_DATE,
+    tokens.TYPE_BOOLEAN,
+)
+
+_CLOSING_HEADER_BRACKETS = {
+    tokens.TYPE_OP_SQUARE_LEFT_BRACKET: tokens.TYPE_OP_SQUARE_RIGHT_BRACKET,
+    tokens.TYPE_OP_DOUBLE_SQUARE_LEFT_BRACKET: tokens.TYPE_OP_DOUBLE_SQUARE_RIGHT_BRACKET,
+}
+
+
+class Parser:
+    """
+    Parses elements out of an indexable sequence of tokens. Indexing the sequence past its end must raise IndexError.
+    """
+
+    def __init__(self, _tokens):
+        self._tokens = _tokens
+
+    def _type(self, i):
+        """
+        Returns the type of the token at the given index, or None past the end of the tokens.
+        """
+        try:
+            return self._tokens[i].type
+        except IndexError:
+            return None
+
+    def _punctuation(self, i):
+        return PunctuationElement(self._tokens[i:i+1])
+
+    def _skip_whitespace(self, i):
+        while self._type(i) == tokens.TYPE_WHITESPACE:
+            i += 1
+        return i
+
+    def space(self, i):
+        """
+        Space -> WHITESPACE Space | WHITESPACE | EMPTY
+        """
+        j = self._skip_whitespace(i)
+        return WhitespaceElement(self._tokens[i:j]), j
+
+    def _line_terminator_end(self, i):
+        """
+        Returns the index following the line terminator tokens at the given index, or None.
+        """
+        token_type = self._type(i)
+        if token_type == tokens.TYPE_COMMENT and self._type(i+1) == tokens.TYPE_NEWLINE:
+            return i + 2
+        elif token_type == tokens.TYPE_NEWLINE:
+            return i + 1
+
+    def line_terminator(self, i):
+        """
+        LineTerminator -> Comment | Newline
+        """
+        end = self._line_terminator_end(i)
+        if end is None:
+            return None
+        if end - i == 2:
+            return CommentElement(self._tokens[i:end]), end
+        return NewlineElement(self._tokens[i:end]), end
+
+    def table_header(self, i):
+        """
+        TableHeader -> Space [ Space TableHeaderName Space ] Space LineTerminator |
+            Space [[ Space TableHeaderName Space ]] Space LineTerminator
+        """
+        j = self._skip_whitespace(i)
+        closing_bracket_type = _CLOSING_HEADER_BRACKETS.get(self._type(j))
+        if not closing_bracket_type:
+            return None
+
+        j = self._skip_whitespace(j+1)
+        if self._type(j) not in _STRING_TYPES:
+            return None
+        j += 1
+
+        while True:
+            k = self._skip_whitespace(j)
+            if self._type(k) != tokens.TYPE_OPT_DOT:
+                break
+            k = self._skip_whitespace(k+1)
+            if self._type(k) not in _STRING_TYPES:
+                return None
+            j = k + 1
+
+        j = self._skip_whitespace(j)
+        if self._type(j) != closing_bracket_type:
+            return None
+
+        end = self._line_terminator_end(self._skip_whitespace(j+1))
+        if end is None:
+            return None
+
+        return TableHeaderElement(self._tokens[i:end]), end
+
+    def value(self, i):
+        """
+        Value -> Atomic | InlineTable | Array
+        """
+        token_type = self._type(i)
+        if token_type in _ATOMIC_TYPES:
+            return AtomicElement(self._tokens[i:i+1]), i+1
+        elif token_type == tokens.TYPE_OP_SQUARE_LEFT_BRACKET:
+            return self.array(i)
+        elif token_type == tokens.TYPE_OP_CURLY_LEFT_BRACKET:
+            return self.inline_table(i)
+
+    def array(self, i):
+        """
+        Array -> '[' Space ArrayInternal Space ']' | '[' Space ArrayInternal Space LineTerminator Space ']'
+        """
+        space, j = self.space(i+1)
+        elements = [self._punctuation(i), space]
+
+        j = self._array_internal(j, elements)
+
+        space, j = self.space(j)
+        elements.append(space)
+
+        if self._type(j) != tokens.TYPE_OP_SQUARE_RIGHT_BRACKET:
+            line_terminator = self.line_terminator(j)
+            if not line_terminator:
+                return None
+            space, j = self.space(line_terminator[1])
+            elements += [line_terminator[0], space]
+            if self._type(j) != tokens.TYPE_OP_SQUARE_RIGHT_BRACKET:
+                return None
+
+        elements.append(self._punctuation(j))
+        return ArrayElement(elements), j+1
+
+    def _array_internal(self, i, elements):
+        """
+        ArrayInternal -> LineTerminator Space ArrayInternal | Value Space ',' Space LineTerminator Space ArrayInternal |
+            Value Space ',' Space ArrayInternal | Space LineTerminator | Value | EMPTY
+
+        Appends the found elements to the given list and returns the index following them.
+        """
+        while True:
+
+            line_terminator = self.line_terminator(i)
+            if line_terminator:
+                space, i = self.space(line_terminator[1])
+                elements += [line_terminator[0], space]
+                continue
+
+            value = self.value(i)
+            if not value:
+                space, j = self.space(i)
+                line_terminator = self.line_terminator(j)
+                if line_terminator:
+                    elements += [space, line_terminator[0]]
+                    return line_terminator[1]
+                return i
+
+            value_element, i = value
+            space, j = self.space(i)
+            if self._type(j) != tokens.TYPE_OP_COMMA:
+                elements.append(value_element)
+                return i
+
+            comma = self._punctuation(j)
+            trailing_space, i = self.space(j+1)
+            elements += [value_element, space, comma, trailing_space]
+
+            line_terminator = self.line_terminator(i)
+            if line_terminator:
+                space, i = self.space(line_terminator[1])
+                elements += [line_terminator[0], space]
+
+    def _inline_table_key_value(self, i):
+        """
+        InlineTableKeyValuePair = STRING Space '=' Space Value
+        """
+        if self._type(i) not in _STRING_TYPES:
+            return None
+        key = AtomicElement(self._tokens[i:i+1])
+
+        key_space, j = self.space(i+1)
+        if self._type(j) != tokens.TYPE_OP_ASSIGNMENT:
+            return None
+        assignment = self._punctuation(j)
+
+        value_space, j = self.space(j+1)
+        value = self.value(j)
+        if not value:
+            return None
+
+        return [key, key_space, assignment, value_space, value[0]], value[1]
+
+    def inline_table(self, i):
+        """
+        InlineTable -> '{' Space InlineTableInternal Space '}'
+        InlineTableInternal -> InlineTableKeyValuePair Space ',' Space InlineTableInternal |
+            InlineTableKeyValuePair | Empty
+        """
+        space, j = self.space(i+1)
+        elements = [self._punctuation(i), space]
+
+        while True:
+            key_value = self._inline_table_key_value(j)
+            if not key_value:
+                break
+
+            key_value_elements, j = key_value
+            space, k = self.space(j)
+            if self._type(k) != tokens.TYPE_OP_COMMA:
+                elements += key_value_elements
+                break
+
+            trailing_space, j = self.space(k+1)
+            elements += key_value_elements + [space, self._punctuation(k), trailing_space]
+
+        space, j = self.space(j)
+        if self._type(j) != tokens.TYPE_OP_CURLY_RIGHT_BRACKET:
+            return None
+
+        elements += [space, self._punctuation(j)]
+        return InlineTableElement(elements), j+1
+
+    def key_value_pair(self, i):
+        """
+        KeyValuePair -> Space STRING Space '=' Space Value Space LineTerminator
+        """
+        leading_space, j = self.space(i)
+        key_value = self._inline_table_key_value(j)
+        if not key_value:
+            return None
+
+        key_value_elements, j = key_value
+        space, j = self.space(j)
+        line_terminator = self.line_terminator(j)
+        if not line_terminator:
+            return None
+
+        return [leading_space] + key_value_elements + [space, line_terminator[0]], line_terminator[1]
+
+    def empty_line(self, i):
+        """
+        EmptyLine -> Space LineTerminator
+        """
+        space, j = self.space(i)
+        line_terminator = self.line_terminator(j)
+        if not line_terminator:
+            return None
+        return [space, line_terminator[0]], line_terminator[1]
+
+    def table_body(self, i):
+        """
+        TableBody -> KeyValuePair TableBody | EmptyLine TableBody | EmptyLine | KeyValuePair
+        """
+        elements = []
+        while True:
+            line = self.key_value_pair(i) or self.empty_line(i)
+            if not line:
+                break
+            elements += line[0]
+            i = line[1]
+
+        if not elements:
+            return None
+        return TableElement(elements), i
+
+    def file_entry(self, i):
+        """
+        FileEntry -> TableHeader | TableBody
+        """
+        return self.table_header(i) or self.table_body(i)
+
+
+def toml_file_elements(token_stream):
+    """
+    TOMLFileElements -> FileEntry TOMLFileElements | FileEntry | EmptyLine | EMPTY
+
+    Returns (elements, pending_token_stream) exactly like parser.toml_file_elements().
+    """
+    parser = Parser(token_stream.source_tokens)
+    elements = []
+    i = token_stream.offset
+
+    while True:
+        entry = parser.file_entry(i)
+        if not entry:
+            break
+        elements.append(entry[0])
+        i = entry[1]
+
+    return tuple(elements), TokenStream(token_stream.source_tokens, offset=i)
+
+
+class TokenWindow:
+    """
+    An indexable view over tokens pulled lazily from an iterator.
+
+    Tokens are pulled as they are indexed, and the ones preceding an index can be discarded once they're no
+    longer needed, so only a window of the tokens is ever held in memory.
+    """
+
+    def __init__(self, token_iterator):
+        self._iterator = iter(token_iterator)
+        self._tokens = []
+        self._offset = 0    # The index of the first held token
+        self._exhausted = False
+
+    def _pull_until(self, i):
+        while not self._exhausted and i >= self._offset + len(self._tokens):
+            try:
+                self._tokens.append(next(self._iterator))
+            except StopIteration:
+                self._exhausted = True
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            self._pull_until(i.stop - 1)
+            return tuple(self._tokens[i.start-self._offset:i.stop-self._offset])
+        self._pull_until(i)
+        if i - self._offset >= len(self._tokens):
+            raise IndexError(i)
+        return self._tokens[i-self._offset]
+
+    def discard_before(self, i):
+        """
+        Discards the held tokens preceding the given index.
+        """
+        del self._tokens[:i-self._offset]
+        self._offset = i
+
+
+def iter_toml_file_elements(token_iterator):
+    """
+    TOMLFileElements -> FileEntry TOMLFileElements | FileEntry | EmptyLine | EMPTY
+
+    Yields the file entries pulled from the given token iterator as soon as each one is complete, then raises
+    ParsingError if there are tokens left that couldn't be parsed.
+    """
+    window = TokenWindow(token_iterator)
+    parser = Parser(window)
+    i = 0
+
+    while True:
+        entry = parser.file_entry(i)
+        if not entry:
+            break
+        yield entry[0]
+        i = entry[1]
+        window.discard_before(i)
+
+    try:
+        pending_head = window[i]
+    except IndexError:
+        return
+    raise ParsingError('Failed to parse line {}'.format(pending_head.row))
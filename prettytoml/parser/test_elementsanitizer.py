@@ -0,0 +1,32 @@
+import pytest
+
+from prettytoml import lexer
+from prettytoml.elements.metadata import NewlineElement
+from prettytoml.elements.table import TableElement
+from prettytoml.elements.tableheader import TableHeaderElement
+from prettytoml.errors import InvalidTOMLFileError
+from prettytoml.parser import parse_tokens
+from prettytoml.parser.elementsanitizer import sanitize, iter_sanitized, validate_sanitized
+
+
+def test_sanitize():
+    header = lambda: TableHeaderElement(tuple(lexer.tokenize('[a]\n')))
+    newline = NewlineElement(tuple(lexer.tokenize('\n')))
+    table = parse_tokens(lexer.tokenize('x = 1\n', is_top_level=True))[0]
+    h1, h2, h3 = header(), header(), header()
+
+    sanitized = sanitize((table, h1, newline, h2, table, h3, newline), validate=True)
+    assert [type(e) for e in sanitized] == [
+        TableElement, TableHeaderElement, TableElement, NewlineElement, TableHeaderElement, TableElement,
+        TableHeaderElement, TableElement, NewlineElement,
+    ]
+    assert sanitized[1] is h1 and sanitized[2] is not table and sanitized[5] is table
+    streamed = list(iter_sanitized(iter((table, h1, newline, h2, table, h3, newline))))
+    assert [type(e) for e in streamed] == [type(e) for e in sanitized]
+
+    validate_sanitized(sanitized)
+    for invalid in ((h1,), (h1, newline), (table, table), (h1, table, table), (newline, h1, table, h2)):
+        with pytest.raises(InvalidTOMLFileError):
+            validate_sanitized(invalid)
+    with pytest.raises(InvalidTOMLFileError):
+        sanitize((table, table), validate=True)
@@ -0,0 +1,81 @@
+import random
+from prettytoml.elements.common import TokenElement
+from prettytoml.lexer import tokenize
+from prettytoml.parser import parse_tokens, ENGINE_ITERATIVE, ENGINE_RECURSIVE_DESCENT
+
+
+def structure(element):
+    """
+    Returns a comparable representation of the whole element tree.
+    """
+    if isinstance(element, TokenElement):
+        return type(element), tuple((t.type, t.source_substring, t.row, t.col) for t in element.tokens)
+    return type(element), tuple(structure(e) for e in element.sub_elements)
+
+
+def parsed(source, engine):
+    try:
+        return tuple(structure(e) for e in parse_tokens(tokenize(source, is_top_level=True), engine=engine))
+    except Exception as e:
+        return type(e), str(e)
+
+
+def assert_engines_agree(source):
+    assert parsed(source, ENGINE_ITERATIVE) == parsed(source, ENGINE_RECURSIVE_DESCENT), source
+
+
+def test_sample_files():
+    for path in ('sample.toml', 'sample-prettified.toml', 'dateless_sample.toml', 'dateless_sample-broken.toml'):
+        assert_engines_agree(open(path).read())
+
+
+def test_random_documents():
+
+    fragments = (
+        'key', '"quoted"', "'literal'", ' ', '  ', '\t', '\n', '# comment\n', '=', ' = ', ',', ', ', '.',
+        '[', ']', '[[', ']]', '{', '}', '42', '4.2', 'true', '1979-05-27T07:32:00Z', '"""multi\nline"""',
+        '[table]\n', '[[array]]\n', ' [a . b]  # header\n', 'k = [1, 2,\n 3,\n]\n', 'k = { a = 1, b = [2] }\n',
+        'k = [\n  "x", # c\n  "y"\n]\n', 'x = [ [1], [2, 3] ]\n', 'i = { }\n', 'e = []\n', 'd = [1, "a"]\n',
+    )
+
+    lines = (
+        '\n', '  \n', '# comment\n', '[table]\n', '  [[array . "of"]]\t# tables\n', '[a.b]\n',
+        'k{} = 1\n', ' k{}= "v" # c\n', 'k{} = [1, 2,\n 3,\n]\n', 'k{} = {{ a = 1, b = [2] }}\n', 'k{} = []\n',
+        'k{} = [\n  "x", # c\n  "y"\n]\n', 'k{} = [ [1], [2, 3] ]\n', 'k{} = [\n\n  1\n  ]\n', 'k{}={{}}\n',
+        'k{} = {{ a = {{ b = 1 }}, }}\n', 'k{} = [1,2 ,3 ]  \n', 'k{} = true\n', 'k{} = 4.2\n',
+    )
+
+    random.seed(7)
+    for _ in range(100):
+        source = ''.join(random.choice(fragments) for _ in range(random.randint(1, 12)))
+        try:
+            tuple(tokenize(source))
+        except Exception:
+            continue
+        assert_engines_agree(source)
+
+    for _ in range(50):
+        source = ''.join(random.choice(lines).format(i) for i in range(random.randint(1, 15)))
+        assert_engines_agree(source)
+
+
+def test_large_table_does_not_recurse_per_entry():
+    source = ''.join('key{} = {}\n'.format(i, i) for i in range(5000))
+    elements = parse_tokens(tokenize(source, is_top_level=True), engine=ENGINE_ITERATIVE)
+    assert len(elements[0]) == 5000
+
+
+def test_parsing_incrementally():
+    from prettytoml.parser import iter_parse_tokens
+
+    def iter_parsed(source):
+        try:
+            return tuple(structure(e) for e in iter_parse_tokens(tokenize(source, is_top_level=True)))
+        except Exception as e:
+            return type(e), str(e)
+
+    sources = [open(path).read() for path in ('sample.toml', 'dateless_sample.toml', 'dateless_sample-broken.toml')]
+    sources += ['[a]\n[b]\n', '[a]\n', 'k = 1\n[a]\n\n[[b]]\n# c\n[d]\nx = 2\n', 'k = 1\n[a\n', '']
+
+    for source in sources:
+        assert iter_parsed(source) == parsed(source, ENGINE_ITERATIVE), source
@@ -154,3 +154,13 @@ str_multiline = wohoo
 
     assert len(pending_ts) == 0
 
+
+
+def test_parsing_a_token_buffer():
+    source = open('sample.toml').read()
+
+    from prettytoml.lexer import tokenize_offsets
+    from prettytoml.parser import parse_tokens
+
+    elements = parse_tokens(tokenize_offsets(source, is_top_level=True))
+    assert ''.join(e.serialized() for e in elements) == source
@@ -1,3 +1,5 @@
+from prettytoml.tokens.buffer import TokenBuffer
+
 
 class TokenStream:
     """
@@ -10,7 +12,7 @@ class TokenStream:
     Nothing = tuple()
 
     def __init__(self, _tokens, offset=0):
-        if isinstance(_tokens, tuple):
+        if isinstance(_tokens, (tuple, TokenBuffer)):
             self._tokens = _tokens
         else:
             self._tokens = tuple(_tokens)
@@ -30,6 +32,13 @@ class TokenStream:
     def tail(self):
         return TokenStream(self._tokens, offset=self._head_index+1)
 
+    @property
+    def source_tokens(self):
+        """
+        The whole token sequence this stream is a subset of.
+        """
+        return self._tokens
+
     @property
     def offset(self):
         return self._head_index
@@ -1,11 +1,14 @@
 from . import deindentanonymoustable, tableindent, tableassignment
-from prettytoml.prettifier import tablesep, commentspace, linelength, tableentrysort
+from prettytoml.prettifier import tablesep, commentspace, linelength, tableentrysort, fused
 
 """
     TOMLFile prettifiers
 
     Each prettifier is a function that accepts a sequence of Element instances that make up a
     TOML file and it is allowed to modify it as it pleases.
+
+    All the prettifiers defined here only look at one table at a time, along with its header when it has one,
+    so they can also be applied to a stream of tables with iter_prettified().
 """
 
 
@@ -29,11 +32,86 @@ ALL = (
 )
 
 
-def prettify(toml_file_elements, prettifiers=ALL):
+# Available prettifier engines. Both produce exactly the same elements.
+ENGINE_SEQUENTIAL = 'sequential'
+ENGINE_FUSED = 'fused'
+
+
+def prettify(toml_file_elements, prettifiers=ALL, engine=ENGINE_FUSED, stats=None):
     """
     Prettifies a sequence of element instances according to pre-defined set of formatting rules.
+
+    The engine is one of the ENGINE_* constants: ENGINE_SEQUENTIAL applies the prettifiers one after the other,
+    while ENGINE_FUSED walks every table once applying all of them line by line. ENGINE_FUSED falls back to
+    ENGINE_SEQUENTIAL for prettifiers not taken from ALL in the same order.
+
+    Every prettifier applied, or all of them when fused, is reported as a stage to the given stats callable, if any
+    (see prettytoml.stats).
     """
+    if engine == ENGINE_FUSED:
+        fused_prettify = fused.compile_prettifiers(prettifiers)
+        if fused_prettify is not None:
+            if stats is None:
+                return fused_prettify(toml_file_elements)
+            return _instrumented(fused_prettify, 'prettifier.fused', toml_file_elements, stats)
+    elif engine != ENGINE_SEQUENTIAL:
+        raise ValueError('Unknown prettifier engine: {}'.format(engine))
+
     elements = toml_file_elements[:]
     for prettifier in prettifiers:
-        elements = prettifier(elements)
+        if stats is None:
+            elements = prettifier(elements)
+        else:
+            elements = _instrumented(prettifier, 'prettifier.' + prettifier.__name__, elements, stats)
     return elements
+
+
+def _instrumented(prettifier, stage, elements, stats):
+    """
+    Applies the given prettifier to the given elements, reporting it as the given stage to the stats callable.
+    """
+    from prettytoml.stats import clock, change_counts, touched_count
+
+    previous_change_counts = change_counts(elements)
+    start = clock()
+    prettified = prettifier(elements)
+    seconds = clock() - start
+
+    stats(stage, seconds, {
+        'elements': len(prettified),
+        'elements_touched': touched_count(previous_change_counts, prettified),
+    })
+    return prettified
+
+
+def iter_prettified(toml_file_elements, prettifiers=ALL):
+    """
+    Prettifies an iterable of top-level element instances table by table, yielding the prettified elements of every
+    table (preceded by its header) as soon as the table has been read.
+
+    Produces the same elements as prettify() as long as every given prettifier only depends on a single table
+    and its header, which is the case for all the prettifiers in ALL.
+    """
+    for table_elements in _tables_with_headers(toml_file_elements):
+        for pretty_element in prettify(table_elements, prettifiers):
+            yield pretty_element
+
+
+def _tables_with_headers(toml_file_elements):
+    """
+    Groups an iterable of top-level elements into lists made of a table preceded by its header, if it has one.
+    """
+    from prettytoml.elements.tableheader import TableHeaderElement
+
+    group = []
+    for element in toml_file_elements:
+        if isinstance(element, TableHeaderElement) and group:
+            yield group
+            group = []
+        group.append(element)
+        if not isinstance(element, TableHeaderElement):
+            yield group
+            group = []
+
+    if group:
+        yield group
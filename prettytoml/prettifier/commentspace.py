@@ -1,6 +1,7 @@
 
 from prettytoml.elements import traversal as t, factory as element_factory
 from prettytoml.elements.table import TableElement
+from prettytoml.prettifier import common
 
 
 def comment_space(toml_file_elements):
@@ -15,21 +16,20 @@ def comment_space(toml_file_elements):
 
 
 def _do_table(table_elements):
+    table_elements[:] = [e for line in common.lines(table_elements) for e in _spaced_line(line)]
 
-    # Iterator index
-    i = float('-inf')
 
-    def next_newline():
-        return t.find_following(table_elements, t.predicates.newline, i)
-
-    def next_comment():
-        return t.find_following(table_elements, t.predicates.comment, i)
-
-    def last_non_metadata():
-        return t.find_previous(table_elements, t.predicates.non_metadata, next_comment())
-
-    while next_comment() >= 0:
-        if i < last_non_metadata() < next_comment() < next_newline():
-            del table_elements[last_non_metadata()+1:next_comment()]
-            table_elements.insert(next_comment(), element_factory.create_whitespace_element(char='\t', length=1))
-        i = next_newline()
+def _spaced_line(line_elements):
+    """
+    Returns the elements of the given line with the whitespace between an entry and a following comment replaced
+    by a single tab character.
+    """
+    next_comment = t.find_following(line_elements, t.predicates.comment)
+    next_newline = t.find_following(line_elements, t.predicates.newline)
+    last_non_metadata = t.find_previous(line_elements, t.predicates.non_metadata, next_comment)
+
+    # A comment following an entry ends its line, with its own newline
+    if last_non_metadata < next_comment and not 0 <= next_newline < next_comment:
+        return line_elements[:last_non_metadata+1] + \
+            (element_factory.create_whitespace_element(char='\t', length=1),) + line_elements[next_comment:]
+    return line_elements
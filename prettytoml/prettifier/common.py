@@ -1,7 +1,7 @@
 
 from itertools import *
-from prettytoml.elements.common import TokenElement
-from prettytoml.elements.metadata import NewlineElement
+from prettytoml.elements.common import TokenElement, TYPE_METADATA
+from prettytoml.elements.metadata import NewlineElement, WhitespaceElement, CommentElement
 
 
 def text_to_elements(toml_text):
@@ -22,19 +22,90 @@ def lines(elements):
     """
     Splits a sequence of elements into a sub-sequence of each line.
 
-    A line is defined as a sequence of elements terminated by a NewlineElement.
+    A line is defined as a sequence of elements terminated by a NewlineElement, or by a CommentElement (which ends
+    with its own newline) following an entry, except for the trailing elements following the last one if any. A
+    comment on a line of its own is part of the line following it.
     """
+    line = []
+    has_entry = False
+    for element in elements:
+        line.append(element)
+        has_entry = has_entry or element.type != TYPE_METADATA
+        if isinstance(element, NewlineElement) or (has_entry and isinstance(element, CommentElement)):
+            yield tuple(line)
+            line = []
+            has_entry = False
+    if line:
+        yield tuple(line)
+
+
+class Line(object):
+    """
+    A line of a table: its leading whitespace elements (indent), the rest of its elements up to the NewlineElement
+    terminating it (content), and that NewlineElement (terminator), which is None for a line ended by a comment and
+    for trailing elements that are not terminated.
+
+    The key, value and comment slots refer to the first two non-metadata elements and the first comment element
+    in the content, or are None when missing. The key and value can then be replaced in place with replace().
+    """
+
+    __slots__ = ('indent', 'content', 'terminator', 'key', 'value', 'comment')
+
+    def __init__(self, elements):
+        indent_end = next((i for (i, e) in enumerate(elements) if not isinstance(e, WhitespaceElement)), len(elements))
+        terminated = bool(elements) and isinstance(elements[-1], NewlineElement)
 
-    def __next_line(es):
-        # Returns the next line and the remaining sequence of elements
-        line = tuple(takewhile(lambda e: not isinstance(e, NewlineElement), es))
-        line += (es[len(line)],)
-        return line, es[len(line):]
+        self.indent = list(elements[:indent_end])
+        self.content = list(elements[indent_end:len(elements)-1 if terminated else len(elements)])
+        self.terminator = elements[-1] if terminated else None
 
-    left_elements = tuple(elements)
-    while left_elements:
-        line, left_elements = __next_line(left_elements)
-        yield line
+        non_metadata = [e for e in self.content if e.type != TYPE_METADATA][:2]
+        self.key, self.value = (non_metadata + [None, None])[:2]
+        self.comment = next((e for e in self.content if isinstance(e, CommentElement)), None)
+
+    @property
+    def elements(self):
+        return self.indent + self.content + ([self.terminator] if self.terminator else [])
+
+    def replace(self, element, new_element):
+        """
+        Replaces the given key or value element of this line with another.
+        """
+        self.content[next(i for (i, e) in enumerate(self.content) if e is element)] = new_element
+        if element is self.key:
+            self.key = new_element
+        else:
+            self.value = new_element
+
+
+def table_lines(elements):
+    """
+    Returns a list of the Line instances making up the given sequence of table elements.
+    """
+    return [Line(line) for line in lines(elements)]
+
+
+def flattened(table_lines):
+    """
+    Returns the list of the elements making up the given sequence of Line instances.
+    """
+    return [element for line in table_lines for element in line.elements]
+
+
+def empty_lines_start(elements):
+    """
+    Returns the index of the first of the elements making up the empty lines, possibly holding whitespace, at the
+    end of the given elements, or their length if they don't end with an empty line.
+    """
+    end = len(elements)
+    while end > 0 and isinstance(elements[end-1], NewlineElement):
+        line_start = end - 1
+        while line_start > 0 and isinstance(elements[line_start-1], WhitespaceElement):
+            line_start -= 1
+        if line_start > 0 and not isinstance(elements[line_start-1], (NewlineElement, CommentElement)):
+            break
+        end = line_start
+    return end
 
 
 def non_empty_elements(elements):
@@ -1,8 +1,4 @@
-import operator
 from prettytoml.elements import traversal as t, traversal
-from itertools import *
-from functools import *
-from prettytoml.elements.metadata import WhitespaceElement
 from prettytoml.elements.table import TableElement
 from prettytoml.prettifier import common
 
@@ -22,9 +18,16 @@ def deindent_anonymous_table(toml_file_elements):
 
 
 def _unindent_table(table_element):
-    table_lines = tuple(common.lines(table_element.sub_elements))
-    unindented_lines = tuple(tuple(dropwhile(lambda e: isinstance(e, WhitespaceElement), line)) for line in table_lines)
-    return TableElement(reduce(operator.concat, unindented_lines))
+    table_lines = common.table_lines(table_element.sub_elements)
+    return TableElement(common.flattened(_unindented_line(line) for line in table_lines))
+
+
+def _unindented_line(line):
+    """
+    Drops the indentation of the given Line and returns it.
+    """
+    line.indent = []
+    return line
 
 
 def _find_anonymous_table(toml_file_elements):
@@ -0,0 +1,111 @@
+"""
+    A prettifier engine applying a selection of the rules in ALL in a single walk over every table.
+
+    Apart from the trailing lines touched by TABLE_SPACING and the reordering of TABLE_ENTRY_SORTING, every rule in
+    ALL only changes the elements of a table one line at a time, looking at nothing but the line itself. Lines are
+    therefore pulled through a pipeline of the per-line steps of the selected rules, in the order of ALL, and the
+    table is rebuilt once from the resulting lines.
+"""
+
+from prettytoml.elements.table import TableElement
+from prettytoml.elements.tableheader import TableHeaderElement
+from prettytoml.prettifier import common, tablesep, commentspace, tableindent, tableassignment, \
+    deindentanonymoustable, linelength, tableentrysort
+
+# In the order of prettifier.ALL
+_FUSABLE_RULES = (
+    tablesep.table_separation,
+    commentspace.comment_space,
+    tableindent.table_entries_should_be_uniformly_indented,
+    tableassignment.table_assignment_spacing,
+    deindentanonymoustable.deindent_anonymous_table,
+    linelength.line_length_limiter,
+    tableentrysort.sort_table_entries,
+)
+
+
+def compile_prettifiers(prettifiers):
+    """
+    Returns a function accepting a sequence of top-level elements and returning the same elements as applying the
+    given prettifiers one after the other, or None if the prettifiers cannot be fused. They can be fused as long as
+    they all come from ALL, in the same order.
+    """
+    prettifiers = tuple(prettifiers)
+    if not all(p in _FUSABLE_RULES for p in prettifiers):
+        return None
+    if list(prettifiers) != sorted(prettifiers, key=_FUSABLE_RULES.index):
+        return None
+
+    selected = frozenset(prettifiers)
+
+    def prettify(toml_file_elements):
+        elements = list(toml_file_elements)
+
+        if not _is_sanitized(elements):
+            for prettifier in prettifiers:
+                elements = prettifier(elements)
+            return elements
+
+        anonymous_table_i = deindentanonymoustable._find_anonymous_table(elements)
+
+        prettified = []
+        for i, element in enumerate(elements):
+            if isinstance(element, TableHeaderElement):
+                if tableindent.table_entries_should_be_uniformly_indented in selected:
+                    tableindent._do_table_header(element)
+                prettified.append(element)
+            else:
+                header = elements[i-1] if i > 0 else None
+                prettified.append(_prettified_table(element, header, i == anonymous_table_i, selected))
+        return prettified
+
+    return prettify
+
+
+def _is_sanitized(elements):
+    """
+    Returns True if the given top-level elements are TableElements and TableHeaderElements each followed by a
+    TableElement.
+    """
+    for i, element in enumerate(elements):
+        if isinstance(element, TableHeaderElement):
+            if not (i+1 < len(elements) and isinstance(elements[i+1], TableElement)):
+                return False
+        elif not isinstance(element, TableElement):
+            return False
+    return True
+
+
+def _prettified_table(table, header, is_anonymous, selected):
+    """
+    Returns a new TableElement made of the elements of the given one prettified by the selected rules.
+    """
+    elements = list(table.sub_elements)
+
+    if tablesep.table_separation in selected:
+        tablesep._do_table(elements, is_anonymous=header is None)
+
+    lines = common.lines(elements)
+
+    if commentspace.comment_space in selected:
+        lines = (commentspace._spaced_line(line) for line in lines)
+
+    if header is not None and tableindent.table_entries_should_be_uniformly_indented in selected:
+        lines = (indented_line for entry in tableindent._entries(lines)
+                 for indented_line in common.lines(tableindent._indented_entry(entry, len(header.names))))
+
+    if tableassignment.table_assignment_spacing in selected:
+        lines = (tableassignment._spaced_line(line) for line in lines)
+
+    lines = (common.Line(line) for line in lines)
+
+    if is_anonymous and deindentanonymoustable.deindent_anonymous_table in selected:
+        lines = (deindentanonymoustable._unindented_line(line) for line in lines)
+
+    if linelength.line_length_limiter in selected:
+        lines = (linelength._fixed_line(line) for line in lines)
+
+    if tableentrysort.sort_table_entries in selected:
+        return TableElement(tableentrysort._sorted_elements(common.flattened(lines)))
+
+    return TableElement(common.flattened(lines))
@@ -1,12 +1,10 @@
-import operator
 from prettytoml import tokens
 from prettytoml.prettifier import common
-from prettytoml.elements import traversal as t, factory as element_factory
+from prettytoml.elements import factory as element_factory
 from prettytoml.elements.array import ArrayElement
 from prettytoml.elements.atomic import AtomicElement
 from prettytoml.elements.inlinetable import InlineTableElement
 from prettytoml.elements.table import TableElement
-from functools import *
 
 
 MAXIMUM_LINE_LENGTH = 120
@@ -25,9 +23,17 @@ def _fixed_table(table_element):
     Returns a new TableElement.
     """
     assert isinstance(table_element, TableElement)
-    lines = tuple(common.lines(table_element.sub_elements))
-    fixed_lines = tuple(_fixed_line(l) if _line_length(l) > MAXIMUM_LINE_LENGTH else l for l in lines)
-    return TableElement(sub_elements=tuple(reduce(operator.concat, fixed_lines)))
+    lines = common.table_lines(table_element.sub_elements)
+    return TableElement(sub_elements=common.flattened(_fixed_line(line) for line in lines))
+
+
+def _fixed_line(line):
+    """
+    Fixes the given Line if it is too long and returns it.
+    """
+    if _line_length(line.elements) > MAXIMUM_LINE_LENGTH:
+        _fix_line(line)
+    return line
 
 
 def _line_length(line_elements):
@@ -37,12 +43,7 @@ def _line_length(line_elements):
     return sum(len(e.serialized()) for e in line_elements)
 
 
-def _fixed_line(line_elements):
-
-    def line_value_index():
-        # Returns index of value element in the line
-        key_index = t.find_following(line_elements, t.predicates.non_metadata)
-        return t.find_following(line_elements, t.predicates.non_metadata, key_index)
+def _fix_line(line):
 
     def multiline_equivalent(element):
         if isinstance(element, AtomicElement) and tokens.is_string(element.first_token):
@@ -53,10 +54,5 @@ def _fixed_line(line_elements):
         else:
             return element
 
-    line_elements = tuple(line_elements)
-    value_index = line_value_index()
-    if value_index >= 0:
-        return line_elements[:value_index] + (multiline_equivalent(line_elements[value_index]),) + \
-            line_elements[value_index+1:]
-    else:
-        return line_elements
+    if line.value is not None:
+        line.replace(line.value, multiline_equivalent(line.value))
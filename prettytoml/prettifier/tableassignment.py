@@ -1,5 +1,6 @@
 
 from prettytoml.elements import traversal as t, factory as element_factory
+from prettytoml.prettifier import common
 
 
 def table_assignment_spacing(toml_file_elements):
@@ -14,27 +15,23 @@ def table_assignment_spacing(toml_file_elements):
 
 
 def _do_table(table_element):
-
     elements = table_element.sub_elements
+    elements[:] = [e for line in common.lines(elements) for e in _spaced_line(line)]
 
-    # Our iterator index
-    i = float('-inf')
-
-    def next_key():
-        return t.find_following(elements, t.predicates.non_metadata, i)
-
-    def next_assignment():
-        return t.find_following(elements, t.predicates.op_assignment, next_key())
-
-    def next_value():
-        return t.find_following(elements, t.predicates.non_metadata, next_assignment())
-
-    while next_key() >= 0:
 
-        del elements[next_key()+1:next_assignment()]
-        del elements[next_assignment()+1:next_value()]
-
-        elements.insert(next_assignment(), element_factory.create_whitespace_element(1))
-        elements.insert(next_value(), element_factory.create_whitespace_element(1))
-
-        i = t.find_following(elements, t.predicates.newline, i)
+def _spaced_line(line_elements):
+    """
+    Returns the elements of the given line with the key and value of its entry, if any, separated by the triplet.
+    """
+    key_i = t.find_following(line_elements, t.predicates.non_metadata)
+    if key_i < 0:
+        return line_elements
+
+    assignment_i = t.find_following(line_elements, t.predicates.op_assignment, key_i)
+    value_i = t.find_following(line_elements, t.predicates.non_metadata, assignment_i)
+
+    return line_elements[:key_i+1] + (
+        element_factory.create_whitespace_element(1),
+        line_elements[assignment_i],
+        element_factory.create_whitespace_element(1),
+    ) + line_elements[value_i:]
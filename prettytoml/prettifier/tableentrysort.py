@@ -1,9 +1,7 @@
-import operator
 from prettytoml import tokens
 from prettytoml.elements.common import TokenElement
 from prettytoml.elements.table import TableElement
 from prettytoml.prettifier import common
-from functools import *
 
 
 def sort_table_entries(toml_file_elements):
@@ -13,11 +11,11 @@ def sort_table_entries(toml_file_elements):
     return [_sorted_table(element) if isinstance(element, TableElement) else element for element in toml_file_elements]
 
 
-def _line_key(line_elements):
+def _line_key(line):
     """
-    Given a sequence of elements comprising a single line, returns an orderable value to use in ordering lines.
+    Given a Line, returns an orderable value to use in ordering lines.
     """
-    for e in line_elements:
+    for e in line.content:
         if isinstance(e, TokenElement) and tokens.is_string(e.first_token):
             return e.primitive_value
     return 'z' * 10     # Metadata lines should be at the end
@@ -28,11 +26,19 @@ def _sorted_table(table):
     Returns another TableElement where the table entries are sorted lexicographically by key.
     """
     assert isinstance(table, TableElement)
+    return TableElement(_sorted_elements(table.sub_elements))
 
+
+def _sorted_elements(table_elements):
+    """
+    Returns the given table elements with their lines sorted by key, except for the empty lines ending the table
+    which stay at its end. Any empty lines sorted to the end merge into those.
+    """
     # Discarding TokenElements with no tokens in them
-    table_elements = common.non_empty_elements(table.sub_elements)
-    lines = tuple(common.lines(table_elements))
-    sorted_lines = sorted(lines, key=_line_key)
-    sorted_elements = reduce(operator.concat, sorted_lines)
+    table_elements = list(common.non_empty_elements(table_elements))
+    end = common.empty_lines_start(table_elements)
 
-    return TableElement(sorted_elements)
+    sorted_elements = common.flattened(sorted(common.table_lines(table_elements[:end]), key=_line_key))
+    if end < len(table_elements):
+        sorted_elements = sorted_elements[:common.empty_lines_start(sorted_elements)]
+    return sorted_elements + table_elements[end:]
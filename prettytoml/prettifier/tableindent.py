@@ -1,6 +1,7 @@
 from prettytoml import tokens
 from prettytoml.elements import traversal as t, factory as element_factory
 from prettytoml.tokens import py2toml
+from prettytoml.prettifier import common
 
 
 def table_entries_should_be_uniformly_indented(toml_file_elements):
@@ -25,25 +26,40 @@ def _do_table_header(table_header):
 
 
 def _do_table(table_element, table_level):
-
     elements = table_element.sub_elements
+    elements[:] = [e for entry in _entries(common.lines(elements)) for e in _indented_entry(entry, table_level)]
 
-    # Iterator index
-    i = float('-inf')
-
-    def first_indent():
-        return t.find_following(elements, t.predicates.whitespace, i)
 
-    def next_non_metadata():
-        return t.find_following(elements, t.predicates.non_metadata, i)
+def _entries(lines):
+    """
+    Groups a sequence of lines into sequences of elements made of an entry line preceded by the lines with no
+    entry since the previous one, and the lines following the last entry.
+    """
+    pending = []
+    for line in lines:
+        pending += line
+        if t.find_following(line, t.predicates.non_metadata) >= 0:
+            yield tuple(pending)
+            pending = []
+    if pending:
+        yield tuple(pending)
 
-    def next_newline():
-        return t.find_following(elements, t.predicates.newline, next_non_metadata())
 
-    while next_non_metadata() >= 0:
-        if first_indent() >= 0:
-            del elements[first_indent():next_non_metadata()]
+def _indented_entry(entry_elements, table_level):
+    """
+    Returns the given entry elements (see _entries()) with everything from the first whitespace up to the entry
+    replaced by the indentation of the given table level, except for the comments on lines of their own which are
+    kept with the same indentation.
+    """
+    entry_i = t.find_following(entry_elements, t.predicates.non_metadata)
+    if entry_i < 0:
+        return entry_elements
 
-        elements.insert(next_non_metadata(), element_factory.create_whitespace_element((table_level-1)*2))
+    first_indent_i = t.find_following(entry_elements, t.predicates.whitespace)
+    indent_i = first_indent_i if 0 <= first_indent_i < entry_i else entry_i
 
-        i = next_newline()
+    indented = entry_elements[:indent_i]
+    for element in entry_elements[indent_i:entry_i]:
+        if t.predicates.comment(element):
+            indented += (element_factory.create_whitespace_element((table_level-1)*2), element)
+    return indented + (element_factory.create_whitespace_element((table_level-1)*2),) + entry_elements[entry_i:]
@@ -2,6 +2,7 @@
 from prettytoml.elements import traversal as t, factory as element_factory
 from prettytoml.elements.metadata import WhitespaceElement, NewlineElement
 from prettytoml.elements.table import TableElement
+from prettytoml.prettifier import common
 
 
 def table_separation(toml_file_elements):
@@ -9,23 +10,29 @@ def table_separation(toml_file_elements):
     Rule: Tables should always be separated by an empty line.
     """
     elements = toml_file_elements[:]
-    for element in elements:
+    for i, element in enumerate(elements):
         if isinstance(element, TableElement):
-            _do_table(element.sub_elements)
+            _do_table(element.sub_elements, is_anonymous=not (i > 0 and t.predicates.table_header(elements[i-1])))
     return elements
 
 
-def _do_table(table_elements):
+def _do_table(table_elements, is_anonymous=False):
+    """
+    Makes the given table elements end with exactly one empty line, following the last line with an entry or a
+    comment if any.
 
+    An empty anonymous table is left empty, as no table precedes it.
+    """
     while table_elements and isinstance(table_elements[-1], WhitespaceElement):
         del table_elements[-1]
+    del table_elements[common.empty_lines_start(table_elements):]
 
     if not table_elements:
+        if not is_anonymous:
+            table_elements.append(element_factory.create_newline_element())
         return
 
-    if isinstance(table_elements[-1], NewlineElement):
-        last_non_metadata_i = t.find_previous(table_elements, t.predicates.non_metadata)
-        del table_elements[last_non_metadata_i+1:]
-
-    table_elements.append(element_factory.create_newline_element())
+    # A comment ends with its own newline
+    if not table_elements[-1].serialized().endswith('\n'):
+        table_elements.append(element_factory.create_newline_element())
     table_elements.append(element_factory.create_newline_element())
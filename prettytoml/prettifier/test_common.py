@@ -0,0 +1,29 @@
+from prettytoml.prettifier import common
+
+
+def test_table_lines():
+    source = '  key = "value"  # comment\n\n\tk = [1, 2]\nlast = 1\n'
+    table = common.text_to_elements(source)[0]
+
+    # Lines end with newline elements, or with a comment element following an entry
+    lines = common.table_lines(table.sub_elements)
+    assert len(lines) == 4
+    assert common.elements_to_text(common.flattened(lines)) == source
+
+    assert lines[0].key.value == 'key' and lines[0].value.value == 'value'
+    assert lines[0].comment.serialized() == '# comment\n'
+    assert lines[0].terminator is None
+    assert lines[1].terminator.serialized() == '\n' and lines[1].key is None
+
+    lines[2].indent = []
+    lines[2].replace(lines[2].value, lines[3].value)
+    assert common.elements_to_text(common.flattened(lines[2:])) == 'k = 1\nlast = 1\n'
+
+    # A comment on a line of its own belongs to the next line
+    lines = common.table_lines(common.text_to_elements('# about a\na = 1\n')[0].sub_elements)
+    assert len(lines) == 1 and lines[0].key.value == 'a'
+
+    # Trailing elements not terminated by a newline make up a line of their own
+    unterminated = common.table_lines(table.sub_elements[:-1])
+    assert unterminated[-1].terminator is None
+    assert common.elements_to_text(unterminated[-1].elements) == 'last = 1'
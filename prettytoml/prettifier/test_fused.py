@@ -0,0 +1,28 @@
+from prettytoml.prettifier import prettify, ALL, ENGINE_SEQUENTIAL, ENGINE_FUSED, fused
+from prettytoml.prettifier.common import text_to_elements, elements_to_text
+
+
+def test_fused_engine_produces_the_same_as_the_sequential_one():
+
+    long_line_text = """key = "value"   #comment
+[section.sub]
+  emails = ["adnan@incubaid.com", "fatayera@incubaid.com", "adnan.fatayerji@incubaid.com", "adnan@greenitglobe.com"]
+   b="a string long enough to be broken over multiple lines once it has been moved to a table with an indentation"
+
+# trailing comment
+"""
+
+    sources = [open(path).read() for path in ('sample.toml', 'dateless_sample.toml')] + [long_line_text]
+    selections = [ALL, ALL[:3], ALL[1::2]] + [(prettifier,) for prettifier in ALL]
+
+    for toml_text in sources:
+        for prettifiers in selections:
+            sequential = elements_to_text(prettify(text_to_elements(toml_text), prettifiers, ENGINE_SEQUENTIAL))
+            assert elements_to_text(prettify(text_to_elements(toml_text), prettifiers, ENGINE_FUSED)) == sequential
+
+
+def test_fusing_only_prettifiers_in_order():
+    assert fused.compile_prettifiers(ALL)
+    assert fused.compile_prettifiers(ALL[2:5])
+    assert fused.compile_prettifiers(tuple(reversed(ALL))) is None
+    assert fused.compile_prettifiers(ALL + (lambda elements: elements,)) is None
@@ -32,3 +32,38 @@ creativity = "on vacation"
 """
 
     assert_prettifier_works(toml_text, expected_toml_text, table_separation)
+
+
+def test_separating_tables_with_no_entries():
+
+    toml_text = """[section]
+
+  # Nothing but a comment
+
+
+
+[empty]
+
+
+
+
+[nothing]
+[last]
+k = 1
+"""
+
+    expected_toml_text = """[section]
+
+  # Nothing but a comment
+
+[empty]
+
+[nothing]
+
+[last]
+k = 1
+
+"""
+
+    assert_prettifier_works(toml_text, expected_toml_text, table_separation)
+    assert_prettifier_works(expected_toml_text, expected_toml_text, table_separation)
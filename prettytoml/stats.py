@@ -0,0 +1,101 @@
+"""
+    Instrumenting the stages of prettifying TOML text.
+
+    prettytoml.prettify(), parser.parse_tokens() and prettifier.prettify() accept a stats callable, called as
+    stats(stage, seconds, counters) after every stage they go through with the name of the stage, its wall time and a
+    dict of counters named after what they count. A Stats instance collects them, but any callable will do, e.g. one
+    sending them to a metrics system. Nothing is measured when no stats callable is given.
+
+    The stages and their counters are:
+
+        tokenize                'tokens'
+        parse                   'elements', counting all the elements of the tree
+        sanitize                'elements' and 'inserted', counting the top-level elements
+        prettifier.fused        'elements' and 'elements_touched', for all the rules applied in a single walk by
+                                the default ENGINE_FUSED
+        prettifier.RULE         'elements' and 'elements_touched', for every rule applied one after the other by
+                                ENGINE_SEQUENTIAL instead
+        serialize               'characters'
+        cache                   'hits'
+
+    An element is touched when it is created or when its tokens or sub-elements are mutated in place.
+"""
+
+import collections
+import timeit
+
+from prettytoml.elements.common import ContainerElement, TokenElement
+
+# The clock every stage is timed with
+clock = timeit.default_timer
+
+
+class Stats(object):
+    """
+    A stats callable collecting the (stage, seconds, counters) of every stage it is called with, across any number
+    of prettified files.
+    """
+
+    def __init__(self):
+        self.stages = []
+
+    def __call__(self, stage, seconds, counters):
+        self.stages.append((stage, seconds, counters))
+
+    def totals(self):
+        """
+        Returns an OrderedDict mapping every stage name, in the order first reported, to a dict of the 'calls' to the
+        stage, the total 'seconds' spent in it and the totals of its counters.
+        """
+        totals = collections.OrderedDict()
+        for stage, seconds, counters in self.stages:
+            total = totals.setdefault(stage, {'calls': 0, 'seconds': 0.0})
+            total['calls'] += 1
+            total['seconds'] += seconds
+            for name, count in counters.items():
+                total[name] = total.get(name, 0) + count
+        return totals
+
+
+def element_count(elements):
+    """
+    Returns the number of elements in the trees of the given elements.
+    """
+    count = 0
+    pending = list(elements)
+    while pending:
+        element = pending.pop()
+        count += 1
+        if isinstance(element, ContainerElement):
+            pending.extend(element.sub_elements)
+    return count
+
+
+def change_counts(elements):
+    """
+    Returns a dict mapping the id of every element in the trees of the given elements to (the element, the number of
+    changes made to its tokens or sub-elements so far).
+    """
+    counts = {}
+    pending = list(elements)
+    while pending:
+        element = pending.pop()
+        if isinstance(element, ContainerElement):
+            counts[id(element)] = element, element.sub_elements.changes
+            pending.extend(element.sub_elements)
+        elif isinstance(element, TokenElement):
+            counts[id(element)] = element, element.tokens.changes
+    return counts
+
+
+def touched_count(previous_change_counts, elements):
+    """
+    Returns the number of elements in the trees of the given elements that were created or changed since the given
+    change_counts() were taken.
+    """
+    touched = 0
+    for key, (element, changes) in change_counts(elements).items():
+        previous = previous_change_counts.get(key)
+        if previous is None or previous[0] is not element or previous[1] != changes:
+            touched += 1
+    return touched
@@ -0,0 +1,68 @@
+import os
+import shutil
+import tempfile
+
+import six
+
+import prettytoml
+from prettytoml.__main__ import main
+
+
+def _pretty_sample():
+    return prettytoml.prettify(open('sample.toml').read())
+
+
+def _make_files(directory):
+    paths = []
+    for i, content in enumerate([open('sample.toml').read(), '[[broken]\n', _pretty_sample()] * 3):
+        path = os.path.join(directory, '{}.toml'.format(i))
+        with open(path, 'w') as fp:
+            fp.write(content)
+        paths.append(path)
+    return paths
+
+
+def test_prettify_many():
+    directory = tempfile.mkdtemp()
+    try:
+        paths = _make_files(directory)
+        expected = prettytoml.prettify(open('sample.toml').read())
+        pretty = _pretty_sample()
+
+        for workers in (1, 3):
+            reports = list(prettytoml.prettify_many(paths, workers=workers))
+
+            assert [r.path for r in reports] == paths
+            assert [r.ok for r in reports] == [True, False, True] * 3
+            assert [r.prettified for r in reports if r.ok] == [expected, pretty] * 3
+            assert [r.changed for r in reports if r.ok] == [True, False] * 3
+            assert not any(r.written for r in reports)
+
+        reports = list(prettytoml.prettify_many(paths, workers=2, ordered=False, write=True))
+        assert sorted(r.path for r in reports) == sorted(paths)
+        assert sorted(r.path for r in reports if r.written) == paths[0::3]
+        assert all(open(path).read() == expected for path in paths[0::3])
+        assert not any(r.written for r in prettytoml.prettify_many(paths[2::3], workers=2, write=True))
+    finally:
+        shutil.rmtree(directory)
+
+
+def test_command_line():
+    directory = tempfile.mkdtemp()
+    try:
+        paths = _make_files(directory)
+        out, err = six.StringIO(), six.StringIO()
+
+        assert main(['--check', '-j', '2'] + paths, out, err) == 1
+        assert out.getvalue().split() == paths[0::3]
+        assert len(err.getvalue().splitlines()) == 3
+
+        assert main(['-i', '-j', '2'] + paths[2::3], six.StringIO(), six.StringIO()) == 0
+        assert main(['--check'] + paths[2::3], six.StringIO(), six.StringIO()) == 0
+        assert main(['--check', '-j', '1'] + paths[0::3], six.StringIO(), six.StringIO()) == 1
+    finally:
+        shutil.rmtree(directory)
+
+
+def test_checking_a_pretty_file():
+    assert main(['--check', 'sample-prettified.toml'], six.StringIO(), six.StringIO()) == 0
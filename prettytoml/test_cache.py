@@ -0,0 +1,89 @@
+import os
+import shutil
+import tempfile
+
+import prettytoml
+from prettytoml.cache import PrettifyCache
+from prettytoml.prettifier import ALL
+
+
+def test_prettify_cache_tiers():
+    directory = tempfile.mkdtemp()
+    try:
+        source = open('sample.toml').read()
+        cache = PrettifyCache(os.path.join(directory, 'cache'))
+
+        expected = prettytoml.prettify(source)
+        assert prettytoml.prettify(source, cache) == expected
+        assert (cache.hits, cache.misses) == (0, 1)
+        assert prettytoml.prettify(source, cache) == expected
+        assert (cache.hits, cache.misses) == (1, 1)
+
+        # A fresh process only has the disk tier
+        other_cache = PrettifyCache(cache.directory)
+        assert other_cache.get(PrettifyCache.key(source, ALL)) == expected
+        assert other_cache.get(PrettifyCache.key(source, ALL[:1])) is None
+        assert (other_cache.hits, other_cache.misses) == (1, 1)
+    finally:
+        shutil.rmtree(directory)
+
+
+def test_prettify_cache_eviction():
+    directory = tempfile.mkdtemp()
+    try:
+        cache = PrettifyCache(directory, max_memory_entries=2, max_disk_size=1000)
+        for i in range(10):
+            cache.put(str(i), 'x' * 200)
+
+        assert len(os.listdir(directory)) <= 5
+        assert cache.evictions >= 8 + 5
+        assert cache.get('9') == 'x' * 200
+        assert cache.get('0') is None
+
+        memory_only_cache = PrettifyCache(max_memory_entries=2)
+        for key in ('a', 'b', 'a', 'c'):
+            memory_only_cache.put(key, key)
+        assert [memory_only_cache.get(key) for key in ('a', 'b', 'c')] == ['a', None, 'c']
+    finally:
+        shutil.rmtree(directory)
+
+
+def test_prettify_many_with_a_cache():
+    directory = tempfile.mkdtemp()
+    try:
+        paths = []
+        for i in range(4):
+            paths.append(os.path.join(directory, '{}.toml'.format(i)))
+            with open(paths[-1], 'w') as fp:
+                fp.write(open('sample.toml').read())
+        cache_directory = os.path.join(directory, 'cache')
+
+        first = list(prettytoml.prettify_many(paths, workers=1, cache_directory=cache_directory))
+        second = list(prettytoml.prettify_many(paths, workers=2, cache_directory=cache_directory))
+
+        assert [r.cached for r in first] == [False, True, True, True]
+        assert all(r.cached for r in second)
+        assert [r.prettified for r in second] == [r.prettified for r in first]
+    finally:
+        shutil.rmtree(directory)
+
+
+def test_prettify_cache_rewrites():
+    directory = tempfile.mkdtemp()
+    try:
+        cache = PrettifyCache(directory, max_memory_entries=2, max_disk_size=1000)
+        for i in range(10):
+            cache.put('same', u'x' * 200)
+            cache.put('other', u'y' * 200)
+
+        # Overwriting an entry counts its size once
+        assert cache._measured_disk_size() == 400
+        assert cache.evictions == 0
+        assert sorted(os.listdir(directory)) == ['other', 'same']
+        assert PrettifyCache(directory).get('same') == u'x' * 200
+
+        # A failed write leaves no temporary file behind
+        cache.put(os.path.join('missing', 'key'), u'z')
+        assert sorted(os.listdir(directory)) == ['other', 'same']
+    finally:
+        shutil.rmtree(directory)
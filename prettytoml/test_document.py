@@ -0,0 +1,170 @@
+import pytest
+from prettytoml import lexer
+from prettytoml.document import Document, parse_document
+from prettytoml.elements.tableheader import TableHeaderElement
+from prettytoml.errors import TOMLError
+
+toml_text = """title = "document"
+
+[servers]
+[servers.alpha]
+ip = "10.0.0.1"
+
+[servers.beta]
+ip = "10.0.0.2"
+
+[[fruit]]
+name = "apple"
+
+[fruit.physical]
+color = "red"
+
+[[fruit]]
+name = "banana"
+
+[[fruit.variety]]
+name = "plantain"
+"""
+
+
+def header(text):
+    return TableHeaderElement(tuple(lexer.tokenize(text)))
+
+
+def assert_indexed_like_reparsed(document):
+    reparsed = parse_document(document.serialized())
+    for path in ((),) + reparsed.subtable_paths(()):
+        assert document.positions(path) == reparsed.positions(path)
+    assert document.subtable_paths(()) == reparsed.subtable_paths(())
+
+
+def test_looking_up_tables():
+    document = parse_document(toml_text)
+
+    assert document.table(())['title'] == 'document'
+    assert document.table(('servers', 'alpha'))['ip'] == '10.0.0.1'
+    assert document.header(('servers', 'beta')).names == ('servers', 'beta')
+    assert document.table(('fruit', 0, 'physical'))['color'] == 'red'
+    assert document.table(('fruit', 1, 'variety', 0))['name'] == 'plantain'
+    assert document.array_length(('fruit',)) == 2
+    assert ('servers', 'gamma') not in document
+
+    with pytest.raises(KeyError):
+        document.table(('fruit', 2))
+
+    assert document.subtable_paths(('servers',)) == (('servers', 'alpha'), ('servers', 'beta'))
+    assert document.subtable_paths(('fruit', 1)) == (('fruit', 1, 'variety', 0),)
+
+
+def test_inserting_and_removing_tables():
+    document = parse_document(toml_text)
+
+    document.insert_table(document.positions(('servers', 'beta'))[0], header('[servers.gamma]\n'))
+    document.table(('servers', 'gamma'))['ip'] = '10.0.0.3'
+    document.append_table(header('[[fruit]]\n'))
+    document.append_table(header('[fruit.physical]\n'))
+    document.remove_table(('servers', 'alpha'))
+
+    assert document._index is not None     # Maintained rather than rebuilt
+    assert document.subtable_paths(('servers',)) == (('servers', 'gamma'), ('servers', 'beta'))
+    assert document.positions(('fruit', 2, 'physical')) == (len(document.elements)-2, len(document.elements)-1)
+    assert_indexed_like_reparsed(document)
+
+    document.insert_table(document.positions(('fruit', 1))[0], header('[[fruit]]\n'))
+    document.remove_table(('fruit', 0))
+    assert_indexed_like_reparsed(document)
+
+    del document.elements[-2:]
+    assert ('fruit', 2, 'physical') not in document
+    assert_indexed_like_reparsed(document)
+
+
+def test_many_tables():
+    document = Document(())
+    for i in range(1000):
+        document.append_table(header('[[servers]]\n'))
+        document.append_table(header('[servers.config]\n'))
+    assert document.array_length(('servers',)) == 1000
+    assert document.positions(('servers', 999, 'config')) == (3998, 3999)
+
+
+def test_primitive_value():
+    import pytoml
+
+    sample = open('sample.toml').read()
+    assert parse_document(sample).primitive_value == pytoml.loads(sample)
+
+    document = parse_document(toml_text)
+    value = document.primitive_value
+    assert value == {
+        'title': 'document',
+        'servers': {'alpha': {'ip': '10.0.0.1'}, 'beta': {'ip': '10.0.0.2'}},
+        'fruit': [
+            {'name': 'apple', 'physical': {'color': 'red'}},
+            {'name': 'banana', 'variety': [{'name': 'plantain'}]},
+        ],
+    }
+    assert document.primitive_value is value
+
+    document.table(('fruit', 1, 'variety', 0))['name'] = 'cavendish'
+    assert document.primitive_value['fruit'][1]['variety'][0]['name'] == 'cavendish'
+
+    document.remove_table(('servers', 'beta'))
+    assert 'beta' not in document.primitive_value['servers']
+
+
+def test_primitive_value_of_conflicting_tables():
+    from prettytoml.errors import InvalidTOMLFileError
+
+    for source in ('[[t]]\n[t]\n', '[t]\n[[t]]\n', 'a = 1\n[a]\n', '[a]\nb = 1\n[a.b]\n'):
+        with pytest.raises(InvalidTOMLFileError):
+            parse_document(source).primitive_value
+
+    # Tables extending a value are merged into a copy of it, leaving the value of its element as it was
+    document = parse_document('a = {x = 1}\n[a.b]\nc = 2\n')
+    assert document.primitive_value == {'a': {'x': 1, 'b': {'c': 2}}}
+    assert document.elements[0].primitive_value == {'a': {'x': 1}}
+
+
+
+def test_editing_as_text():
+    document = parse_document(toml_text)
+    elements = list(document.elements)
+
+    def edit(offset, removed_length, inserted_text):
+        text = document.serialized()
+        document.edit(offset, removed_length, inserted_text)
+        edited_text = text[:offset] + inserted_text + text[offset+removed_length:]
+        reparsed = parse_document(edited_text)
+        assert document.serialized() == reparsed.serialized()
+        assert [e.serialized() for e in document.elements] == [e.serialized() for e in reparsed.elements]
+        assert document.primitive_value == reparsed.primitive_value
+        assert_indexed_like_reparsed(document)
+
+    def replace(old, new):
+        edit(document.serialized().index(old), len(old), new)
+
+    # Only the edited table is parsed again
+    replace('10.0.0.2', '10.0.0.3')
+    assert document.primitive_value['servers']['beta'] == {'ip': '10.0.0.3'}
+    assert [e is old for e, old in zip(document.elements, elements)] == [True] * 5 + [False] * 2 + [True] * 8
+
+    # Losing its header, a table is parsed again along with the preceding one
+    replace('[servers.beta]\nip', 'port')
+    assert document.primitive_value['servers'] == {'alpha': {'ip': '10.0.0.1', 'port': '10.0.0.3'}}
+
+    replace('name = "banana"\n', '[fruit.physical]\ncolor = "yellow"\n')
+    replace('"apple"', '"""apple\n[not.a.table]\n"""')
+    edit(len(document.serialized()), 0, '[new]\nkey = 1')
+    edit(0, 0, 'key = 0\n')
+
+    # The text to edit follows the changes made to the tables
+    document.table(('servers', 'alpha'))['ip'] = '10.0.0.9'
+    replace('10.0.0.9', '10.0.0.8')
+    assert document.primitive_value['servers']['alpha']['ip'] == '10.0.0.8'
+
+    for invalid in ('= 1\n', '[servers'):
+        text = document.serialized()
+        with pytest.raises(TOMLError):
+            document.edit(0, 0, invalid)
+        assert document.serialized() == text
@@ -0,0 +1,47 @@
+import pytest
+import six
+
+import prettytoml
+from prettytoml.document import parse_document
+from prettytoml.errors import DuplicateKeysError
+from prettytoml.parser.errors import ParsingError
+
+
+def test_loads_like_the_parsed_document():
+    for path in ('sample.toml', 'dateless_sample.toml', 'sample-prettified.toml'):
+        source = open(path).read()
+        assert prettytoml.loads(source) == parse_document(source).primitive_value
+        assert prettytoml.load(six.StringIO(source)) == prettytoml.loads(source)
+
+    source = """
+[a.b]
+c = 1
+[a]
+d = [ 1,
+  2, # Two
+]
+[[e]]
+[[e]]
+f = { g = "h", i = [ [], [1] ] }
+[e.j]
+"""
+    assert prettytoml.loads(source) == parse_document(source).primitive_value == {
+        'a': {'b': {'c': 1}, 'd': [1, 2]},
+        'e': [{}, {'f': {'g': 'h', 'i': [[], [1]]}, 'j': {}}],
+    }
+
+
+def test_loads_errors():
+    with pytest.raises(ParsingError) as info:
+        prettytoml.loads('a = 1\nb = [1, "two"]\n')
+    assert str(info.value) == 'Array should be homogeneous at row 2 and col 5'
+
+    with pytest.raises(ParsingError) as info:
+        prettytoml.loads('[a]\nb = { c = 1 d = 2 }\n')
+    assert str(info.value) == 'Expected , or } at row 2 and col 13'
+
+    with pytest.raises(ParsingError):
+        prettytoml.loads('a = 1\n[a.b]\n')
+
+    with pytest.raises(DuplicateKeysError):
+        prettytoml.loads('a = 1\n  a = 2\n')
@@ -10,3 +10,13 @@ def test_prettifying_against_humanly_verified_sample():
 
     assert_prettifier_works(toml_source, expected, prettify)
     assert pytoml.loads(toml_source) == pytoml.loads(expected)
+
+
+def test_prettifying_table_by_table():
+    from .prettifier import iter_prettified
+    from .prettifier.common import text_to_elements, elements_to_text
+
+    for path in ('sample.toml', 'dateless_sample.toml'):
+        toml_source = open(path).read()
+        expected = elements_to_text(prettify(text_to_elements(toml_source)))
+        assert elements_to_text(iter_prettified(iter(text_to_elements(toml_source)))) == expected
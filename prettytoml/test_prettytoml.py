@@ -0,0 +1,54 @@
+import six
+
+import prettytoml
+from prettytoml.elements.table import TableElement
+from prettytoml.lexer import tokenize
+from prettytoml.parser import parse_tokens
+
+
+def test_iterparse():
+    source = open('sample.toml').read()
+    file_obj = six.StringIO(source)
+
+    parsed = prettytoml.iterparse(file_obj, chunk_size=16)
+
+    first = next(parsed)
+    assert isinstance(first, TableElement) and first['title'] == 'TOML Example'
+    assert file_obj.tell() < len(source)
+
+    expected = parse_tokens(tokenize(source, is_top_level=True))
+    assert [e.serialized() for e in [first] + list(parsed)] == [e.serialized() for e in expected]
+
+
+def test_prettify_stream():
+    for path in ('sample.toml', 'dateless_sample.toml'):
+        source = open(path).read()
+        out_file_obj = six.StringIO()
+
+        prettytoml.prettify_stream(six.StringIO(source), out_file_obj, chunk_size=64)
+
+        assert out_file_obj.getvalue() == prettytoml.prettify(source)
+
+
+def test_prettify_to():
+    for path in ('sample.toml', 'dateless_sample.toml'):
+        source = open(path).read()
+        expected = prettytoml.prettify(source)
+
+        for text_or_file_obj in (source, six.StringIO(source)):
+            out_file_obj = six.StringIO()
+            prettytoml.prettify_to(text_or_file_obj, out_file_obj)
+            assert out_file_obj.getvalue() == expected
+
+
+def test_serializing_to_a_writer():
+    elements = parse_tokens(tokenize(open('sample.toml').read(), is_top_level=True))
+
+    pieces = []
+    elements[1].serialize_to(pieces.append)
+    assert len(pieces) > 1 and ''.join(pieces) == elements[1].serialized()
+
+    # Serializing again writes the cached text at once
+    pieces = []
+    elements[1].serialize_to(pieces.append)
+    assert pieces == [elements[1].serialized()]
@@ -0,0 +1,48 @@
+import prettytoml
+from prettytoml.cache import PrettifyCache
+from prettytoml.lexer import tokenize
+from prettytoml.parser import parse_tokens
+from prettytoml.prettifier import prettify as element_prettify, ALL, ENGINE_SEQUENTIAL
+from prettytoml.stats import Stats
+
+
+def test_prettify_stats():
+    source = open('sample.toml').read()
+    stats = Stats()
+
+    assert prettytoml.prettify(source, stats=stats) == prettytoml.prettify(source)
+
+    assert [stage for stage, _, _ in stats.stages] == ['tokenize', 'parse', 'sanitize', 'prettifier.fused', 'serialize']
+    assert all(seconds >= 0 for _, seconds, _ in stats.stages)
+
+    counters = dict((stage, counters) for stage, _, counters in stats.stages)
+    assert counters['tokenize']['tokens'] == len(list(tokenize(source, is_top_level=True)))
+    assert counters['sanitize'] == {'elements': 25, 'inserted': 0}
+    assert counters['prettifier.fused']['elements'] == 25
+    assert counters['serialize']['characters'] == len(prettytoml.prettify(source))
+
+    # The sequential engine reports every rule on its own
+    sequential_stats = Stats()
+    assert prettytoml.prettify(source, stats=sequential_stats, engine=ENGINE_SEQUENTIAL) == prettytoml.prettify(source)
+    assert [stage for stage, _, _ in sequential_stats.stages] == ['tokenize', 'parse', 'sanitize'] + \
+        ['prettifier.' + rule.__name__ for rule in ALL] + ['serialize']
+    counters = dict((stage, counters) for stage, _, counters in sequential_stats.stages)
+    assert counters['prettifier.deindent_anonymous_table']['elements_touched'] == 1
+
+    cache = PrettifyCache()
+    prettytoml.prettify(source, cache, stats)
+    prettytoml.prettify(source, cache, stats)
+    totals = stats.totals()
+    assert totals['cache'] == {'calls': 2, 'seconds': totals['cache']['seconds'], 'hits': 1}
+    assert totals['tokenize']['calls'] == 2
+
+
+def test_stats_callback():
+    reported = []
+    elements = parse_tokens(tokenize('[a]\n[b]\nc = 1\n', is_top_level=True),
+                            stats=lambda stage, seconds, counters: reported.append((stage, counters)))
+    element_prettify(elements, stats=lambda stage, seconds, counters: reported.append((stage, counters)))
+
+    assert reported[0] == ('parse', {'elements': 11})
+    assert reported[1] == ('sanitize', {'elements': 4, 'inserted': 1})
+    assert reported[2][0] == 'prettifier.fused' and reported[2][1]['elements'] == 4
@@ -20,3 +20,13 @@ def test_chunkate_string():
 
     assert ''.join(chunks) == text
     assert all(len(chunk) <= 50 for chunk in chunks)
+
+
+def test_chunkate_string_at_newlines():
+    text = 'one two\nthree\tfour five\n\nsix'
+    assert list(chunkate_string(text, 10)) == ['one ', 'two', '\nthree\t', 'four ', 'five', '\n', '\nsix']
+
+    long_text = ('word ' * 20 + '\n') * 10000
+    chunks = list(chunkate_string(long_text, 50))
+    assert ''.join(chunks) == long_text
+    assert all(len(chunk) <= 50 for chunk in chunks)
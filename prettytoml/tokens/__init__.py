@@ -83,13 +83,16 @@ def is_string(token):
     )
 
 
-class Token:
+class Token(object):
     """
     A token/lexeme in a TOML source file.
 
     A Token instance is naturally ordered by its type.
     """
 
+    # _value holds the deserialized value once toml2py.deserialize() has been called on the token
+    __slots__ = ('_type', '_source_substring', '_col', '_row', '_value')
+
     def __init__(self, _type, source_substring, col=None, row=None):
         self._source_substring = source_substring
         self._type = _type
@@ -0,0 +1,147 @@
+"""
+A compact, columnar store of tokens lexed from a single source text.
+"""
+
+import array
+import bisect
+from prettytoml.tokens import Token
+
+
+class LineIndex:
+    """
+    Maps offsets in a source text to (row, col) positions (both 1-indexed).
+    """
+
+    def __init__(self, source):
+        newlines = array.array('I')
+        i = source.find('\n')
+        while i >= 0:
+            newlines.append(i)
+            i = source.find('\n', i+1)
+        self._newlines = newlines
+
+    def row_col(self, offset):
+        """
+        Returns the (row, col) pair of the character at the given offset.
+        """
+        row = bisect.bisect_left(self._newlines, offset)
+        line_start = self._newlines[row-1] + 1 if row else 0
+        return row + 1, offset - line_start + 1
+
+
+class TokenBuffer:
+    """
+    A sequence of tokens stored as parallel arrays of type ids and (start, end) offsets into one shared source.
+
+    The source text of a token is only materialized when accessed, and row/col positions are computed from a
+    LineIndex of the source. Indexing and iterating a TokenBuffer yields lightweight TokenView instances that
+    can be used anywhere a Token is expected. As a new view is made on every access, the values deserialized from
+    the tokens are memoized in the buffer rather than in the views.
+    """
+
+    def __init__(self, source):
+        self._source = source
+        self._types = []
+        self._type_ids = {}
+        self._type_id_column = array.array('B')
+        self._start_column = array.array('I')
+        self._end_column = array.array('I')
+        self._values = {}   # Token index -> deserialized value, see toml2py.deserialize()
+        self._line_index = None
+
+    def append(self, token_type, start, end):
+        """
+        Appends a token of the given type spanning source[start:end].
+        """
+        type_id = self._type_ids.get(token_type)
+        if type_id is None:
+            type_id = self._type_ids[token_type] = len(self._types)
+            self._types.append(token_type)
+        self._type_id_column.append(type_id)
+        self._start_column.append(start)
+        self._end_column.append(end)
+
+    @property
+    def source(self):
+        return self._source
+
+    @property
+    def line_index(self):
+        if self._line_index is None:
+            self._line_index = LineIndex(self._source)
+        return self._line_index
+
+    def type_at(self, i):
+        return self._types[self._type_id_column[i]]
+
+    def span_at(self, i):
+        """
+        Returns the (start, end) offsets of the ith token.
+        """
+        return self._start_column[i], self._end_column[i]
+
+    def text_at(self, i):
+        return self._source[self._start_column[i]:self._end_column[i]]
+
+    def byte_size(self):
+        """
+        Returns the number of bytes used by the token columns, excluding the shared source text and the memoized
+        values.
+        """
+        columns = (self._type_id_column, self._start_column, self._end_column)
+        return sum(column.itemsize * len(column) for column in columns)
+
+    def __len__(self):
+        return len(self._type_id_column)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return tuple(TokenView(self, j) for j in range(*i.indices(len(self))))
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError(i)
+        return TokenView(self, i)
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield TokenView(self, i)
+
+
+class TokenView(Token):
+    """
+    A Token backed by an entry in a TokenBuffer.
+    """
+
+    __slots__ = ('_buffer', '_index')
+
+    def __init__(self, buffer, index):
+        self._buffer = buffer
+        self._index = index
+
+    @property
+    def _value(self):
+        try:
+            return self._buffer._values[self._index]
+        except KeyError:
+            raise AttributeError('_value')
+
+    @_value.setter
+    def _value(self, value):
+        self._buffer._values[self._index] = value
+
+    @property
+    def col(self):
+        return self._buffer.line_index.row_col(self._buffer.span_at(self._index)[0])[1]
+
+    @property
+    def row(self):
+        return self._buffer.line_index.row_col(self._buffer.span_at(self._index)[0])[0]
+
+    @property
+    def type(self):
+        return self._buffer.type_at(self._index)
+
+    @property
+    def source_substring(self):
+        return self._buffer.text_at(self._index)
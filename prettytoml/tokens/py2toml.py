@@ -74,7 +74,7 @@ def create_string_token(text, bare_string_allowed=False, multiline_strings_allow
         return tokens.Token(tokens.TYPE_STRING, '""'.format(_escape_single_line_quoted_string(text)))
     elif bare_string_allowed and _bare_string_regex.match(text):
         return tokens.Token(tokens.TYPE_BARE_STRING, text)
-    elif multiline_strings_allowed and (len(tuple(c for c in text if c == '\n')) >= 2 or len(text) > 80):
+    elif multiline_strings_allowed and (text.count('\n') >= 2 or len(text) > 80):
         # If containing two or more newlines or is longer than 80 characters we'll use the multiline string format
         return _create_multiline_string_token(text)
     else:
@@ -96,29 +96,46 @@ def _create_multiline_string_token(text):
         return tokens.Token(tokens.TYPE_MULTILINE_STRING, u'"""{}"""'.format(escaped))
 
 
+# A space a line can be broken after, as a line-ending backslash also trims the whitespace following it
+_BREAKABLE_SPACE_RE = re.compile(u' (?=[^ \t\r\n])')
+
+
 def _break_long_text(text, maximum_length=75):
     """
     Breaks into lines of 75 character maximum length that are terminated by a backslash.
-    """
-
-    def next_line(remaining_text):
 
-        # Returns a line and the remaining text
-
-        if '\n' in remaining_text and remaining_text.index('\n') < maximum_length:
-            i = remaining_text.index('\n')
-            return remaining_text[:i+1], remaining_text[i+2:]
-        elif len(remaining_text) > maximum_length and ' ' in remaining_text:
-            i = remaining_text[:maximum_length].rfind(' ')
-            return remaining_text[:i+1] + '\\\n', remaining_text[i+2:]
-        else:
-            return remaining_text, ''
+    Lines are only broken after a space followed by a non-whitespace character, so the text reads back the same from
+    a multiline string, and a line with no such space is left longer. Runs in time linear to the length of the text.
+    """
 
-    remaining_text = text
     lines = []
-    while remaining_text:
-        line, remaining_text = next_line(remaining_text)
-        lines += [line]
+    newline = -1
+    i = 0
+
+    while i < len(text):
+        if newline != len(text) and newline < i:
+            newline = text.find('\n', i)
+            if newline < 0:
+                newline = len(text)
+
+        if newline - i < maximum_length:
+            lines.append(text[i:newline+1])
+            i = newline + 1
+            continue
+
+        space = text.rfind(' ', i, min(i + maximum_length, newline))
+        while space >= i and text[space+1] in u' \t\r\n':
+            space = text.rfind(' ', i, space)
+        if space < i:
+            match = _BREAKABLE_SPACE_RE.search(text, i + maximum_length, newline)
+            space = match.start() if match else -1
+
+        if space < 0:
+            lines.append(text[i:newline+1])
+            i = newline + 1
+        else:
+            lines.append(text[i:space+1] + '\\\n')
+            i = space + 1
 
     return ''.join(lines)
 
@@ -33,15 +33,15 @@ def test_long_string():
 
     assert primitive_token.source_substring[3:-3] == r"""
 Lorem ipsum dolor sit amet, consectetur adipiscing elit. Suspendisse \
-aucibus nibh id urna euismod, vitae blandit nisi blandit. Nam eu odio ex. \
-raesent iaculis sapien justo. Proin vehicula orci rhoncus risus mattis \
-ursus. Sed quis commodo diam. Morbi dictum fermentum ex. Ut augue lorem, \
-acilisis eu posuere ut, ullamcorper et quam. Donec porta neque eget erat \
-acinia, in convallis elit scelerisque. Class aptent taciti sociosqu ad \
-itora torquent per conubia nostra, per inceptos himenaeos. Praesent felis \
-etus, venenatis eu aliquam vel, fringilla in turpis. Praesent interdum \
-ulvinar enim, et mattis urna dapibus et. Sed ut egestas mauris. Etiam \
-leifend dui.\
+faucibus nibh id urna euismod, vitae blandit nisi blandit. Nam eu odio ex. \
+Praesent iaculis sapien justo. Proin vehicula orci rhoncus risus mattis \
+cursus. Sed quis commodo diam. Morbi dictum fermentum ex. Ut augue lorem, \
+facilisis eu posuere ut, ullamcorper et quam. Donec porta neque eget erat \
+lacinia, in convallis elit scelerisque. Class aptent taciti sociosqu ad \
+litora torquent per conubia nostra, per inceptos himenaeos. Praesent felis \
+metus, venenatis eu aliquam vel, fringilla in turpis. Praesent interdum \
+pulvinar enim, et mattis urna dapibus et. Sed ut egestas mauris. Etiam \
+eleifend dui.\
 """
 
 
@@ -67,3 +67,21 @@ def test_date():
 def test_none():
     t = py2toml.create_primitive_token(None)
     assert t.type == tokens.TYPE_STRING and t.source_substring == '""'
+
+
+def test_breaking_long_text_with_newlines():
+    assert py2toml._break_long_text('short line\nnext one', maximum_length=15) == 'short line\nnext one'
+    assert py2toml._break_long_text('a b c d e f', maximum_length=4) == 'a b \\\nc d \\\ne f'
+
+
+def test_long_string_round_trip():
+    from prettytoml.tokens import toml2py
+
+    for text in (
+        'Lorem ipsum dolor sit amet, consectetur adipiscing elit. ' * 4,
+        'A first line\nfollowed by a second line that goes on and on well beyond the maximum line length\n' * 3,
+        'spaces  running  into  the  line  breaks ' * 8,
+        'x' * 100 + ' ' + 'y' * 100,
+        '  leading whitespace\n\n  on every line of a text long enough to be broken into lines\n',
+    ):
+        assert toml2py.deserialize(py2toml.create_primitive_token(text)) == text
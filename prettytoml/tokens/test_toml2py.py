@@ -84,3 +84,19 @@ def test_unescaping_a_string():
             assert False, "Should have thrown an exception for: " + source
         except BadEscapeCharacter:
             pass
+
+
+def test_unescaping_in_a_single_pass():
+    t0 = tokens.Token(tokens.TYPE_STRING, u'"Caf\\u00e9 \\U0001F600 \\\\n \\"\u212a\\"\\n"')
+    assert toml2py.deserialize(t0) == u'Caf\xe9 \U0001F600 \\n "\u212a"\n'
+
+    # Escape sequences beyond the TOML ones slipping through the bad escape detection are still decoded
+    t1 = tokens.Token(tokens.TYPE_STRING, r'"\\\x41"')
+    assert toml2py.deserialize(t1) == u'\\A'
+
+
+def test_deserialized_values_are_memoized():
+    token = tokens.Token(tokens.TYPE_DATE, '1979-05-27T00:32:00+05:30')
+    value = toml2py.deserialize(token)
+    assert toml2py.deserialize(token) is value
+    assert value.utcoffset().total_seconds() == 5.5 * 3600
@@ -1,5 +1,6 @@
 import re
 import string
+import datetime
 import iso8601
 from prettytoml import tokens
 from prettytoml.tokens import TYPE_BOOLEAN, TYPE_INTEGER, TYPE_FLOAT, TYPE_DATE, \
@@ -9,49 +10,95 @@ import codecs
 import six
 from prettytoml.tokens.errors import MalformedDateError
 from .errors import BadEscapeCharacter
-import functools
-import operator
 
 
 def deserialize(token):
     """
     Deserializes the value of a single tokens.Token instance based on its type.
 
+    The value is memoized in the token, which is immutable, so deserializing the same token again is free.
+
     Raises DeserializationError when appropriate.
     """
-    
-    if token.type == TYPE_BOOLEAN:
-        return _to_boolean(token)
-    elif token.type == TYPE_INTEGER:
-        return _to_int(token)
-    elif token.type == TYPE_FLOAT:
-        return _to_float(token)
-    elif token.type == TYPE_DATE:
-        return _to_date(token)
-    elif token.type in (TYPE_STRING, TYPE_MULTILINE_STRING, TYPE_BARE_STRING,
-                        TYPE_LITERAL_STRING, TYPE_MULTILINE_LITERAL_STRING):
-        return _to_string(token)
-    else:
+    try:
+        return token._value
+    except AttributeError:
+        pass
+
+    deserializer = _deserializers.get(token.type)
+    if deserializer is None:
         raise Exception('This should never happen!')
 
+    value = deserializer(token)
+    try:
+        token._value = value
+    except AttributeError:  # A token type without room for the value
+        pass
+    return value
+
+
+_bad_escape_regexp = re.compile(r'([^\\]|^)\\[^btnfr"\\uU]')
+
+_escape_sequence_regexp = re.compile(r'\\(?:([btnfr"\\])|u([0-9a-fA-F]{4})|U([0-9a-fA-F]{8}))')
+
+_escaped_chars = {'b': '\b', 't': '\t', 'n': '\n', 'f': '\f', 'r': '\r', '"': '"', '\\': '\\'}
+
 
 def _unescape_str(text):
     """
     Unescapes a string according the TOML spec. Raises BadEscapeCharacter when appropriate.
     """
+    if '\\' not in text:
+        return text
 
     # Detect bad escape jobs
-    bad_escape_regexp = re.compile(r'([^\\]|^)\\[^btnfr"\\uU]')
-    if bad_escape_regexp.findall(text):
+    if _bad_escape_regexp.search(text):
         raise BadEscapeCharacter
 
-    # Do the unescaping
+    unescaped = _decoded_escape_sequences(text)
+    if unescaped is not None:
+        return unescaped
+
+    # Do the unescaping of whatever else the unicode-escape codec understands
     if six.PY2:
         return _unicode_escaped_string(text).decode('string-escape').decode('unicode-escape')
     else:
         return codecs.decode(_unicode_escaped_string(text), 'unicode-escape')
 
 
+def _decoded_escape_sequences(text):
+    """
+    Returns the given text with its TOML escape sequences decoded in a single pass, or None if it has a backslash
+    not starting one of them.
+    """
+    parts = []
+    position = 0
+    for match in _escape_sequence_regexp.finditer(text):
+        unescaped = text[position:match.start()]
+        if '\\' in unescaped:
+            return None
+        parts.append(unescaped)
+
+        char, short_code, long_code = match.groups()
+        if char:
+            parts.append(_escaped_chars[char])
+        else:
+            try:
+                parts.append(six.unichr(int(short_code or long_code, 16)))
+            except (ValueError, OverflowError):
+                return None
+        position = match.end()
+
+    rest = text[position:]
+    if '\\' in rest:
+        return None
+    parts.append(rest)
+    return u''.join(parts)
+
+
+_ascii_chars = string.ascii_letters + string.whitespace + string.punctuation + string.digits
+
+
 def _unicode_escaped_string(text):
     """
     Escapes all unicode characters in the given string
@@ -61,7 +108,7 @@ def _unicode_escaped_string(text):
         text = unicode(text)
 
     def is_unicode(c):
-        return c.lower() not in string.ascii_letters + string.whitespace + string.punctuation + string.digits
+        return c.lower() not in _ascii_chars
 
     def escape_unicode_char(x):
         if six.PY2:
@@ -70,13 +117,14 @@ def _unicode_escaped_string(text):
             return codecs.encode(x, 'unicode-escape')
 
     if any(is_unicode(c) for c in text):
-        homogeneous_chars = tuple(escape_unicode_char(c) if is_unicode(c) else c.encode() for c in text)
-        homogeneous_bytes = functools.reduce(operator.add, homogeneous_chars)
-        return homogeneous_bytes.decode()
+        return b''.join(escape_unicode_char(c) if is_unicode(c) else c.encode() for c in text).decode()
     else:
         return text
 
 
+_line_ending_backslash_regexp = re.compile(r'\\\n\s*', re.DOTALL)
+
+
 def _to_string(token):
     if token.type == tokens.TYPE_BARE_STRING:
         return token.source_substring
@@ -93,7 +141,8 @@ def _to_string(token):
             escaped = escaped[1:]
 
         # Remove all occurrences of a slash-newline-zero-or-more-whitespace patterns
-        escaped = re.sub(r'\\\n\s*', repl='', string=escaped, flags=re.DOTALL)
+        if '\\' in escaped:
+            escaped = _line_ending_backslash_regexp.sub('', escaped)
         return _unescape_str(escaped)
 
     elif token.type == tokens.TYPE_LITERAL_STRING:
@@ -122,10 +171,54 @@ def _to_boolean(token):
     return token.source_substring == 'true'
 
 
-_correct_date_format = re.compile(r'\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(Z|(\+|-)\d{2}:\d{2})')
+_correct_date_format = re.compile(r'(\d{4})-(\d{2})-(\d{2})T(\d{2}):(\d{2}):(\d{2})(Z|(\+|-)(\d{2}):(\d{2}))')
+
+# The time zones of the offsets found so far, by offset
+_time_zones = {}
 
 
 def _to_date(token):
-    if not _correct_date_format.match(token.source_substring):
+    """
+    Parses the RFC 3339 profile accepted by TOML straight into the same datetime iso8601.parse_date() returns.
+    """
+    text = token.source_substring
+    match = _correct_date_format.match(text)
+    if not match:
         raise MalformedDateError
-    return iso8601.parse_date(token.source_substring)
+    if match.end() != len(text):
+        return iso8601.parse_date(text)     # Raises the error of anything following the time zone
+
+    year, month, day, hour, minute, second, offset, sign, offset_hours, offset_minutes = match.groups()
+    try:
+        return datetime.datetime(int(year), int(month), int(day), int(hour), int(minute), int(second),
+                                 tzinfo=_time_zone(offset, sign, offset_hours, offset_minutes))
+    except ValueError as e:
+        raise iso8601.ParseError(e)
+
+
+def _time_zone(offset, sign, offset_hours, offset_minutes):
+    """
+    Returns the tzinfo of the given offset, equal to the one iso8601.parse_date() returns.
+    """
+    if offset == 'Z':
+        return iso8601.UTC
+    if offset not in _time_zones:
+        hours, minutes = int(offset_hours), int(offset_minutes)
+        description = '{}{:02d}:{:02d}'.format(sign, hours, minutes)
+        if sign == '-':
+            hours, minutes = -hours, -minutes
+        _time_zones[offset] = iso8601.FixedOffset(hours, minutes, description)
+    return _time_zones[offset]
+
+
+_deserializers = {
+    TYPE_BOOLEAN: _to_boolean,
+    TYPE_INTEGER: _to_int,
+    TYPE_FLOAT: _to_float,
+    TYPE_DATE: _to_date,
+    TYPE_STRING: _to_string,
+    TYPE_MULTILINE_STRING: _to_string,
+    TYPE_BARE_STRING: _to_string,
+    TYPE_LITERAL_STRING: _to_string,
+    TYPE_MULTILINE_LITERAL_STRING: _to_string,
+}
@@ -47,28 +47,25 @@ def join_with(iterable, separator):
 def chunkate_string(text, length):
     """
     Iterates over the given seq in chunks of at maximally the given length. Will never break a whole word.
+
+    A chunk ends right after the last space or tab among its first length characters, or right before the next
+    newline following its first character when that comes first. Runs in linear time for a given length.
     """
     iterator_index = 0
+    next_newline = -1
 
-    def next_newline():
-        try:
-            return next(i for (i, c) in enumerate(text) if i > iterator_index and c == '\n')
-        except StopIteration:
-            return len(text)
+    while iterator_index < len(text):
+        if next_newline <= iterator_index:
+            next_newline = text.find('\n', iterator_index+1)
+            if next_newline < 0:
+                next_newline = len(text)
 
-    def next_breaker():
-        try:
-            return next(i for (i, c) in reversed(tuple(enumerate(text)))
-                        if i >= iterator_index and
-                        (i < iterator_index+length) and
-                        c in (' ', '\t'))
-        except StopIteration:
-            return len(text)
+        window_end = iterator_index + length
+        next_breaker = max(text.rfind(' ', iterator_index, window_end), text.rfind('\t', iterator_index, window_end))
 
-    while iterator_index < len(text):
-        next_chunk = text[iterator_index:min(next_newline(), next_breaker()+1)]
-        iterator_index += len(next_chunk)
-        yield next_chunk
+        chunk_end = min(next_newline, next_breaker+1) if next_breaker >= 0 else next_newline
+        yield text[iterator_index:chunk_end]
+        iterator_index = chunk_end
 
 
 def flatten_nested(nested_dicts):